@@ -0,0 +1,157 @@
+"""End-to-end report generation against the local stub APIs.
+
+Each batch size runs in a fresh process, so peak RSS is per run, and reports
+tokens/second, p50/p99 per-token latency and peak RSS:
+
+    python -m benchmarks.pipeline --sizes 1,10,100,1000 --mode asyncio --latency 0.02 --error-rate 0.01
+
+Record the stub responses once (`--record corpus.jsonl.gz`) and later runs
+can `--replay corpus.jsonl.gz` the same sizes to time parsing and report
+assembly alone, with no server and no randomness.
+"""
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from benchmarks.stub_server import DEFAULT_FIXTURES, Faults, StubServer, load_fixtures
+
+MODES = ('sequential', 'threads', 'asyncio')
+
+
+def stub_tokens(count: int) -> List[Tuple[str, str]]:
+    return [(f'Stub{i:040d}pump', 'solana') for i in range(count)]
+
+
+def run_pipeline(count: int, mode: str, record: Optional[str] = None, replay: Optional[str] = None) -> Dict:
+    """Generate `count` reports in this process and measure them.
+
+    With `record` the raw responses are appended to an archive; with `replay`
+    they are read from one instead of the stub server.
+    """
+    import numpy as np
+    from src.cache import ResponseArchive
+    from src.dexscreener import MAX_ADDRESSES_PER_REQUEST
+
+    archive = ResponseArchive(replay or record, replay=bool(replay)) if replay or record else None
+    tokens = stub_tokens(count)
+    latencies = []
+
+    start = time.perf_counter()
+    if mode == 'asyncio':
+        from src.async_reporter import AsyncReporter
+
+        class TimedReporter(AsyncReporter):
+            async def generate_report(self, *args, **kwargs):
+                token_start = time.perf_counter()
+                report = await super().generate_report(*args, **kwargs)
+                latencies.append(time.perf_counter() - token_start)
+                return report
+
+        async def run():
+            async with TimedReporter(cache=archive) as reporter:
+                return await reporter.generate_reports(tokens)
+
+        reports = asyncio.run(run())
+    else:
+        from src.reporter import Reporter
+
+        reporter = Reporter(concurrent=mode == 'threads', cache=archive)
+        reports = []
+        for i in range(0, count, MAX_ADDRESSES_PER_REQUEST):
+            chunk = tokens[i:i + MAX_ADDRESSES_PER_REQUEST]
+            token_infos = reporter.dex.research_tokens_batch(chunk)
+            for address, chain in chunk:
+                token_start = time.perf_counter()
+                reports.append(reporter.generate_report(address, chain, token_infos.get((address, chain))))
+                latencies.append(time.perf_counter() - token_start)
+    elapsed = time.perf_counter() - start
+    if archive:
+        archive.close()
+
+    return {
+        'size': count,
+        'mode': mode,
+        'reports': sum(1 for report in reports if report),
+        'seconds': elapsed,
+        'tokens_per_second': count / elapsed if elapsed else 0.0,
+        'p50_ms': float(np.percentile(latencies, 50)) * 1000 if latencies else 0.0,
+        'p99_ms': float(np.percentile(latencies, 99)) * 1000 if latencies else 0.0,
+        # ru_maxrss is in KiB on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+@click.command()
+@click.option('--sizes', default='1,10,100,1000', show_default=True, help='Comma-separated batch sizes')
+@click.option('--mode', type=click.Choice(MODES), default='asyncio', show_default=True)
+@click.option('--fixtures', default=DEFAULT_FIXTURES, show_default=True, help='Glob of saved report files')
+@click.option('--latency', default=0.02, show_default=True, help='Seconds added to every stub response')
+@click.option('--jitter', default=0.01, show_default=True, help='Random +/- seconds around the latency')
+@click.option('--error-rate', default=0.0, help='Share of stub responses that are 500s')
+@click.option('--throttle-rate', default=0.0, help='Share of stub responses that are 429s')
+@click.option('--max-holders', default=200, show_default=True, help='SOLSCAN_MAX_HOLDERS for the runs')
+@click.option('--record', type=click.Path(dir_okay=False), help='Append the raw responses to this archive')
+@click.option('--replay', type=click.Path(exists=True, dir_okay=False),
+              help='Serve responses from a --record archive instead of the stub server (deterministic, CPU only)')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Also write the results as JSON')
+@click.option('--worker', type=int, hidden=True, help='Run one batch of this size and print its result')
+def main(sizes: str, mode: str, fixtures: str, latency: float, jitter: float, error_rate: float,
+         throttle_rate: float, max_holders: int, record: Optional[str], replay: Optional[str], output: str,
+         worker: int):
+    """Benchmark report generation for several batch sizes without network access."""
+    if worker is not None:
+        click.echo(json.dumps(run_pipeline(worker, mode, record, replay)))
+        return
+
+    env = {
+        **os.environ,
+        'SOLSCAN_MAX_HOLDERS': str(max_holders),
+        'TELEGRAM_BOT_TOKEN': os.environ.get('TELEGRAM_BOT_TOKEN') or 'stub',
+        'SOLSCAN_API_KEY': 'stub',
+        # Twitter has no stub (tweepy's host is fixed), so it is left unavailable
+        'TWITTER_BEARER_TOKEN': '',
+        # 429s are answered with Retry-After: 0; keep retry backoff short
+        'HTTP_BACKOFF_BASE': os.environ.get('HTTP_BACKOFF_BASE', '0.05'),
+    }
+    archive_args = ['--record', record] if record else ['--replay', replay] if replay else []
+
+    server = None
+    if not replay:
+        server = StubServer(load_fixtures(fixtures), Faults(latency, jitter, error_rate, throttle_rate)).start()
+        env.update(server.env())
+
+    results = []
+    try:
+        click.echo(f"{'size':>6} {'mode':>10} {'reports':>7} {'tok/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'RSS MB':>7}")
+        for size in (int(s) for s in sizes.split(',')):
+            result = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.pipeline', '--mode', mode, '--worker', str(size), *archive_args],
+                env=env, capture_output=True, text=True, check=True,
+            )
+            row = json.loads(result.stdout.strip().splitlines()[-1])
+            results.append(row)
+            click.echo(f"{row['size']:>6} {row['mode']:>10} {row['reports']:>7} {row['tokens_per_second']:>9.1f} "
+                       f"{row['p50_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['peak_rss_mb']:>7.0f}")
+    finally:
+        if server:
+            server.stop()
+
+    if server:
+        requests = sum(server.requests.values())
+        injected = sum(count for (_, status), count in server.requests.items() if status in (429, 500))
+        click.echo(f"Stub served {requests} requests, {injected} injected failures")
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Time `python -m src.main --help` and list heavy modules imported at startup.
+
+    python benchmarks/startup.py [--runs 10]
+"""
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+import click
+
+# Imported only by the code paths that need them
+HEAVY_MODULES = ('pandas', 'numpy', 'tweepy', 'pyarrow', 'zstandard')
+
+CHECK_IMPORTS = (
+    "import json, sys, src.main; "
+    f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+)
+
+
+def heavy_imports() -> list:
+    """Heavy modules loaded by `import src.main`."""
+    result = subprocess.run([sys.executable, '-c', CHECK_IMPORTS], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+@click.command()
+@click.option('--runs', default=10, help='Number of timed runs')
+def main(runs: int):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'src.main', '--help'], capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+
+    click.echo(f"src.main --help: median {statistics.median(timings) * 1000:.0f} ms, "
+               f"min {min(timings) * 1000:.0f} ms over {runs} runs")
+    click.echo(f"Heavy modules imported at startup: {', '.join(heavy_imports()) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
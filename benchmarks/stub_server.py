@@ -0,0 +1,248 @@
+"""Local stand-in for the DexScreener, CoinGecko, Solscan and Telegram APIs.
+
+Responses are rebuilt from saved report fixtures, so every requested address
+gets realistic payloads without network access. Latency, jitter, 5xx errors
+and 429s can be injected to see how the pipeline copes.
+
+    python -m benchmarks.stub_server --port 8765 --latency 0.05 --throttle-rate 0.02
+"""
+import asyncio
+import glob
+import json
+import random
+import threading
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import click
+from aiohttp import web
+
+DEFAULT_FIXTURES = 'tests/test_files/report_*.json'
+
+# DexScreener window keys -> report field suffixes
+DEX_WINDOWS = {'m5': '5m', 'h1': '1h', 'h6': '6h', 'h24': '24h'}
+
+# Keys parse_coin_data reads with [] and the fixtures may lack
+COINGECKO_KEYS = (
+    'id', 'symbol', 'name', 'web_slug', 'asset_platform_id', 'block_time_in_minutes', 'hashing_algorithm',
+    'categories', 'preview_listing', 'public_notice', 'additional_notices', 'description', 'links', 'image',
+    'country_origin', 'genesis_date', 'contract_address', 'sentiment_votes_up_percentage',
+    'sentiment_votes_down_percentage', 'watchlist_portfolio_users', 'market_cap_rank', 'community_data',
+    'developer_data', 'status_updates', 'last_updated',
+)
+
+TOKEN_DECIMALS = 6
+TOKEN_SUPPLY = 10 ** 9
+
+
+@dataclass
+class Faults:
+    latency: float = 0.0        # seconds added to every response
+    jitter: float = 0.0         # +/- uniform seconds around the latency
+    error_rate: float = 0.0     # share of requests answered with a 500
+    throttle_rate: float = 0.0  # share of requests answered with a 429
+    seed: Optional[int] = 0
+
+
+def load_fixtures(pattern: str = DEFAULT_FIXTURES) -> List[Dict]:
+    fixtures = [json.load(open(path)) for path in sorted(glob.glob(pattern))]
+    fixtures = [f for f in fixtures if f.get('dex')]
+    if not fixtures:
+        raise ValueError(f"No report fixtures with DexScreener data match {pattern}")
+    return fixtures
+
+
+def dex_pair(report: Dict, address: str) -> Dict:
+    dex = report['dex']
+    return {
+        'chainId': dex['chain'],
+        'dexId': dex['dex_id'],
+        'pairAddress': dex['pair_address'],
+        'baseToken': {'address': address, 'name': dex['token_name'], 'symbol': dex['token_symbol']},
+        'priceUsd': str(dex['price_usd']),
+        'priceNative': str(dex['price_native']),
+        'priceChange': {key: dex[f'price_change_{window}'] for key, window in DEX_WINDOWS.items()},
+        'liquidity': {'usd': dex['liquidity_usd']},
+        'fdv': dex['fdv'],
+        'marketCap': dex['market_cap'],
+        'txns': {key: {'buys': dex[f'buys_{window}'], 'sells': dex[f'sells_{window}']}
+                 for key, window in DEX_WINDOWS.items()},
+        'volume': {key: dex[f'volume_{window}'] for key, window in DEX_WINDOWS.items()},
+    }
+
+
+def coingecko_coin(report: Dict, address: str) -> Optional[Dict]:
+    if not report.get('coingecko'):
+        return None
+    coin = {key: None for key in COINGECKO_KEYS}
+    coin.update(report['coingecko'])
+    coin['description'] = {'en': coin['description'] or ''}
+    coin['contract_address'] = address
+    return coin
+
+
+def solscan_meta(report: Dict, address: str) -> Dict:
+    dex = report['dex']
+    return {
+        'address': address, 'name': dex['token_name'], 'symbol': dex['token_symbol'], 'icon': '',
+        'decimals': TOKEN_DECIMALS, 'holder': report.get('num_holders') or 0,
+        'creator': '', 'create_tx': '', 'created_time': 0, 'first_mint_tx': '', 'first_mint_time': 0,
+        'mint_authority': None, 'freeze_authority': None,
+        'supply': str(TOKEN_SUPPLY * 10 ** TOKEN_DECIMALS), 'price': dex['price_usd'],
+        'volume_24h': dex['volume_24h'], 'market_cap': dex['market_cap'], 'market_cap_rank': 0,
+        'price_change_24h': dex['price_change_24h'],
+    }
+
+
+def holder_page(total: int, page: int, page_size: int) -> List[Dict]:
+    """A page of a Zipf-like holder distribution, largest holders first."""
+    start = (page - 1) * page_size
+    return [{'owner': f'holder{rank}', 'amount': TOKEN_SUPPLY * 10 ** TOKEN_DECIMALS * 0.05 / (rank + 1) ** 1.1}
+            for rank in range(start, min(start + page_size, total))]
+
+
+class StubServer:
+    """Serve the stub APIs from a background thread; use as a context manager."""
+
+    def __init__(self, fixtures: Optional[List[Dict]] = None, faults: Optional[Faults] = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.fixtures = fixtures or load_fixtures()
+        self.faults = faults or Faults()
+        self.host = host
+        self.port = port
+        self.random = random.Random(self.faults.seed)
+        self.requests = Counter()  # (api, status) -> count
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.started = threading.Event()
+
+    def fixture(self, address: str) -> Dict:
+        return self.fixtures[zlib.crc32(address.encode()) % len(self.fixtures)]
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    def env(self) -> Dict[str, str]:
+        """Environment pointing Config's base URLs at this server."""
+        return {
+            'DEXSCREENER_BASE_URL': f'{self.url}/dex',
+            'COINGECKO_BASE_URL': f'{self.url}/coingecko',
+            'SOLSCAN_BASE_URL': f'{self.url}/solscan',
+            'TELEGRAM_BASE_URL': f'{self.url}/telegram',
+        }
+
+    @web.middleware
+    async def inject_faults(self, request: web.Request, handler) -> web.StreamResponse:
+        api = request.path.split('/')[1]
+        faults = self.faults
+        delay = faults.latency + self.random.uniform(-faults.jitter, faults.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = self.random.random()
+        if roll < faults.throttle_rate:
+            response = web.json_response({'error': 'rate limited'}, status=429, headers={'Retry-After': '0'})
+        elif roll < faults.throttle_rate + faults.error_rate:
+            response = web.json_response({'error': 'injected'}, status=500)
+        else:
+            response = await handler(request)
+
+        self.requests[(api, response.status)] += 1
+        return response
+
+    async def dex_tokens(self, request: web.Request) -> web.Response:
+        addresses = request.match_info['addresses'].split(',')
+        return web.json_response({'pairs': [dex_pair(self.fixture(a), a) for a in addresses]})
+
+    async def coingecko_contract(self, request: web.Request) -> web.Response:
+        address = request.match_info['address']
+        coin = coingecko_coin(self.fixture(address), address)
+        if coin is None:
+            return web.json_response({'error': 'coin not found'}, status=404)
+        return web.json_response(coin)
+
+    async def solscan_meta(self, request: web.Request) -> web.Response:
+        address = request.query['address']
+        return web.json_response({'success': True, 'data': solscan_meta(self.fixture(address), address)})
+
+    async def solscan_holders(self, request: web.Request) -> web.Response:
+        address = request.query['address']
+        total = self.fixture(address).get('num_holders') or 0
+        page, page_size = int(request.query.get('page', 1)), int(request.query.get('page_size', 10))
+        return web.json_response({'success': True,
+                                  'data': {'total': total, 'items': holder_page(total, page, page_size)}})
+
+    async def telegram_members(self, request: web.Request) -> web.Response:
+        handle = request.query.get('chat_id', '').lstrip('@')
+        telegram = next((f['telegram'] for f in self.fixtures
+                         if f.get('telegram') and f['telegram']['telegram_handle'] == handle), None)
+        if telegram is None:
+            return web.json_response({'ok': False, 'description': 'chat not found'}, status=400)
+        return web.json_response({'ok': True, 'result': telegram['member_count']})
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self.inject_faults])
+        app.router.add_get('/dex/tokens/{addresses}', self.dex_tokens)
+        app.router.add_get('/coingecko/coins/{chain}/contract/{address}', self.coingecko_contract)
+        app.router.add_get('/solscan/token/meta', self.solscan_meta)
+        app.router.add_get('/solscan/token/holders', self.solscan_holders)
+        app.router.add_get('/telegram/{bot}/getChatMemberCount', self.telegram_members)
+        return app
+
+    def _serve(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        runner = web.AppRunner(self.app(), access_log=None)
+        self.loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, self.host, self.port, backlog=1024)
+        self.loop.run_until_complete(site.start())
+        self.port = runner.addresses[0][1]
+        self.started.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(runner.cleanup())
+            self.loop.close()
+
+    def start(self) -> 'StubServer':
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+        self.started.wait()
+        return self
+
+    def stop(self) -> None:
+        if self.loop and self.thread:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+@click.command()
+@click.option('--port', default=8765, show_default=True)
+@click.option('--fixtures', default=DEFAULT_FIXTURES, show_default=True, help='Glob of saved report files')
+@click.option('--latency', default=0.0, help='Seconds added to every response')
+@click.option('--jitter', default=0.0, help='Random +/- seconds around the latency')
+@click.option('--error-rate', default=0.0, help='Share of requests answered with a 500')
+@click.option('--throttle-rate', default=0.0, help='Share of requests answered with a 429')
+def main(port: int, fixtures: str, latency: float, jitter: float, error_rate: float, throttle_rate: float):
+    """Run the stub APIs until interrupted."""
+    faults = Faults(latency, jitter, error_rate, throttle_rate, seed=None)
+    server = StubServer(load_fixtures(fixtures), faults, port=port).start()
+    for name, value in server.env().items():
+        click.echo(f'export {name}={value}')
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.cache import ResponseCache, cached_fetch
+
+
+def json_payload(response: Any) -> Any:
+    response.raise_for_status()
+    return response.json()
+
+
+@dataclass
+class ApiRequest:
+    """One API call: how it is cached, how it is sent and how its payload is read.
+
+    `key` identifies the payload in the response cache or archive. The call
+    is `transport.<method>(*args, **kwargs)`, where the transport is the
+    client's HttpClient (or tweepy client); a sync transport returns the
+    response and an async one a coroutine, so one request serves both
+    pipelines. `payload` turns the response into the JSON that is cached;
+    requests with `cached=False` skip the cache and leave caching (of parts
+    of the payload, say) to the client.
+    """
+    source: str
+    endpoint: str
+    key: Dict[str, Any]
+    args: Tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    method: str = 'get'
+    payload: Callable[[Any], Any] = json_payload
+    cached: bool = True
+
+    def send(self, transport: Any) -> Any:
+        return getattr(transport, self.method)(*self.args, **self.kwargs)
+
+
+class ApiClient:
+    """Base of the API clients: sends ApiRequests through the response cache.
+
+    Subclasses build requests and parse payloads; AsyncApiClient swaps in
+    the awaited transport, so both pipelines share everything else.
+    """
+
+    cache: Optional[ResponseCache] = None
+
+    @property
+    def transport(self) -> Any:
+        return self.http
+
+    def fetch(self, request: ApiRequest) -> Optional[Any]:
+        """The request's payload, from the cache or the API; raises on failure."""
+        return cached_fetch(self.cache if request.cached else None, request.source, request.endpoint, request.key,
+                            lambda: request.payload(request.send(self.transport)))
+
+    def request(self, request: ApiRequest) -> Optional[Any]:
+        """`fetch`, logging failures and returning None instead."""
+        try:
+            return self.fetch(request)
+        except Exception as e:
+            return self.request_failed(request, e)
+
+    def request_failed(self, request: ApiRequest, error: Exception) -> None:
+        logging.getLogger(type(self).__module__).info(
+            f"{request.source} {request.endpoint} request failed for {request.key}: {error}"
+        )
+        return None
@@ -0,0 +1,173 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
+from src.api import ApiClient, ApiRequest
+from src.async_http import AsyncHttpClient
+from src.cache import ResponseCache, cached_fetch_async
+from src.coalesce import async_coalesced
+from src.coingecko import CoinGecko
+from src.dexscreener import DexScreener
+from src.holder_researcher import BalanceBuffer, HolderDistribution, HolderResearcher
+from src.schema import CoingeckoReport, DexScreenerInfo, TelegramChannel, TwitterResponse, TwitterUser
+from src.solscan import HOLDERS_PAGE_SIZE, Solscan, TokenMetadata
+from src.telegram import TelegramResearcher
+from src.twitter import TwitterResearcher
+
+if TYPE_CHECKING:
+    import numpy as np
+    from tweepy.asynchronous import AsyncClient
+
+# Async counterparts of the API clients. Requests, payload handling and
+# parsing all come from the sync clients; these only await the transport (a
+# shared AsyncHttpClient, or tweepy's AsyncClient on the same session), so
+# one event loop and one connection pool serve every source.
+
+
+class AsyncApiClient(ApiClient):
+    """ApiClient whose transport returns coroutines."""
+
+    async def fetch(self, request: ApiRequest) -> Optional[Any]:
+        async def send():
+            return request.payload(await request.send(self.transport))
+
+        return await cached_fetch_async(self.cache if request.cached else None, request.source, request.endpoint,
+                                        request.key, send)
+
+    async def request(self, request: ApiRequest) -> Optional[Any]:
+        try:
+            return await self.fetch(request)
+        except Exception as e:
+            return self.request_failed(request, e)
+
+
+class AsyncDexScreener(AsyncApiClient, DexScreener):
+    def __init__(self, http: AsyncHttpClient, cache: Optional[ResponseCache] = None):
+        super().__init__(http=http, cache=cache)
+
+    async def get_token_info(self, address: str) -> Optional[Dict]:
+        return await self.request(self.tokens_request(address))
+
+    async def research_tokens(self, address: str, chain: Optional[str] = None) -> Optional[DexScreenerInfo]:
+        return self.process_token_data(await self.get_token_info(address), chain, address)
+
+    async def research_tokens_batch(self, tokens: List[Tuple[str, str]]
+                                    ) -> Dict[Tuple[str, str], Optional[DexScreenerInfo]]:
+        """Research many (address, chain) tokens, sending the requests for every 30 addresses at once."""
+        payloads, missing = self.cached_tokens(list(dict.fromkeys(address for address, _ in tokens)))
+        chunks = self.address_chunks(missing)
+        responses = await asyncio.gather(*(self.request(self.batch_request(chunk)) for chunk in chunks))
+        for chunk, data in zip(chunks, responses):
+            payloads.update(self.split_batch(chunk, data))
+        return self.process_batch(tokens, payloads)
+
+
+class AsyncCoinGecko(AsyncApiClient, CoinGecko):
+    def __init__(self, http: AsyncHttpClient, cache: Optional[ResponseCache] = None):
+        super().__init__(http=http, cache=cache)
+
+    @async_coalesced
+    async def get_coin_info(self, contract_address: str, chain: str = 'solana') -> Optional[CoingeckoReport]:
+        return self.coin_info(await self.request(self.coin_request(contract_address, chain)))
+
+
+class AsyncSolscan(AsyncApiClient, Solscan):
+    def __init__(self, http: AsyncHttpClient, cache: Optional[ResponseCache] = None):
+        super().__init__(http=http, cache=cache)
+
+    async def get_token_metadata(self, token_address: str) -> Optional[TokenMetadata]:
+        return self.parse_metadata(await self.request(self.meta_request(token_address)))
+
+    async def iter_token_holders(self, token_address: str) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        page = 1
+        while True:
+            total, items = self.holders_page(await self.fetch(self.holders_request(token_address, page)))
+            if not items:
+                return
+
+            yield total, items
+
+            if len(items) < HOLDERS_PAGE_SIZE:
+                return
+            page += 1
+
+
+class AsyncHolderResearcher(HolderResearcher):
+    def __init__(self, http: AsyncHttpClient, cache: Optional[ResponseCache] = None, **kwargs):
+        super().__init__(solscan=AsyncSolscan(http, cache=cache), **kwargs)
+
+    async def get_holder_balances(self, token_address: str) -> Optional[Tuple['np.ndarray', int]]:
+        buffer = BalanceBuffer(self.max_holders)
+        deadline = time.monotonic() + self.time_budget
+        try:
+            async for total, items in self.solscan.iter_token_holders(token_address):
+                if buffer.add(total, items) or self.out_of_time(token_address, buffer, deadline):
+                    break
+        except Exception as e:
+            return self.holders_failed(token_address, e)
+        return buffer.result()
+
+    async def get_holder_distribution(self, token_address: str, chain: str) -> Optional[HolderDistribution]:
+        if chain != "solana":
+            return HolderDistribution()
+
+        metadata = await self.solscan.get_token_metadata(token_address)
+        balances = await self.get_holder_balances(token_address) if self.wants_balances(metadata) else None
+        return self.distribution(metadata, balances)
+
+
+class AsyncTelegramResearcher(AsyncApiClient, TelegramResearcher):
+    def __init__(self, http: AsyncHttpClient, bot_token: str = None, cache: Optional[ResponseCache] = None):
+        super().__init__(bot_token=bot_token, http=http, cache=cache)
+
+    @async_coalesced
+    async def get_channel_info(self, telegram_handle: str) -> Optional[TelegramChannel]:
+        if not telegram_handle:
+            return None
+
+        telegram_handle = telegram_handle.replace('@', '')
+        return self.parse_channel(telegram_handle, await self.request(self.member_count_request(telegram_handle)))
+
+
+class AsyncTwitterResearcher(AsyncApiClient, TwitterResearcher):
+    def __init__(self, http: AsyncHttpClient, bearer_token: str = None, cache: Optional[ResponseCache] = None):
+        super().__init__(bearer_token=bearer_token, cache=cache)
+        self.http = http
+
+    @property
+    def client(self) -> 'AsyncClient':
+        """tweepy AsyncClient sending its requests through the shared session."""
+        if self._client is None:
+            from tweepy.asynchronous import AsyncClient
+            self._client = AsyncClient(bearer_token=self.bearer_token)
+        # The session belongs to the running loop, so it is looked up on every use
+        self._client.session = self.http.get_session()
+        return self._client
+
+    async def get_user_info(self, twitter_handle: str) -> Optional[TwitterUser]:
+        if not twitter_handle:
+            self.logger.error("Twitter handle is required")
+            return None
+
+        return self.parse_user(twitter_handle, await self.request(self.user_request(twitter_handle)))
+
+    async def get_timeline(self, user_id: int) -> List:
+        tweets = []
+        pagination_token = None
+        while True:
+            page = await self.fetch(self.timeline_request(user_id, pagination_token))
+            pagination_token = self.add_timeline_page(tweets, page)
+            if not pagination_token:
+                return tweets
+
+    @async_coalesced
+    async def get_twitter_info(self, twitter_handle: str) -> Optional[TwitterResponse]:
+        user_info = await self.get_user_info(twitter_handle)
+        if not user_info:
+            return None
+
+        try:
+            tweets = await self.get_timeline(user_info.twitter_id)
+        except Exception as e:
+            tweets = self.timeline_failed(e)
+
+        return self.twitter_response(user_info, tweets)
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from src.config import Config
+from src.http_client import RETRY_STATUS_CODES, RetryPolicy
+from src.instrumentation import metrics
+
+
+class HttpStatusError(Exception):
+    def __init__(self, url: str, status_code: int):
+        super().__init__(f"{status_code} error for {url}")
+        self.url = url
+        self.status_code = status_code
+
+
+class AsyncResponse:
+    """Fully read response, with the parts of requests.Response the clients use."""
+
+    def __init__(self, url: str, status_code: int, headers: Any, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HttpStatusError(self.url, self.status_code)
+
+
+class AsyncHttpClient(RetryPolicy):
+    """aiohttp counterpart of HttpClient: one connection pool for every async client.
+
+    The same per-host token buckets, retry status codes and jittered backoff
+    apply, but waits are `asyncio.sleep`s, so hundreds of requests can be in
+    flight on one event loop. The session is created on first use, inside
+    the running loop.
+    """
+
+    def __init__(self,
+                 max_connections: int = Config.ASYNC_HTTP_MAX_CONNECTIONS,
+                 max_connections_per_host: int = Config.HTTP_POOL_MAXSIZE,
+                 timeout: tuple = (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT),
+                 rate_limits: Optional[Dict[str, float]] = None,
+                 max_retries: int = Config.HTTP_MAX_RETRIES,
+                 backoff_base: float = Config.HTTP_BACKOFF_BASE,
+                 backoff_max: float = Config.HTTP_BACKOFF_MAX):
+        super().__init__(rate_limits, max_retries, backoff_base, backoff_max)
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """The pooled session, for libraries that bring their own request code (tweepy)."""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections_per_host)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self.session
+
+    async def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> AsyncResponse:
+        """Send a rate-limited GET request, retrying throttled and failed attempts.
+
+        The last response is returned once retries are exhausted, so callers
+        still see the final status code.
+        """
+        host = urlparse(url).hostname
+        bucket = self.buckets.get(host)
+        if headers:
+            # Like requests, leave out headers set to None (e.g. an unconfigured API key)
+            headers = {key: value for key, value in headers.items() if value is not None}
+
+        for attempt in range(self.max_retries + 1):
+            wait = self._reserve(host, bucket)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            start = time.monotonic()
+            try:
+                async with self.get_session().get(url, params=params, headers=headers) as response:
+                    content = await response.read()
+                    result = AsyncResponse(url, response.status, response.headers, content)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self._record_failure(host, e, time.monotonic() - start)
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                metrics.incr('http_retries_total', host=host, reason=type(e).__name__)
+                self.logger.info(f"Request to {host} failed ({e!r}), retrying in {delay:.1f}s")
+            else:
+                self._record_response(host, result, time.monotonic() - start)
+                if result.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return result
+
+                delay = self._retry_delay(url, result, attempt, bucket)
+                if delay is None:
+                    continue
+
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,145 @@
+import asyncio
+import inspect
+import time
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Tuple
+from src.async_clients import (
+    AsyncCoinGecko, AsyncDexScreener, AsyncHolderResearcher, AsyncTelegramResearcher, AsyncTwitterResearcher,
+)
+from src.async_http import AsyncHttpClient
+from src.cache import ResponseCache
+from src.config import Config
+from src.instrumentation import metrics
+from src.reporter import BaseReporter
+from src.schema import DexScreenerInfo, Report, SourceStatus
+from src.sources import Source, SourceContext, optional_client, OK, EMPTY, ERROR, TIMEOUT
+
+
+class AsyncReporter(BaseReporter):
+    """Reporter running every source as a coroutine on one event loop.
+
+    All clients share one AsyncHttpClient, so its connection pool and per-host
+    token buckets cover every request in flight. Each source also has its own
+    limit on concurrent calls (`Config.source_concurrency()`), so a slow API
+    cannot take up the whole pool while many tokens are researched at once.
+    Sources whose `fetch` is synchronous still work but block the loop while
+    they run.
+    """
+
+    def __init__(self, source_timeout: float = Config.SOURCE_TIMEOUT,
+                 cache: Optional[ResponseCache] = None,
+                 sources: Optional[List[Source]] = None,
+                 http: Optional[AsyncHttpClient] = None,
+                 concurrency: Optional[Dict[str, int]] = None,
+                 max_in_flight: int = Config.ASYNC_MAX_TOKENS):
+        self.http = http or AsyncHttpClient()
+        self.dex = AsyncDexScreener(self.http, cache=cache)
+        self.coingecko = AsyncCoinGecko(self.http, cache=cache)
+        # Social sources need API tokens; without one they are reported as unavailable
+        self.twitter = optional_client(AsyncTwitterResearcher, self.http, cache=cache)
+        self.telegram = optional_client(AsyncTelegramResearcher, self.http, cache=cache)
+        self.holder_researcher = AsyncHolderResearcher(self.http, cache=cache)
+        super().__init__(sources if sources is not None else self.default_sources(), source_timeout)
+
+        if concurrency is None:
+            concurrency = Config.source_concurrency()
+        self.limits = {name: asyncio.Semaphore(limit) for name, limit in concurrency.items() if limit > 0}
+        self.max_in_flight = max_in_flight
+
+    async def _fetch(self, source: Source, context: SourceContext) -> Any:
+        result = source.fetch(context)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _run_source(self, source: Source, context: SourceContext) -> Tuple[Any, SourceStatus]:
+        """Fetch one source within its concurrency limit, turning failures into a status.
+
+        The timeout starts once the source's limit lets the call through, so
+        time spent queued behind other tokens does not count against it.
+        """
+        limit = self.limits.get(source.name)
+        if limit:
+            await limit.acquire()
+
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(self._fetch(source, context), self.source_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Source {source.name} timed out after {self.source_timeout}s")
+            return None, SourceStatus(status=TIMEOUT, elapsed=time.monotonic() - start)
+        except asyncio.CancelledError:
+            # A shared (coalesced) call cancelled by another token's timeout
+            if asyncio.current_task().cancelling():
+                raise
+            self.logger.warning(f"Source {source.name} was cancelled for {context.token_address}")
+            return None, SourceStatus(status=TIMEOUT, elapsed=time.monotonic() - start)
+        except Exception as e:
+            self.logger.warning(f"Source {source.name} failed for {context.token_address}: {e}")
+            return None, SourceStatus(status=ERROR, error=str(e), elapsed=time.monotonic() - start)
+        finally:
+            if limit:
+                limit.release()
+
+        return result, SourceStatus(status=OK if result is not None else EMPTY, elapsed=time.monotonic() - start)
+
+    async def _run_sources(self, context: SourceContext) -> Dict[str, SourceStatus]:
+        """Start each source as soon as its dependencies are done."""
+        statuses = self._unavailable(context)
+        pending = {}  # task -> source
+
+        while len(statuses) < len(self.sources):
+            running = {source.name for source in pending.values()}
+            for source in self._prepare(context, statuses):
+                if source.name not in running:
+                    snapshot = replace(context, results=dict(context.results))
+                    pending[asyncio.ensure_future(self._run_source(source, snapshot))] = source
+
+            if not pending:
+                continue
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                source = pending.pop(task)
+                context.results[source.name], statuses[source.name] = task.result()
+
+        return statuses
+
+    async def generate_report(self, token_address: str, chain: str,
+                              token_info: Optional[DexScreenerInfo] = None) -> Optional[Report]:
+        """Async counterpart of `Reporter.generate_report`, with the same partial-report rules."""
+        context = SourceContext(token_address, chain, token_info)
+        try:
+            with metrics.timer('report_seconds'):
+                statuses = await self._run_sources(context)
+            self.record_statuses(statuses)
+            return self.build_report(context, statuses)
+
+        except Exception as e:
+            metrics.incr('report_errors_total', error=type(e).__name__)
+            self.logger.error(f"Error generating report: {str(e)}")
+            return None
+
+    async def generate_reports(self, tokens: List[Tuple[str, str]]) -> List[Optional[Report]]:
+        """Reports for many (address, chain) tokens, in order.
+
+        DexScreener data is prefetched with batch requests, then up to
+        `max_in_flight` tokens are researched at once.
+        """
+        token_infos = await self.dex.research_tokens_batch(tokens)
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        async def research(address: str, chain: str) -> Optional[Report]:
+            async with in_flight:
+                return await self.generate_report(address, chain, token_infos.get((address, chain)))
+
+        return await asyncio.gather(*(research(address, chain) for address, chain in tokens))
+
+    async def close(self) -> None:
+        await self.http.close()
+
+    async def __aenter__(self) -> 'AsyncReporter':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
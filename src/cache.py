@@ -0,0 +1,255 @@
+import gzip
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+from src.config import Config
+from src.instrumentation import metrics
+
+
+class ResponseCache:
+    """SQLite cache of API payloads keyed by source, endpoint and parameters.
+
+    Each source has its own TTL (see `Config.cache_ttls`). When the cache grows
+    past `max_bytes`, the least recently used entries are evicted; the size is
+    kept as a running total (`size`, counted once on open) so writes don't
+    rescan the table. With `refresh=True` cached entries are never read, only
+    overwritten.
+    """
+
+    # A miss is final: the payload is not fetched (see ResponseArchive)
+    offline = False
+
+    def __init__(self, path: Union[str, Path] = Config.CACHE_PATH,
+                 max_bytes: int = Config.CACHE_MAX_BYTES,
+                 ttls: Optional[Dict[str, int]] = None,
+                 refresh: bool = False):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttls = ttls if ttls is not None else Config.cache_ttls()
+        self.refresh = refresh
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at);
+        """)
+        self.size = self._total_size()
+
+    def _total_size(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def _key(source: str, endpoint: str, params: Optional[Dict]) -> str:
+        raw = json.dumps([source, endpoint, params or {}], sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def get(self, source: str, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Return the cached payload, or None if missing, expired or refreshing."""
+        if self.refresh:
+            metrics.incr('cache_misses_total', source=source, endpoint=endpoint)
+            return None
+
+        key = self._key(source, endpoint, params)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if not row or row[1] < now:
+                metrics.incr('cache_misses_total', source=source, endpoint=endpoint)
+                return None
+
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+        metrics.incr('cache_hits_total', source=source, endpoint=endpoint)
+
+        return json.loads(row[0])
+
+    def set(self, source: str, endpoint: str, params: Optional[Dict], value: Any) -> None:
+        """Store a JSON-serializable payload with the source's TTL."""
+        ttl = self.ttls.get(source, 0)
+        if ttl <= 0:
+            return
+
+        key = self._key(source, endpoint, params)
+        encoded = json.dumps(value, default=str)
+        now = time.time()
+        with self.lock:
+            replaced = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, source, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, source, encoded, len(encoded), now + ttl, now)
+            )
+            self.size += len(encoded) - (replaced[0] if replaced else 0)
+            if self.size > self.max_bytes:
+                self._evict(now)
+            self.conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones until under max_bytes.
+
+        The total is recounted here, since other processes may share the file.
+        """
+        self.conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+
+        total = self.size = self._total_size()
+        if total <= self.max_bytes:
+            return
+
+        freed = 0
+        evict = []
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total - freed <= self.max_bytes:
+                break
+            evict.append((key,))
+            freed += size
+
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+        self.size = total - freed
+        self.logger.debug(f"Evicted {len(evict)} cached responses ({freed} bytes)")
+
+    def fetch(self, source: str, endpoint: str, params: Optional[Dict], fetch: Callable[[], Any]) -> Optional[Any]:
+        """Return the cached payload or call `fetch` and cache its non-None result."""
+        value = self.get(source, endpoint, params)
+        if value is not None:
+            return value
+
+        value = fetch()
+        if value is not None:
+            self.set(source, endpoint, params, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.size = 0
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class ResponseArchive:
+    """Record every raw API payload of a run, or replay them without the network.
+
+    Drop-in for ResponseCache: the API clients look payloads up by source,
+    endpoint and parameters either way. Recording ignores TTLs and appends
+    one compact JSON line per payload to a gzip file, so runs can add to the
+    same archive. Replaying loads the archive and never calls the APIs; a
+    payload that was not recorded is treated as no data.
+    """
+
+    def __init__(self, path: Union[str, Path], replay: bool = False):
+        self.path = Path(path)
+        self.replay = replay
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+        self.payloads: Dict[str, Any] = {}
+        self.sources = set()  # sources with recorded payloads
+        self.misses = 0
+        self.file = None
+
+        if replay:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    record = json.loads(line)
+                    key = ResponseCache._key(record['source'], record['endpoint'], record['params'])
+                    # The latest recording of a request wins
+                    self.payloads[key] = record['payload']
+                    self.sources.add(record['source'])
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = gzip.open(self.path, 'at', encoding='utf-8')
+
+    @property
+    def offline(self) -> bool:
+        return self.replay
+
+    def get(self, source: str, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
+        if not self.replay:
+            return None
+
+        value = self.payloads.get(ResponseCache._key(source, endpoint, params))
+        if value is None:
+            self.misses += 1
+            metrics.incr('archive_misses_total', source=source, endpoint=endpoint)
+            self.logger.debug(f"No recorded {source} {endpoint} response for {params}")
+        return value
+
+    def set(self, source: str, endpoint: str, params: Optional[Dict], value: Any) -> None:
+        if self.replay:
+            return
+
+        line = json.dumps({'source': source, 'endpoint': endpoint, 'params': params, 'payload': value},
+                          separators=(',', ':'), default=str)
+        with self.lock:
+            self.file.write(line + '\n')
+
+    def fetch(self, source: str, endpoint: str, params: Optional[Dict], fetch: Callable[[], Any]) -> Optional[Any]:
+        value = self.get(source, endpoint, params)
+        if value is not None or self.replay:
+            return value
+
+        value = fetch()
+        if value is not None:
+            self.set(source, endpoint, params, value)
+        return value
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+        if self.replay and self.misses:
+            self.logger.warning(f"{self.misses} requests had no recorded response in {self.path}")
+
+
+def cached_fetch(cache: Optional[ResponseCache], source: str, endpoint: str, params: Optional[Dict],
+                 fetch: Callable[[], Any]) -> Optional[Any]:
+    """Go through `cache` (a ResponseCache or ResponseArchive) when one is configured, otherwise call `fetch` directly.
+
+    Calls that reach the API are timed per source and endpoint.
+    """
+    def timed_fetch():
+        with metrics.timer('endpoint_seconds', source=source, endpoint=endpoint):
+            return fetch()
+
+    if cache is None:
+        return timed_fetch()
+    return cache.fetch(source, endpoint, params, timed_fetch)
+
+
+async def cached_fetch_async(cache: Optional[ResponseCache], source: str, endpoint: str, params: Optional[Dict],
+                             fetch: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+    """`cached_fetch` for a coroutine `fetch`; the SQLite lookups themselves stay synchronous."""
+    async def timed_fetch():
+        with metrics.timer('endpoint_seconds', source=source, endpoint=endpoint):
+            return await fetch()
+
+    if cache is None:
+        return await timed_fetch()
+
+    value = cache.get(source, endpoint, params)
+    if value is not None or cache.offline:
+        return value
+
+    value = await timed_fetch()
+    if value is not None:
+        cache.set(source, endpoint, params, value)
+    return value
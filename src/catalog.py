@@ -0,0 +1,211 @@
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Union
+
+import click
+from pydantic import BaseModel
+
+from src.report_io import find_report_files
+from src.schema import Report
+
+CATALOG_FILENAME = 'catalog.sqlite'
+
+COLUMNS = ('path', 'token_address', 'chain', 'symbol', 'timestamp',
+           'price_usd', 'liquidity_usd', 'market_cap', 'num_holders')
+
+INSERT_SQL = f"INSERT OR REPLACE INTO reports ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+
+class CatalogEntry(BaseModel):
+    path: str
+    token_address: str
+    chain: str
+    symbol: Optional[str] = None
+    timestamp: datetime
+    price_usd: Optional[float] = None
+    liquidity_usd: Optional[float] = None
+    market_cap: Optional[float] = None
+    num_holders: Optional[int] = None
+
+
+def _timestamp_key(timestamp: datetime) -> str:
+    """Sortable text form of a timestamp; aware timestamps are converted to UTC."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp.isoformat(timespec='seconds')
+
+
+class ReportCatalog:
+    """SQLite index of saved report files.
+
+    One row per report file with its token, chain, symbol, timestamp and a few
+    headline metrics. Lookups by token, symbol or time range go through
+    indexes instead of globbing and parsing the report directory.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS reports (
+                path TEXT PRIMARY KEY,
+                token_address TEXT NOT NULL,
+                chain TEXT NOT NULL,
+                symbol TEXT,
+                timestamp TEXT NOT NULL,
+                price_usd REAL,
+                liquidity_usd REAL,
+                market_cap REAL,
+                num_holders INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_reports_token ON reports (token_address, chain, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_reports_symbol ON reports (symbol, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_reports_timestamp ON reports (timestamp);
+        """)
+
+    @classmethod
+    def for_directory(cls, reports_dir: Union[str, Path]) -> 'ReportCatalog':
+        """Catalog stored next to the report files it indexes."""
+        return cls(Path(reports_dir) / CATALOG_FILENAME)
+
+    @staticmethod
+    def _row(report: Report, path: Union[str, Path]) -> tuple:
+        dex = report.dex
+        return (
+            str(Path(path).resolve()),
+            report.token_address,
+            report.chain,
+            dex.token_symbol if dex else None,
+            _timestamp_key(report.timestamp),
+            dex.price_usd if dex else None,
+            dex.liquidity_usd if dex else None,
+            dex.market_cap if dex else None,
+            report.num_holders,
+        )
+
+    def add(self, report: Report, path: Union[str, Path]) -> None:
+        """Index (or re-index) the report saved at `path`."""
+        with self.lock:
+            self.conn.execute(INSERT_SQL, self._row(report, path))
+            self.conn.commit()
+
+    def rebuild(self, reports_dir: Union[str, Path]) -> int:
+        """Re-index every report JSON in `reports_dir` and return how many were indexed."""
+        rows = []
+        for json_file in find_report_files(reports_dir):
+            try:
+                rows.append(self._row(Report.from_json(json_file), json_file))
+            except Exception as e:
+                self.logger.info(f"Error loading {json_file}: {e}")
+
+        with self.lock:
+            self.conn.execute("DELETE FROM reports")
+            self.conn.executemany(INSERT_SQL, rows)
+            self.conn.commit()
+        return len(rows)
+
+    def _query(self, sql: str, params: list) -> List[CatalogEntry]:
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [CatalogEntry(**dict(zip(COLUMNS, row))) for row in rows]
+
+    @staticmethod
+    def _filters(token_address: Optional[str], chain: Optional[str], symbol: Optional[str]) -> tuple:
+        clauses, params = [], []
+        for column, value in (('token_address', token_address), ('chain', chain), ('symbol', symbol)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return clauses, params
+
+    def latest(self, token_address: Optional[str] = None, chain: Optional[str] = None,
+               symbol: Optional[str] = None, n: int = 1) -> List[CatalogEntry]:
+        """Latest `n` reports per token (newest first), optionally for one token, chain or symbol."""
+        clauses, params = self._filters(token_address, chain, symbol)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"""
+            SELECT {', '.join(COLUMNS)} FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY token_address, chain ORDER BY timestamp DESC
+                ) AS rank
+                FROM reports {where}
+            )
+            WHERE rank <= ?
+            ORDER BY token_address, chain, timestamp DESC
+        """
+        return self._query(sql, params + [n])
+
+    def between(self, start: datetime, end: datetime, token_address: Optional[str] = None,
+                chain: Optional[str] = None, symbol: Optional[str] = None) -> List[CatalogEntry]:
+        """All reports with start <= timestamp <= end, oldest first."""
+        clauses, params = self._filters(token_address, chain, symbol)
+        clauses.append("timestamp BETWEEN ? AND ?")
+        params.extend([_timestamp_key(start), _timestamp_key(end)])
+        sql = f"SELECT {', '.join(COLUMNS)} FROM reports WHERE {' AND '.join(clauses)} ORDER BY timestamp"
+        return self._query(sql, params)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _echo_entries(entries: List[CatalogEntry]) -> None:
+    for entry in entries:
+        click.echo('\t'.join('' if value is None else str(value) for value in (
+            entry.timestamp, entry.chain, entry.symbol, entry.token_address, entry.price_usd,
+            entry.liquidity_usd, entry.market_cap, entry.num_holders, entry.path
+        )))
+
+
+@click.group()
+@click.option('--reports-dir', '-d', default='output', type=click.Path(file_okay=False),
+              help='Directory holding the reports and their catalog (default: output)')
+@click.pass_context
+def cli(ctx, reports_dir: str):
+    """Query the catalog of saved reports."""
+    ctx.obj = ReportCatalog.for_directory(reports_dir)
+    ctx.call_on_close(ctx.obj.close)
+
+
+@cli.command()
+@click.option('--token-address', '-t', help='Token contract address')
+@click.option('--chain', '-c', help='Chain name')
+@click.option('--symbol', '-s', help='Token symbol')
+@click.option('-n', default=1, show_default=True, help='Reports per token')
+@click.pass_obj
+def latest(catalog: ReportCatalog, token_address: Optional[str], chain: Optional[str], symbol: Optional[str], n: int):
+    """Latest N reports per token."""
+    _echo_entries(catalog.latest(token_address, chain, symbol, n))
+
+
+@cli.command()
+@click.argument('start', type=click.DateTime())
+@click.argument('end', type=click.DateTime())
+@click.option('--token-address', '-t', help='Token contract address')
+@click.option('--chain', '-c', help='Chain name')
+@click.option('--symbol', '-s', help='Token symbol')
+@click.pass_obj
+def between(catalog: ReportCatalog, start: datetime, end: datetime, token_address: Optional[str],
+            chain: Optional[str], symbol: Optional[str]):
+    """All reports between START and END."""
+    _echo_entries(catalog.between(start, end, token_address, chain, symbol))
+
+
+@cli.command()
+@click.argument('reports_dir', required=False, type=click.Path(exists=True, file_okay=False))
+@click.pass_context
+def rebuild(ctx, reports_dir: Optional[str]):
+    """Re-index every report JSON (default: the catalog's directory)."""
+    catalog = ctx.obj
+    indexed = catalog.rebuild(reports_dir or catalog.path.parent)
+    click.echo(f"Indexed {indexed} reports")
+
+
+if __name__ == '__main__':
+    cli()
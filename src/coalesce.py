@@ -0,0 +1,135 @@
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from src.config import Config
+
+
+class Coalescer:
+    """Share one result between every call made with the same key.
+
+    The first call for a key runs the function; concurrent calls for that key
+    wait for its result, and later calls reuse it. Exceptions and None (how
+    the API clients report a failed lookup) are passed to the waiting calls
+    but not remembered, so the next call tries again. At most `max_results`
+    results are remembered, least recently used first out.
+    """
+
+    def __init__(self, max_results: int = Config.COALESCE_MAX_RESULTS):
+        self.lock = threading.Lock()
+        self.max_results = max_results
+        self.pending: Dict[Hashable, Future] = {}
+        self.results: OrderedDict = OrderedDict()
+
+    def _remember(self, key: Hashable, result: Any) -> None:
+        if result is None or self.max_results <= 0:
+            return
+        self.results[key] = result
+        while len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+    def run(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self.lock:
+            if key in self.results:
+                self.results.move_to_end(key)
+                return self.results[key]
+            future = self.pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.pending[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self.lock:
+                del self.pending[key]
+            future.set_exception(e)
+            raise
+
+        with self.lock:
+            del self.pending[key]
+            self._remember(key, result)
+        future.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        """Forget remembered results so the next calls fetch again."""
+        with self.lock:
+            self.results.clear()
+
+
+class AsyncCoalescer(Coalescer):
+    """Coalescer for coroutines running on one event loop."""
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if key in self.results:
+            self.results.move_to_end(key)
+            return self.results[key]
+
+        future = self.pending.get(key)
+        while future is not None:
+            try:
+                # shield: a cancelled waiter must not cancel the shared result
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Re-raise if this waiter was cancelled; if the call it was
+                # waiting for was (e.g. by the caller's timeout), run it here
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            future = self.pending.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            del self.pending[key]
+            future.cancel()
+            raise
+        except BaseException as e:
+            del self.pending[key]
+            future.set_exception(e)
+            # Only waiters see the exception; don't warn that nobody retrieved it
+            future.exception()
+            raise
+
+        del self.pending[key]
+        self._remember(key, result)
+        future.set_result(result)
+        return result
+
+
+def coalesced(method: Callable) -> Callable:
+    """Coalesce calls to a method made with equal arguments on the same instance."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        coalescer = self.__dict__.setdefault('_coalescer', Coalescer())
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        return coalescer.run(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+def async_coalesced(method: Callable) -> Callable:
+    """`coalesced` for coroutine methods."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        coalescer = self.__dict__.setdefault('_coalescer', AsyncCoalescer())
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        return await coalescer.run(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+def reset_coalesced(*objects: Any) -> None:
+    """Forget results remembered by the @coalesced methods of `objects`."""
+    for obj in objects:
+        coalescer = obj.__dict__.get('_coalescer')
+        if coalescer:
+            coalescer.clear()
@@ -1,6 +1,10 @@
 import logging
-from typing import Optional
-import requests
+from typing import Any, Dict, Optional
+from src.api import ApiClient, ApiRequest, json_payload
+from src.config import Config
+from src.cache import ResponseCache
+from src.coalesce import coalesced
+from src.http_client import HttpClient, get_http_client
 from src.schema import (
     CoingeckoReport,
     CommunityData,
@@ -9,9 +13,22 @@ from src.schema import (
     Image,
 )
 
-class CoinGecko:
-    def __init__(self):
-        self.base_url = "https://api.coingecko.com/api/v3"
+# Cached in place of the coin when CoinGecko does not list a contract (most
+# memecoins), so re-runs within the TTL don't ask again
+NOT_FOUND = {'error': 'coin not found'}
+
+
+def coin_payload(response: Any) -> Dict:
+    if response.status_code == 404:
+        return NOT_FOUND
+    return json_payload(response)
+
+
+class CoinGecko(ApiClient):
+    def __init__(self, http: Optional[HttpClient] = None, cache: Optional[ResponseCache] = None):
+        self.http = http or get_http_client()
+        self.cache = cache
+        self.base_url = Config.COINGECKO_BASE_URL
 
 
     def parse_coin_data(self, data: dict) -> Optional[CoingeckoReport]:
@@ -51,19 +68,21 @@ class CoinGecko:
             logging.info(f"Error parsing coin data: {e}")
             return None
 
-    def get_coin_info(self, contract_address: str, chain: str = 'solana') -> Optional[CoingeckoReport]:
-        """Get and parse coin information from CoinGecko"""
-        try:
-            url = f"{self.base_url}/coins/{chain}/contract/{contract_address}"
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            return self.parse_coin_data(data)
+    def coin_request(self, contract_address: str, chain: str) -> ApiRequest:
+        return ApiRequest('coingecko', 'coins/contract', {'chain': chain, 'address': contract_address},
+                          args=(f"{self.base_url}/coins/{chain}/contract/{contract_address}",),
+                          payload=coin_payload)
 
-        except Exception as e:
-            logging.info(f"Error fetching coin info: {e}")
+    def coin_info(self, data: Optional[Dict]) -> Optional[CoingeckoReport]:
+        """Parse a coins/contract payload; None for a failed request or an unlisted coin."""
+        if not data or data == NOT_FOUND:
             return None
+        return self.parse_coin_data(data)
+
+    @coalesced
+    def get_coin_info(self, contract_address: str, chain: str = 'solana') -> Optional[CoingeckoReport]:
+        """Get and parse coin information from CoinGecko"""
+        return self.coin_info(self.request(self.coin_request(contract_address, chain)))
 
 
 # Example usage
@@ -1,4 +1,5 @@
 import os
+from typing import Dict
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -8,6 +9,9 @@ class Config:
     # Twitter settings
     TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN')
     TWITTER_MAX_RESULTS = int(os.getenv('TWITTER_MAX_RESULTS', 5))
+    # Recent tweets the metrics cover, paging TWITTER_MAX_RESULTS at a time. The top tweets are the
+    # non-replies of the window, topped up from older pages when replies leave fewer than 5
+    TWITTER_TWEET_WINDOW = int(os.getenv('TWITTER_TWEET_WINDOW', TWITTER_MAX_RESULTS))
     TWITTER_LOG_LEVEL = os.getenv('TWITTER_LOG_LEVEL', 'INFO')
 
     # Telegram settings
@@ -20,6 +24,110 @@ class Config:
     BASESCAN_API_KEY = os.getenv('BASESCAN_API_KEY')
     SOLSCAN_API_KEY = os.getenv('SOLSCAN_API_KEY')
 
+    # Largest holder count whose full list is paged for Gini; bigger tokens only fetch the
+    # first page for Top-10/Top-20 concentration (0 disables the holder list fetch). 1000
+    # holders is 25 pages, 2.5s at SOLSCAN_RATE_LIMIT, well inside SOURCE_TIMEOUT
+    SOLSCAN_MAX_HOLDERS = int(os.getenv('SOLSCAN_MAX_HOLDERS', 1000))
+
+    # HTTP settings
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 10))
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 16))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 20))
+
+    # Retries for throttled (429) and failed (5xx) requests
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 4))
+    HTTP_BACKOFF_BASE = float(os.getenv('HTTP_BACKOFF_BASE', 0.5))
+    HTTP_BACKOFF_MAX = float(os.getenv('HTTP_BACKOFF_MAX', 60))
+
+    # API base URLs (pointed at a local stub server by the benchmarks)
+    DEXSCREENER_BASE_URL = os.getenv('DEXSCREENER_BASE_URL', 'https://api.dexscreener.com/latest/dex')
+    COINGECKO_BASE_URL = os.getenv('COINGECKO_BASE_URL', 'https://api.coingecko.com/api/v3')
+    SOLSCAN_BASE_URL = os.getenv('SOLSCAN_BASE_URL', 'https://pro-api.solscan.io/v2.0')
+    TELEGRAM_BASE_URL = os.getenv('TELEGRAM_BASE_URL', 'https://api.telegram.org')
+
+    # Rate limits in requests per second for each API host
+    DEXSCREENER_RATE_LIMIT = float(os.getenv('DEXSCREENER_RATE_LIMIT', 5))
+    COINGECKO_RATE_LIMIT = float(os.getenv('COINGECKO_RATE_LIMIT', 0.5))
+    SOLSCAN_RATE_LIMIT = float(os.getenv('SOLSCAN_RATE_LIMIT', 10))
+    TELEGRAM_RATE_LIMIT = float(os.getenv('TELEGRAM_RATE_LIMIT', 20))
+    # Requests a host may receive back-to-back after being idle
+    RATE_LIMIT_BURST = float(os.getenv('RATE_LIMIT_BURST', 3))
+
+    # Response cache settings
+    CACHE_PATH = os.getenv('CACHE_PATH', '.cache/responses.sqlite')
+    CACHE_MAX_BYTES = int(os.getenv('CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+    # Seconds a cached response stays fresh for each source (0 disables caching)
+    DEXSCREENER_CACHE_TTL = int(os.getenv('DEXSCREENER_CACHE_TTL', 30))
+    COINGECKO_CACHE_TTL = int(os.getenv('COINGECKO_CACHE_TTL', 6 * 3600))
+    SOLSCAN_CACHE_TTL = int(os.getenv('SOLSCAN_CACHE_TTL', 6 * 3600))
+    TWITTER_CACHE_TTL = int(os.getenv('TWITTER_CACHE_TTL', 6 * 3600))
+    TELEGRAM_CACHE_TTL = int(os.getenv('TELEGRAM_CACHE_TTL', 3600))
+
+    # Reporter settings
+    REPORTER_CONCURRENT = os.getenv('REPORTER_CONCURRENT', 'true').lower() == 'true'
+    REPORTER_MAX_WORKERS = int(os.getenv('REPORTER_MAX_WORKERS', 8))
+    SOURCE_TIMEOUT = float(os.getenv('SOURCE_TIMEOUT', 30))
+    # Seconds a token's holder list may be paged before settling for the pages already fetched
+    HOLDERS_TIME_BUDGET = float(os.getenv('HOLDERS_TIME_BUDGET', SOURCE_TIMEOUT / 2))
+    # CoinGecko/Twitter/Telegram results remembered per client for repeated lookups in a run
+    COALESCE_MAX_RESULTS = int(os.getenv('COALESCE_MAX_RESULTS', 1024))
+
+    # Async pipeline: connections shared by every client, tokens in flight, and calls in flight per source
+    ASYNC_HTTP_MAX_CONNECTIONS = int(os.getenv('ASYNC_HTTP_MAX_CONNECTIONS', 100))
+    ASYNC_MAX_TOKENS = int(os.getenv('ASYNC_MAX_TOKENS', 200))
+    DEXSCREENER_CONCURRENCY = int(os.getenv('DEXSCREENER_CONCURRENCY', 16))
+    COINGECKO_CONCURRENCY = int(os.getenv('COINGECKO_CONCURRENCY', 4))
+    # Tokens paging holders share SOLSCAN_RATE_LIMIT: 4 full page-throughs take 10s at 10 req/s
+    HOLDERS_CONCURRENCY = int(os.getenv('HOLDERS_CONCURRENCY', 4))
+    TWITTER_CONCURRENCY = int(os.getenv('TWITTER_CONCURRENCY', 8))
+    TELEGRAM_CONCURRENCY = int(os.getenv('TELEGRAM_CONCURRENCY', 16))
+
+    # Watch mode: seconds between DexScreener polls and between full reports of a token
+    WATCH_INTERVAL = float(os.getenv('WATCH_INTERVAL', 60))
+    WATCH_SLOW_INTERVAL = float(os.getenv('WATCH_SLOW_INTERVAL', 3600))
+
+    # Report files: indent 0 writes compact JSON; compression is '', 'gzip' or 'zstd'
+    REPORT_INDENT = int(os.getenv('REPORT_INDENT', 2))
+    REPORT_COMPRESSION = os.getenv('REPORT_COMPRESSION', '') or None
+
+    # Report loading (0 workers = one process per CPU)
+    REPORT_LOAD_WORKERS = int(os.getenv('REPORT_LOAD_WORKERS', 0))
+    REPORT_LOAD_CHUNKSIZE = int(os.getenv('REPORT_LOAD_CHUNKSIZE', 32))
+
+    @classmethod
+    def rate_limits(cls) -> Dict[str, float]:
+        """Requests per second allowed for each API host."""
+        return {
+            'api.dexscreener.com': cls.DEXSCREENER_RATE_LIMIT,
+            'api.coingecko.com': cls.COINGECKO_RATE_LIMIT,
+            'pro-api.solscan.io': cls.SOLSCAN_RATE_LIMIT,
+            'api.telegram.org': cls.TELEGRAM_RATE_LIMIT,
+        }
+
+    @classmethod
+    def source_concurrency(cls) -> Dict[str, int]:
+        """Calls allowed in flight at once for each report source in the async pipeline."""
+        return {
+            'dex': cls.DEXSCREENER_CONCURRENCY,
+            'coingecko': cls.COINGECKO_CONCURRENCY,
+            'holders': cls.HOLDERS_CONCURRENCY,
+            'twitter': cls.TWITTER_CONCURRENCY,
+            'telegram': cls.TELEGRAM_CONCURRENCY,
+        }
+
+    @classmethod
+    def cache_ttls(cls) -> Dict[str, int]:
+        """Seconds a cached response stays fresh for each source."""
+        return {
+            'dexscreener': cls.DEXSCREENER_CACHE_TTL,
+            'coingecko': cls.COINGECKO_CACHE_TTL,
+            'solscan': cls.SOLSCAN_CACHE_TTL,
+            'twitter': cls.TWITTER_CACHE_TTL,
+            'telegram': cls.TELEGRAM_CACHE_TTL,
+        }
+
     @classmethod
     def validate(cls):
         """Validate required environment variables."""
@@ -1,32 +1,76 @@
 import logging
-import requests
-from typing import Optional, Dict
+from collections import defaultdict
+from typing import Any, Optional, Dict, List, Tuple
 from datetime import datetime
+from src.api import ApiClient, ApiRequest
+from src.config import Config
+from src.cache import ResponseCache
+from src.http_client import HttpClient, get_http_client
 from src.schema import DexScreenerInfo
 
-class DexScreener:
-    def __init__(self):
-        self.base_url = "https://api.dexscreener.com/latest/dex"
+# The tokens endpoint accepts up to 30 comma-separated addresses
+MAX_ADDRESSES_PER_REQUEST = 30
+
+
+def ok_json(response: Any) -> Optional[Dict]:
+    return response.json() if response.status_code == 200 else None
+
+
+class DexScreener(ApiClient):
+    def __init__(self, http: Optional[HttpClient] = None, cache: Optional[ResponseCache] = None):
+        self.http = http or get_http_client()
+        self.cache = cache
+        self.base_url = Config.DEXSCREENER_BASE_URL
         self.logger = logging.getLogger(__name__)
 
+    def tokens_request(self, address: str) -> ApiRequest:
+        return ApiRequest('dexscreener', 'tokens', {'address': address},
+                          args=(f"{self.base_url}/tokens/{address}",), payload=ok_json)
+
+    def batch_request(self, addresses: List[str]) -> ApiRequest:
+        """One request for many addresses; its payload is cached per address by `split_batch`."""
+        return ApiRequest('dexscreener', 'tokens', {'address': ','.join(addresses)},
+                          args=(f"{self.base_url}/tokens/{','.join(addresses)}",), payload=ok_json, cached=False)
+
     def get_token_info(self, address: str) -> Optional[Dict]:
         """Get token information from DexScreener API."""
-        try:
-            response = requests.get(f"{self.base_url}/tokens/{address}")
-            if response.status_code == 200:
-                return response.json()
-            return None
-        except Exception as e:
-            self.logger.error(f"Error getting token info: {str(e)}")
-            return None
+        return self.request(self.tokens_request(address))
+
+    def process_token_data(self, data: Dict, chain: Optional[str] = None,
+                           address: Optional[str] = None) -> Optional[DexScreenerInfo]:
+        """Process raw token data into DexScreenerInfo model.
 
-    def process_token_data(self, data: Dict) -> Optional[DexScreenerInfo]:
-        """Process raw token data into DexScreenerInfo model."""
+        Uses the deepest-liquidity pair among the pairs on `chain` whose base
+        token is `address` (either filter is skipped when not given), and
+        aggregates liquidity, 24h volume and pair count over those pairs.
+        """
         try:
             if not data or 'pairs' not in data or not data['pairs']:
                 return None
 
-            pair = data['pairs'][0]  # Use first pair
+            pair = None
+            best_liquidity = -1.0
+            pair_count = 0
+            total_liquidity = 0.0
+            total_volume_24h = 0.0
+
+            for candidate in data['pairs']:
+                if chain and candidate.get('chainId') != chain:
+                    continue
+                if address and candidate['baseToken']['address'].lower() != address.lower():
+                    continue
+
+                liquidity = float((candidate.get('liquidity') or {}).get('usd') or 0)
+                pair_count += 1
+                total_liquidity += liquidity
+                total_volume_24h += float((candidate.get('volume') or {}).get('h24') or 0)
+
+                if liquidity > best_liquidity:
+                    pair = candidate
+                    best_liquidity = liquidity
+
+            if pair is None:
+                return None
 
             return DexScreenerInfo(
                 token_address=pair['baseToken']['address'],
@@ -65,16 +109,85 @@ class DexScreener:
                 buys_24h=pair.get('txns', {}).get('h24', {}).get('buys', 0),
                 sells_24h=pair.get('txns', {}).get('h24', {}).get('sells', 0),
                 total_txns_24h=pair.get('txns', {}).get('h24', {}).get('buys', 0) + pair.get('txns', {}).get('h24', {}).get('sells', 0),
-                volume_24h=float(pair.get('volume', {}).get('h24', 0))
+                volume_24h=float(pair.get('volume', {}).get('h24', 0)),
+
+                pair_count=pair_count,
+                total_liquidity_usd=total_liquidity,
+                total_volume_24h=total_volume_24h
             )
 
         except Exception as e:
             self.logger.error(f"Error processing token data: {str(e)}")
             return None
 
-    def research_tokens(self, address: str) -> Optional[DexScreenerInfo]:
+    def research_tokens(self, address: str, chain: Optional[str] = None) -> Optional[DexScreenerInfo]:
         """Research single token and return result."""
-        data = self.get_token_info(address)
-        if data:
-            return self.process_token_data(data)
-        return None
\ No newline at end of file
+        return self.process_token_data(self.get_token_info(address), chain, address)
+
+    def research_tokens_batch(self, tokens: List[Tuple[str, str]]
+                              ) -> Dict[Tuple[str, str], Optional[DexScreenerInfo]]:
+        """Research many (address, chain) tokens with one request per 30 addresses.
+
+        Returned pairs are grouped by base token address and filtered to the
+        requested chain, so each token maps to what `research_tokens(address,
+        chain)` returns (or None if no pair was found). Addresses already in
+        the cache are not requested again.
+        """
+        payloads, missing = self.cached_tokens(list(dict.fromkeys(address for address, _ in tokens)))
+        for chunk in self.address_chunks(missing):
+            payloads.update(self.split_batch(chunk, self.request(self.batch_request(chunk))))
+        return self.process_batch(tokens, payloads)
+
+    @staticmethod
+    def address_chunks(addresses: List[str]) -> List[List[str]]:
+        return [addresses[i:i + MAX_ADDRESSES_PER_REQUEST] for i in range(0, len(addresses), MAX_ADDRESSES_PER_REQUEST)]
+
+    def cached_tokens(self, addresses: List[str]) -> Tuple[Dict[str, Dict], List[str]]:
+        """Cached tokens payloads of `addresses`, and the addresses still to request."""
+        if self.cache is None:
+            return {}, addresses
+
+        payloads = {}
+        for address in addresses:
+            request = self.tokens_request(address)
+            data = self.cache.get(request.source, request.endpoint, request.key)
+            if data is not None:
+                payloads[address] = data
+        # Replaying an archive never reaches the API
+        missing = [] if self.cache.offline else [address for address in addresses if address not in payloads]
+        return payloads, missing
+
+    def split_batch(self, addresses: List[str], data: Optional[Dict]) -> Dict[str, Dict]:
+        """Split a batch response into the tokens payload of each address found.
+
+        Each payload is cached as if its address had been requested alone, so
+        a cache or archive answers later lookups of that address whether they
+        are single or batched with any other addresses.
+        """
+        if not data or not data.get('pairs'):
+            return {}
+
+        # EVM addresses may come back with different casing
+        pairs_by_address = defaultdict(list)
+        for pair in data['pairs']:
+            pairs_by_address[pair['baseToken']['address'].lower()].append(pair)
+
+        payloads = {}
+        for address in addresses:
+            pairs = pairs_by_address.get(address.lower())
+            if not pairs:
+                continue
+            payloads[address] = {'pairs': pairs}
+            if self.cache is not None:
+                request = self.tokens_request(address)
+                self.cache.set(request.source, request.endpoint, request.key, payloads[address])
+        return payloads
+
+    def process_batch(self, tokens: List[Tuple[str, str]],
+                      payloads: Dict[str, Dict]) -> Dict[Tuple[str, str], Optional[DexScreenerInfo]]:
+        """One DexScreenerInfo per token from the tokens payloads of their addresses."""
+        results = {}
+        for address, chain in tokens:
+            data = payloads.get(address)
+            results[(address, chain)] = self.process_token_data(data, chain, address) if data else None
+        return results
@@ -0,0 +1,22 @@
+import click
+import logging
+from src.report_io import find_report_files
+from src.utils import iter_reports, export_reports
+
+
+@click.command()
+@click.argument('reports_dir', type=click.Path(exists=True, file_okay=False))
+@click.argument('output_path', type=click.Path())
+@click.option('--append/--overwrite', default=True, help='Append to an existing export (default: append)')
+@click.option('--skip-existing/--no-skip-existing', default=True, help='Skip reports already in the export')
+def main(reports_dir: str, output_path: str, append: bool, skip_existing: bool):
+    """Stream every report JSON in REPORTS_DIR into OUTPUT_PATH (.csv or .jsonl)."""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
+    json_paths = find_report_files(reports_dir)
+    written = export_reports(iter_reports(json_paths), output_path, append=append, skip_existing=skip_existing)
+    logging.info(f"Exported {written} reports to {output_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,175 @@
-from src.solscan import Solscan
+import logging
+import time
+from pydantic import BaseModel
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from src.cache import ResponseCache
+from src.config import Config
+from src.solscan import Solscan, TokenMetadata
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class HolderDistribution(BaseModel):
+    num_holders: int = 0
+    holders_analyzed: int = 0
+    gini_coefficient: Optional[float] = None
+    top10_holder_concentration: Optional[float] = None
+    top20_holder_concentration: Optional[float] = None
+
+
+def gini_coefficient(balances: 'np.ndarray') -> Optional[float]:
+    """Gini coefficient of holder balances in O(n log n).
+
+    Uses the sorted form G = 2 * sum(i * x_i) / (n * sum(x)) - (n + 1) / n with
+    x sorted ascending and i = 1..n, which equals the pairwise definition in
+    token_metrics.md without the O(n^2) double sum.
+    """
+    import numpy as np
+
+    n = len(balances)
+    total = balances.sum() if n else 0.0
+    if total <= 0:
+        return None
+
+    x = np.sort(balances)
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    return float(2.0 * np.dot(ranks, x) / (n * total) - (n + 1.0) / n)
+
+
+def top_holder_concentration(balances: 'np.ndarray', top_n: int, total_supply: float) -> Optional[float]:
+    """Percentage of total supply held by the `top_n` largest holders."""
+    import numpy as np
+
+    if total_supply <= 0 or not len(balances):
+        return None
+
+    top_n = min(top_n, len(balances))
+    top = np.partition(balances, len(balances) - top_n)[-top_n:]
+    return float(top.sum() / total_supply * 100)
+
+
+class BalanceBuffer:
+    """Collects holder balances, a page at a time, into one float64 array.
+
+    Every balance is kept when there are at most `limit` holders, so Gini can
+    be computed. Past that only the first page, the largest holders, is kept:
+    enough for Top-10/Top-20 concentration without paging through the rest.
+    """
+
+    def __init__(self, limit: int):
+        import numpy as np
+
+        self.limit = limit
+        self.balances = np.empty(0, dtype=np.float64)
+        self.holder_total = 0
+        self.count = 0
+
+    def add(self, total: int, items: List[Dict]) -> bool:
+        """Add a page of holders; returns True once the buffer is full."""
+        import numpy as np
+
+        if not self.holder_total:
+            # Size the buffer once from the reported total
+            self.holder_total = max(total, len(items))
+            size = self.holder_total if self.holder_total <= self.limit else len(items)
+            self.balances = np.empty(size, dtype=np.float64)
+
+        take = min(len(items), len(self.balances) - self.count)
+        self.balances[self.count:self.count + take] = np.fromiter(
+            (float(item['amount']) for item in items[:take]), dtype=np.float64, count=take
+        )
+        self.count += take
+        return self.count >= len(self.balances)
+
+    def result(self) -> Tuple['np.ndarray', int]:
+        return self.balances[:self.count], self.holder_total
 
 
 class HolderResearcher:
-    def __init__(self):
-        self.solscan = Solscan()
+    def __init__(self, cache: Optional[ResponseCache] = None, max_holders: int = Config.SOLSCAN_MAX_HOLDERS,
+                 solscan: Optional[Solscan] = None, time_budget: float = Config.HOLDERS_TIME_BUDGET):
+        self.solscan = solscan or Solscan(cache=cache)
+        self.max_holders = max_holders
+        self.time_budget = time_budget
+        self.logger = logging.getLogger(__name__)
 
     def get_holders(self, token_address: str, chain: str) -> int:
         if chain == "solana":
-            return self.solscan.get_token_metadata(token_address).holder
+            metadata = self.solscan.get_token_metadata(token_address)
+            return metadata.holder if metadata else 0
         else:
             return 0
+
+    def get_holder_balances(self, token_address: str) -> Optional[Tuple['np.ndarray', int]]:
+        """Stream holder balances into a float64 array, largest first.
+
+        Tokens with more than `max_holders` holders stop after the first page,
+        and paging stops early once `time_budget` seconds have passed, so a
+        slow or throttled token still gets a distribution (without Gini)
+        before the source times out. Returns the balances and the total
+        number of holders reported by Solscan, or None if a page could not be
+        fetched.
+        """
+        buffer = BalanceBuffer(self.max_holders)
+        deadline = time.monotonic() + self.time_budget
+        try:
+            for total, items in self.solscan.iter_token_holders(token_address):
+                if buffer.add(total, items) or self.out_of_time(token_address, buffer, deadline):
+                    break
+        except Exception as e:
+            return self.holders_failed(token_address, e)
+        return buffer.result()
+
+    def out_of_time(self, token_address: str, buffer: BalanceBuffer, deadline: float) -> bool:
+        if time.monotonic() < deadline:
+            return False
+        self.logger.info(f"Stopped paging holders of {token_address} after {self.time_budget}s "
+                         f"with {buffer.count} of {buffer.holder_total}")
+        return True
+
+    def holders_failed(self, token_address: str, error: Exception) -> None:
+        self.logger.info(f"Error fetching holders of {token_address}: {error}")
+        return None
+
+    def wants_balances(self, metadata: Optional[TokenMetadata]) -> bool:
+        return metadata is not None and self.max_holders > 0
+
+    def get_holder_distribution(self, token_address: str, chain: str) -> Optional[HolderDistribution]:
+        """Holder count plus Gini and Top-10/Top-20 concentration for a token.
+
+        Concentration is computed from the largest holders against the token
+        supply. Gini needs every balance, so it is left empty (and only the
+        first page of holders is fetched) when the token has more than
+        `max_holders` holders.
+        """
+        if chain != "solana":
+            return HolderDistribution()
+
+        metadata = self.solscan.get_token_metadata(token_address)
+        balances = self.get_holder_balances(token_address) if self.wants_balances(metadata) else None
+        return self.distribution(metadata, balances)
+
+    def distribution(self, metadata: Optional[TokenMetadata],
+                     balances: Optional[Tuple['np.ndarray', int]]) -> Optional[HolderDistribution]:
+        """The distribution of a token from its metadata and, when fetched, its holder balances."""
+        if not metadata:
+            return None
+        if balances is None:
+            return HolderDistribution(num_holders=metadata.holder)
+        return self.summarize(metadata, *balances)
+
+    def summarize(self, metadata: TokenMetadata, balances: 'np.ndarray', holder_total: int) -> HolderDistribution:
+        """Distribution metrics from the token metadata and the largest holders' balances."""
+        complete = len(balances) >= holder_total
+        supply = float(metadata.supply or 0)
+        if supply <= 0 and complete:
+            supply = float(balances.sum())
+
+        distribution = HolderDistribution(num_holders=metadata.holder, holders_analyzed=len(balances))
+        distribution.top10_holder_concentration = top_holder_concentration(balances, 10, supply)
+        distribution.top20_holder_concentration = top_holder_concentration(balances, 20, supply)
+        if complete:
+            distribution.gini_coefficient = gini_coefficient(balances)
+
+        return distribution
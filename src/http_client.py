@@ -0,0 +1,177 @@
+import logging
+import random
+import threading
+import time
+import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+from src.config import Config
+from src.instrumentation import metrics
+from src.rate_limit import TokenBucket
+
+# Responses worth retrying: throttling and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RetryPolicy:
+    """Per-host token buckets plus the retry and backoff rules shared by the HTTP clients."""
+
+    def __init__(self,
+                 rate_limits: Optional[Dict[str, float]] = None,
+                 max_retries: int = Config.HTTP_MAX_RETRIES,
+                 backoff_base: float = Config.HTTP_BACKOFF_BASE,
+                 backoff_max: float = Config.HTTP_BACKOFF_MAX):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.logger = logging.getLogger(__name__)
+
+        if rate_limits is None:
+            rate_limits = Config.rate_limits()
+        self.buckets = {
+            host: TokenBucket(rate, capacity=max(rate, Config.RATE_LIMIT_BURST))
+            for host, rate in rate_limits.items() if rate > 0
+        }
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _retry_after(self, response) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+
+        return min(self.backoff_max, max(0.0, seconds))
+
+    def _reserve(self, host: str, bucket: Optional[TokenBucket]) -> float:
+        """Take a token from the host's bucket; returns the seconds to wait for it."""
+        if not bucket:
+            return 0.0
+        wait = bucket.reserve()
+        if wait > 0:
+            metrics.incr('rate_limit_wait_seconds_total', wait, host=host)
+        return wait
+
+    def _record_response(self, host: str, response, elapsed: float) -> None:
+        metrics.observe('http_request_seconds', elapsed, host=host)
+        metrics.incr('http_requests_total', host=host, status=response.status_code)
+        content = getattr(response, 'content', None)
+        if isinstance(content, bytes):
+            metrics.incr('http_response_bytes_total', len(content), host=host)
+
+    def _record_failure(self, host: str, error: Exception, elapsed: float) -> None:
+        metrics.observe('http_request_seconds', elapsed, host=host)
+        metrics.incr('http_requests_total', host=host, status=type(error).__name__)
+
+    def _retry_delay(self, url: str, response, attempt: int, bucket: Optional[TokenBucket]) -> Optional[float]:
+        """Seconds to sleep before retrying a retryable response.
+
+        On a 429 the host's bucket is paused instead, so every caller talking
+        to the host waits it out on its next acquire, and None is returned.
+        """
+        delay = self._retry_after(response)
+        if delay is None:
+            delay = self._backoff(attempt)
+        metrics.incr('http_retries_total', host=urlparse(url).hostname, reason=response.status_code)
+        self.logger.info(f"{urlparse(url).hostname} returned {response.status_code}, retrying in {delay:.1f}s")
+        if response.status_code == 429 and bucket:
+            bucket.pause(delay)
+            return None
+        return delay
+
+
+class HttpClient(RetryPolicy):
+    """Shared requests.Session with keep-alive connection pools and default timeouts.
+
+    requests keeps one connection pool per host, so every API client that goes
+    through the same HttpClient reuses open TCP/TLS connections to its host.
+    Requests are throttled by a token bucket per host and throttled or failed
+    requests are retried with jittered exponential backoff.
+    """
+
+    def __init__(self,
+                 pool_connections: int = Config.HTTP_POOL_CONNECTIONS,
+                 pool_maxsize: int = Config.HTTP_POOL_MAXSIZE,
+                 timeout: Tuple[float, float] = (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT),
+                 rate_limits: Optional[Dict[str, float]] = None,
+                 max_retries: int = Config.HTTP_MAX_RETRIES,
+                 backoff_base: float = Config.HTTP_BACKOFF_BASE,
+                 backoff_max: float = Config.HTTP_BACKOFF_MAX):
+        super().__init__(rate_limits, max_retries, backoff_base, backoff_max)
+        self.timeout = timeout
+
+        self.session = requests.Session()
+
+        # pool_connections: number of hosts to keep pools for
+        # pool_maxsize: number of connections kept open per host
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            timeout: Optional[Union[float, Tuple[float, float]]] = None) -> requests.Response:
+        """Send a rate-limited GET request, retrying throttled and failed attempts.
+
+        The last response is returned once retries are exhausted, so callers
+        still see the final status code.
+        """
+        host = urlparse(url).hostname
+        bucket = self.buckets.get(host)
+
+        for attempt in range(self.max_retries + 1):
+            wait = self._reserve(host, bucket)
+            if wait > 0:
+                time.sleep(wait)
+
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=timeout or self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record_failure(host, e, time.monotonic() - start)
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                metrics.incr('http_retries_total', host=host, reason=type(e).__name__)
+                self.logger.info(f"Request to {host} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                self._record_response(host, response, time.monotonic() - start)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return response
+
+                # Hold back every thread talking to this host on a 429, not just
+                # this one; the next acquire() waits out the pause
+                delay = self._retry_delay(url, response, attempt, bucket)
+                if delay is None:
+                    continue
+
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HttpClient, creating it on first use."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
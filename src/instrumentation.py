@@ -0,0 +1,141 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Tuple
+
+# Prefix of every metric in the Prometheus export
+PROMETHEUS_NAMESPACE = 'token_research'
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class TimerStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + '}'
+
+
+class Metrics:
+    """Thread-safe registry of labelled counters and timers.
+
+    Counters track events (requests, retries, 429s, cache hits, bytes) and
+    timers the count, total and maximum of durations, e.g. per source or per
+    API endpoint. The registry can be dumped as JSON, in the Prometheus text
+    exposition format, or as a table for the end of a run.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[str, Dict[Labels, float]] = {}
+        self.timers: Dict[str, Dict[Labels, TimerStats]] = {}
+
+    def incr(self, name: str, value: float = 1, **labels) -> None:
+        key = _labels(labels)
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        key = _labels(labels)
+        with self.lock:
+            stats = self.timers.setdefault(name, {}).setdefault(key, TimerStats())
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Time the block, whether it returns or raises."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, time.monotonic() - start, **labels)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counters.clear()
+            self.timers.clear()
+
+    def snapshot(self) -> Dict[str, List[Dict]]:
+        """Every series as plain dicts: {'counters': [...], 'timers': [...]}."""
+        with self.lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for name, series in sorted(self.counters.items())
+                        for labels, value in sorted(series.items())]
+            timers = [{'name': name, 'labels': dict(labels), **asdict(stats), 'mean': stats.mean}
+                      for name, series in sorted(self.timers.items())
+                      for labels, stats in sorted(series.items())]
+        return {'counters': counters, 'timers': timers}
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text format; timers become `_seconds` summaries plus a `_seconds_max` gauge."""
+        lines = []
+        with self.lock:
+            for name, series in sorted(self.counters.items()):
+                metric = f'{PROMETHEUS_NAMESPACE}_{name}'
+                lines.append(f'# TYPE {metric} counter')
+                lines.extend(f'{metric}{_format_labels(labels)} {value:g}' for labels, value in sorted(series.items()))
+
+            for name, series in sorted(self.timers.items()):
+                metric = f'{PROMETHEUS_NAMESPACE}_{name}'
+                lines.append(f'# TYPE {metric} summary')
+                for labels, stats in sorted(series.items()):
+                    lines.append(f'{metric}_count{_format_labels(labels)} {stats.count}')
+                    lines.append(f'{metric}_sum{_format_labels(labels)} {stats.total:.6f}')
+                lines.append(f'# TYPE {metric}_max gauge')
+                lines.extend(f'{metric}_max{_format_labels(labels)} {stats.max:.6f}'
+                             for labels, stats in sorted(series.items()))
+
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """Human-readable profile: timers slowest first, then counters."""
+        snapshot = self.snapshot()
+        lines = []
+
+        timers = sorted(snapshot['timers'], key=lambda t: t['total'], reverse=True)
+        if timers:
+            lines.append(f"{'timer':<50} {'count':>7} {'total s':>9} {'mean s':>8} {'max s':>8}")
+            for t in timers:
+                name = t['name'] + _format_labels(_labels(t['labels']))
+                lines.append(f"{name:<50} {t['count']:>7} {t['total']:>9.2f} {t['mean']:>8.3f} {t['max']:>8.3f}")
+
+        if snapshot['counters']:
+            lines.append(f"{'counter':<50} {'value':>7}")
+            for c in snapshot['counters']:
+                name = c['name'] + _format_labels(_labels(c['labels']))
+                lines.append(f"{name:<50} {c['value']:>7g}")
+
+        return '\n'.join(lines)
+
+    def write(self, path: str) -> None:
+        """Write the metrics as Prometheus text for `.prom`/`.txt` paths, JSON otherwise."""
+        text = self.to_prometheus() if path.endswith(('.prom', '.txt')) else self.to_json()
+        with open(path, 'w') as f:
+            f.write(text)
+
+
+# Process-wide registry the HTTP clients, cache and reporters record into
+metrics = Metrics()
@@ -1,7 +1,18 @@
+import asyncio
 import click
 import logging
+import time
 from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from src.cache import ResponseArchive, ResponseCache
+from src.config import Config
+from src.dexscreener import MAX_ADDRESSES_PER_REQUEST
+from src.instrumentation import metrics
+from src.report_io import report_suffix
 from src.reporter import Reporter
+from src.schema import Report, DexScreenerInfo
+from src.sources import ERROR, TIMEOUT
+from src.utils import save_report
 
 def setup_logger(debug: bool = False) -> logging.Logger:
     """Setup basic logger."""
@@ -11,36 +22,201 @@ def setup_logger(debug: bool = False) -> logging.Logger:
     )
     return logging.getLogger('token_research')
 
+def parse_tokens(lines: Iterable[str], default_chain: str) -> List[Tuple[str, str]]:
+    """Parse "address,chain" lines into (address, chain) tuples.
+
+    Blank lines and lines starting with '#' are skipped. The chain is optional
+    and falls back to `default_chain`.
+    """
+    tokens = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        address, _, chain = line.partition(',')
+        tokens.append((address.strip(), chain.strip() or default_chain))
+
+    return tokens
+
+def save_report_file(report: Report, output_path: Path, indent: Optional[int] = Config.REPORT_INDENT,
+                     compression: Optional[str] = Config.REPORT_COMPRESSION) -> Path:
+    """Write a report to `output_path`, index it in the catalog and return the file path."""
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    suffix = report_suffix(compression)
+    # Tickers are not unique, so the address keeps same-second reports of
+    # different tokens apart; partial reports without DexScreener data have no symbol
+    name = f"{report.dex.token_symbol}_{report.token_address}" if report.dex else report.token_address
+    filename = f"report_{report.chain}_{name}_{report.timestamp.strftime('%Y%m%d_%H%M%S')}{suffix}"
+    filepath = output_path / filename
+    save_report(report, filepath, indent=indent, compression=compression)
+
+    return filepath
+
+def research_token(reporter: Reporter, token_address: str, chain: str, output_path: Path,
+                   logger: logging.Logger, token_info: Optional[DexScreenerInfo] = None,
+                   indent: Optional[int] = Config.REPORT_INDENT,
+                   compression: Optional[str] = Config.REPORT_COMPRESSION) -> Optional[Report]:
+    """Research a single token, save its report and return it."""
+    logger.info(f"Researching {token_address} on {chain}")
+    report = reporter.generate_report(token_address, chain, token_info)
+    return finish_report(report, token_address, output_path, logger, indent, compression)
+
+def finish_report(report: Optional[Report], token_address: str, output_path: Path, logger: logging.Logger,
+                  indent: Optional[int] = Config.REPORT_INDENT,
+                  compression: Optional[str] = Config.REPORT_COMPRESSION) -> Optional[Report]:
+    """Save a generated report and log its summary; logs an error for a missing report."""
+    if not report:
+        logger.error(f"Could not generate report for {token_address}")
+        return None
+
+    filepath = save_report_file(report, output_path, indent, compression)
+    logger.info(f"Report saved: {filepath}")
+    if report.dex:
+        logger.info(f"Token: {report.dex.token_symbol} Price: ${report.dex.price_usd:.4f}")
+
+    degraded = {name: status.status for name, status in report.sources.items() if status.status in (ERROR, TIMEOUT)}
+    if degraded:
+        logger.warning(f"Partial report for {token_address}: " +
+                       ", ".join(f"{name} {status}" for name, status in degraded.items()))
+    return report
+
+def report_metrics(logger: logging.Logger, metrics_out: Optional[str] = None) -> None:
+    """Log the run profile and optionally write the metrics to a file."""
+    summary = metrics.summary()
+    if summary:
+        logger.info(f"Run profile:\n{summary}")
+    if metrics_out:
+        metrics.write(metrics_out)
+        logger.info(f"Metrics written to {metrics_out}")
+
+def log_batch(tokens: List[Tuple[str, str]], failed: List[Tuple[str, str]], start: float,
+              logger: logging.Logger) -> None:
+    elapsed = time.monotonic() - start
+    logger.info(f"Batch complete: {len(tokens) - len(failed)}/{len(tokens)} reports in {elapsed:.1f}s")
+    for address, token_chain in failed:
+        logger.info(f"Failed: {address} ({token_chain})")
+
+async def research_tokens_async(tokens: List[Tuple[str, str]], output_path: Path, logger: logging.Logger,
+                                cache: Optional[ResponseCache] = None,
+                                indent: Optional[int] = Config.REPORT_INDENT,
+                                compression: Optional[str] = Config.REPORT_COMPRESSION) -> List[Optional[Report]]:
+    """Research every token on one event loop and save the reports, in token order."""
+    # aiohttp is only needed by the async pipeline
+    from src.async_reporter import AsyncReporter
+
+    async with AsyncReporter(cache=cache) as reporter:
+        reports = await reporter.generate_reports(tokens)
+
+    return [finish_report(report, address, output_path, logger, indent, compression)
+            for report, (address, _) in zip(reports, tokens)]
+
 @click.command()
-@click.option('--token-address', '-t', required=True, help='Token contract address')
+@click.option('--token-address', '-t', help='Token contract address')
 @click.option('--chain', '-c', default='ethereum', help='Chain name (default: ethereum)')
+@click.option('--tokens-file', '-f', type=click.File('r'),
+              help='File with one "address,chain" per line ("-" for stdin)')
 @click.option('--output-dir', '-o', default='output', help='Output directory', type=click.Path())
+@click.option('--cache/--no-cache', default=True, help='Use the on-disk response cache (default: on)')
+@click.option('--compact', is_flag=True, help='Write reports as compact (non-indented) JSON')
+@click.option('--compression', type=click.Choice(['none', 'gzip', 'zstd']),
+              default=Config.REPORT_COMPRESSION or 'none', help='Compress report files (default: none)')
+@click.option('--store-dir', type=click.Path(),
+              help='Also append reports to the Parquet report store in this directory')
+@click.option('--asyncio', 'use_asyncio', is_flag=True,
+              help='Research a token list concurrently on one event loop (async clients)')
+@click.option('--metrics-out', type=click.Path(dir_okay=False),
+              help='Write request, cache and source metrics to this file (.prom for Prometheus text, else JSON)')
+@click.option('--record', type=click.Path(dir_okay=False),
+              help='Append every raw API response of this run to a gzip archive (bypasses the cache)')
+@click.option('--replay', type=click.Path(exists=True, dir_okay=False),
+              help='Rebuild reports from a --record archive without touching the network')
+@click.option('--refresh', is_flag=True, help='Ignore cached responses and fetch everything again')
 @click.option('--debug/--no-debug', default=False, help='Enable debug logging')
-def main(token_address: str, chain: str, output_dir: str, debug: bool):
-    """Research token and save report."""
+def main(token_address: Optional[str], chain: str, tokens_file, output_dir: str, cache: bool,
+         compact: bool, compression: str, store_dir: Optional[str], use_asyncio: bool,
+         metrics_out: Optional[str], record: Optional[str], replay: Optional[str], refresh: bool, debug: bool):
+    """Research token(s) and save one report per token."""
+    if not token_address and not tokens_file:
+        raise click.UsageError("Provide --token-address or --tokens-file")
+    if record and replay:
+        raise click.UsageError("--record and --replay cannot be combined")
+
     logger = setup_logger(debug)
-    reporter = Reporter()
+    output_path = Path(output_dir)
+    indent = 0 if compact else Config.REPORT_INDENT
+    compression = None if compression == 'none' else compression
 
-    # Generate report
-    logger.info(f"Researching {token_address} on {chain}")
-    report = reporter.generate_report(token_address, chain)
+    tokens = []
+    if token_address:
+        tokens.append((token_address, chain))
+    if tokens_file:
+        tokens.extend(parse_tokens(tokens_file, chain))
 
-    if not report:
-        logger.error("Could not generate report")
+    # Logged (and written) however the run ends
+    click.get_current_context().call_on_close(lambda: report_metrics(logger, metrics_out))
+
+    if record or replay:
+        response_cache = ResponseArchive(replay or record, replay=bool(replay))
+        click.get_current_context().call_on_close(response_cache.close)
+        if replay:
+            # Social clients refuse to start without credentials; replaying needs none
+            if 'twitter' in response_cache.sources:
+                Config.TWITTER_BEARER_TOKEN = Config.TWITTER_BEARER_TOKEN or 'replay'
+            if 'telegram' in response_cache.sources:
+                Config.TELEGRAM_BOT_TOKEN = Config.TELEGRAM_BOT_TOKEN or 'replay'
+    else:
+        response_cache = ResponseCache(refresh=refresh) if cache else None
+
+    store = None
+    if store_dir:
+        # pyarrow is only needed when the Parquet store is used
+        from src.report_store import ReportStore
+        store = ReportStore(store_dir)
+
+    if use_asyncio and len(tokens) > 1:
+        start = time.monotonic()
+        reports = asyncio.run(research_tokens_async(tokens, output_path, logger, response_cache, indent, compression))
+        if store:
+            store.append([report for report in reports if report])
+
+        failed = [token for token, report in zip(tokens, reports) if not report]
+        log_batch(tokens, failed, start, logger)
         return
 
-    # Save report
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    # One reporter (and its API clients) is shared by the whole list
+    reporter = Reporter(cache=response_cache)
 
-    filename = f"report_{chain}_{report.dex.token_symbol}_{report.timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-    filepath = output_path / filename
+    if len(tokens) == 1:
+        report = research_token(reporter, tokens[0][0], tokens[0][1], output_path, logger,
+                                indent=indent, compression=compression)
+        if store and report:
+            store.append([report])
+        return
 
-    with open(filepath, 'w') as f:
-        f.write(report.model_dump_json(indent=2))
+    start = time.monotonic()
+    failed = []
+    for i in range(0, len(tokens), MAX_ADDRESSES_PER_REQUEST):
+        chunk = tokens[i:i + MAX_ADDRESSES_PER_REQUEST]
 
-    logger.info(f"Report saved: {filepath}")
-    logger.info(f"Token: {report.dex.token_symbol} Price: ${report.dex.price_usd:.4f}")
+        # One DexScreener request per chunk; tokens it misses are looked up individually
+        token_infos = reporter.dex.research_tokens_batch(chunk)
+
+        reports = []
+        for address, token_chain in chunk:
+            report = research_token(reporter, address, token_chain, output_path, logger,
+                                    token_infos.get((address, token_chain)), indent, compression)
+            if report:
+                reports.append(report)
+            else:
+                failed.append((address, token_chain))
+
+        # One Parquet file per chunk and partition rather than one per report
+        if store:
+            store.append(reports)
+
+    log_batch(tokens, failed, start, logger)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,140 @@
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
+
+import click
+import numpy as np
+
+from src.report_io import find_report_files
+from src.schema import Report
+from src.utils import load_reports
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Alpha signal threshold for Liquidity Depth, in percent (token_metrics.md)
+LIQUIDITY_DEPTH_ALPHA = 10.0
+
+FLOW_WINDOWS = ('5m', '1h', '6h', '24h')
+
+# Metric input -> (path of attributes on a Report, flattened column from reports_to_frame)
+INPUTS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    'liquidity_usd': (('dex', 'liquidity_usd'), 'dex_liquidity_usd'),
+    'total_liquidity_usd': (('dex', 'total_liquidity_usd'), 'dex_total_liquidity_usd'),
+    'market_cap': (('dex', 'market_cap'), 'dex_market_cap'),
+    'fdv': (('dex', 'fdv'), 'dex_fdv'),
+    'price_usd': (('dex', 'price_usd'), 'dex_price_usd'),
+    'volume_24h': (('dex', 'volume_24h'), 'dex_volume_24h'),
+    'total_volume_24h': (('dex', 'total_volume_24h'), 'dex_total_volume_24h'),
+    'circulating_supply': (('coingecko', 'market_data', 'circulating_supply'),
+                           'coingecko_market_data_circulating_supply'),
+    'avg_engagement': (('twitter', 'metrics', 'avg_engagement'), 'twitter_metrics_avg_engagement'),
+    'avg_impressions': (('twitter', 'metrics', 'avg_impressions'), 'twitter_metrics_avg_impressions'),
+    **{f'{side}_{window}': (('dex', f'{side}_{window}'), f'dex_{side}_{window}')
+       for window in FLOW_WINDOWS for side in ('buys', 'sells')},
+}
+
+
+def _attr_path(obj, path: Tuple[str, ...]):
+    for name in path:
+        if obj is None:
+            return None
+        obj = getattr(obj, name, None)
+    return obj
+
+
+def _report_arrays(reports: Sequence[Report]) -> Dict[str, np.ndarray]:
+    """One float64 array per metric input, NaN where a report has no value."""
+    arrays = {}
+    for name, (path, _) in INPUTS.items():
+        values = (_attr_path(report, path) for report in reports)
+        arrays[name] = np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64,
+                                   count=len(reports))
+    return arrays
+
+
+def _frame_arrays(frame: 'pd.DataFrame') -> Dict[str, np.ndarray]:
+    """Metric inputs from a frame with report_columns() names; missing columns are all NaN."""
+    return {
+        name: (frame[column].to_numpy(dtype=np.float64, na_value=np.nan) if column in frame
+               else np.full(len(frame), np.nan))
+        for name, (_, column) in INPUTS.items()
+    }
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator, NaN where the denominator is not positive."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def _prefer(primary: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+    return np.where(primary > 0, primary, fallback)
+
+
+def compute_metrics_arrays(inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Compute every token_metrics.md metric the report fields support, over whole arrays.
+
+    - Turnover Rate: 24h volume / circulating market cap x 100. Volume is in
+      USD, so supply is valued at the current price.
+    - Liquidity Depth: pool liquidity / market cap x 100 (FDV when DexScreener
+      has no market cap), with the LD > 10% alpha signal.
+    - Net Flow Ratio: (buys - sells) / (buys + sells) per DexScreener window,
+      with transaction counts standing in for flows.
+    - Engagement Rate: (likes + replies + retweets) / impressions x 100 from
+      the recent-tweet averages.
+    """
+    liquidity = _prefer(inputs['total_liquidity_usd'], inputs['liquidity_usd'])
+    market_cap = _prefer(inputs['market_cap'], inputs['fdv'])
+    volume = _prefer(inputs['total_volume_24h'], inputs['volume_24h'])
+
+    liquidity_depth = _ratio(liquidity, market_cap) * 100
+    metrics = {
+        'turnover_rate': _ratio(volume, inputs['circulating_supply'] * inputs['price_usd']) * 100,
+        'liquidity_depth': liquidity_depth,
+        'liquidity_alpha': liquidity_depth > LIQUIDITY_DEPTH_ALPHA,
+    }
+    for window in FLOW_WINDOWS:
+        buys, sells = inputs[f'buys_{window}'], inputs[f'sells_{window}']
+        metrics[f'net_flow_ratio_{window}'] = _ratio(buys - sells, buys + sells)
+    metrics['engagement_rate'] = _ratio(inputs['avg_engagement'], inputs['avg_impressions']) * 100
+
+    return metrics
+
+
+def compute_metrics(data: Union[Sequence[Report], 'pd.DataFrame']) -> 'pd.DataFrame':
+    """Metrics for a batch of reports, or a frame built by reports_to_frame, one row per report."""
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        inputs = _frame_arrays(data)
+        keys = {column: data[column].to_numpy() for column in ('token_address', 'chain', 'timestamp') if column in data}
+    else:
+        inputs = _report_arrays(data)
+        keys = {
+            'token_address': [report.token_address for report in data],
+            'chain': [report.chain for report in data],
+            'timestamp': [report.timestamp for report in data],
+        }
+
+    return pd.DataFrame({**keys, **compute_metrics_arrays(inputs)})
+
+
+@click.command()
+@click.argument('reports_dir', type=click.Path(exists=True, file_okay=False))
+@click.option('--output', '-o', type=click.Path(), help='Write the metrics to this CSV instead of stdout')
+def main(reports_dir: str, output: Optional[str]):
+    """Compute token metrics for every report in REPORTS_DIR."""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    result = load_reports(find_report_files(reports_dir))
+    for error in result.errors:
+        logging.warning(f"Error loading {error.path}: {error.error}")
+
+    frame = compute_metrics(result.reports)
+    if output:
+        frame.to_csv(output, index=False)
+    else:
+        click.echo(frame.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second.
+
+    Up to `capacity` tokens accumulate while idle, so short bursts go out
+    immediately and sustained traffic is spread at `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            if now > self.updated_at:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+            # Tokens can go negative: each caller waits for its own slot
+            self.tokens -= 1
+            wait = max(0.0, self.updated_at - now)
+            if self.tokens < 0:
+                wait += -self.tokens / self.rate
+            return wait
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds`, e.g. after a 429 response."""
+        with self.lock:
+            until = time.monotonic() + seconds
+            if until > self.updated_at:
+                # Nothing accumulates while the host is telling us to back off
+                self.tokens = min(self.tokens, 0.0)
+                self.updated_at = until
@@ -0,0 +1,61 @@
+import gzip
+from pathlib import Path
+from typing import List, Optional, Union
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# File suffix for each supported compression codec
+COMPRESSION_SUFFIXES = {
+    None: '.json',
+    'gzip': '.json.gz',
+    'zstd': '.json.zst',
+}
+
+REPORT_GLOBS = tuple(f"report_*{suffix}" for suffix in COMPRESSION_SUFFIXES.values())
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd-compressed reports need the 'zstandard' package") from e
+    return zstandard
+
+
+def compress(data: bytes, compression: Optional[str] = None) -> bytes:
+    """Compress serialized report bytes with `compression` (None, 'gzip' or 'zstd')."""
+    if not compression:
+        return data
+    if compression == 'gzip':
+        return gzip.compress(data, mtime=0)
+    if compression == 'zstd':
+        return _zstandard().ZstdCompressor().compress(data)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress gzip or zstd bytes, detected by their magic number; plain JSON is returned as is."""
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    if data.startswith(ZSTD_MAGIC):
+        return _zstandard().ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+def read_report_bytes(path: Union[str, Path]) -> bytes:
+    """Raw JSON bytes of a report file, whatever its compression."""
+    with open(path, 'rb') as f:
+        return decompress(f.read())
+
+
+def report_suffix(compression: Optional[str] = None) -> str:
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    return COMPRESSION_SUFFIXES[compression]
+
+
+def find_report_files(directory: Union[str, Path]) -> List[Path]:
+    """Every report file in `directory`, compressed or not, sorted by name."""
+    directory = Path(directory)
+    return sorted(path for pattern in REPORT_GLOBS for path in directory.glob(pattern))
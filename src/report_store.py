@@ -0,0 +1,171 @@
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union, get_args, get_origin
+
+import click
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pydantic import BaseModel
+
+from src.report_io import find_report_files
+from src.schema import Report, unwrap_optional
+from src.utils import iter_reports
+
+PARTITION_SCHEMA = pa.schema([('chain', pa.string()), ('date', pa.string())])
+
+SCALAR_TYPES = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    datetime: pa.timestamp('us'),
+}
+
+
+def _arrow_field(annotation: Any) -> Any:
+    """Arrow type and value converter for a pydantic field annotation.
+
+    Nested models become structs, lists become list columns and dicts become
+    maps, so `recent_tweets`, `tickers` etc. stay nested. Fields typed `Any`
+    (or other unions) are stored as JSON strings.
+    """
+    annotation = unwrap_optional(annotation)
+    origin = get_origin(annotation)
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        fields = {name: _arrow_field(f.annotation) for name, f in annotation.model_fields.items()}
+        arrow_type = pa.struct([pa.field(name, t) for name, (t, _) in fields.items()])
+
+        def convert(value):
+            if value is None:
+                return None
+            return {name: conv(getattr(value, name)) for name, (_, conv) in fields.items()}
+        return arrow_type, convert
+
+    if origin in (list, List):
+        item_type, item_convert = _arrow_field(get_args(annotation)[0])
+        return pa.list_(item_type), lambda value: None if value is None else [item_convert(v) for v in value]
+
+    if origin in (dict, Dict):
+        value_type, value_convert = _arrow_field(get_args(annotation)[1])
+        return (pa.map_(pa.string(), value_type),
+                lambda value: None if value is None else [(str(k), value_convert(v)) for k, v in value.items()])
+
+    if annotation is datetime:
+        def convert(value):
+            if value is not None and value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return value
+        return pa.timestamp('us'), convert
+
+    if annotation in SCALAR_TYPES:
+        return SCALAR_TYPES[annotation], lambda value: value
+
+    return pa.string(), lambda value: None if value is None else json.dumps(value, default=str)
+
+
+def _report_layout() -> tuple:
+    fields = {name: _arrow_field(f.annotation) for name, f in Report.model_fields.items()}
+    schema = pa.schema([pa.field(name, t) for name, (t, _) in fields.items()] + [pa.field('date', pa.string())])
+    converters = {name: conv for name, (_, conv) in fields.items()}
+    return schema, converters
+
+
+REPORT_SCHEMA, _CONVERTERS = _report_layout()
+
+
+def report_to_row(report: Report) -> Dict[str, Any]:
+    """Convert a report into a row matching REPORT_SCHEMA"""
+    row = {name: convert(getattr(report, name)) for name, convert in _CONVERTERS.items()}
+    row['date'] = report.timestamp.date().isoformat()
+    return row
+
+
+class ReportStore:
+    """Parquet dataset of reports, hive-partitioned by chain and report date.
+
+    Every append writes new files under `chain=<chain>/date=<YYYY-MM-DD>/`, so
+    readers can prune partitions and push column and row filters down to the
+    Parquet scan instead of parsing every report JSON.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.partitioning = ds.partitioning(PARTITION_SCHEMA, flavor='hive')
+        self.logger = logging.getLogger(__name__)
+
+    def append(self, reports: Iterable[Report]) -> int:
+        """Append reports to the dataset and return how many were written"""
+        rows = [report_to_row(report) for report in reports]
+        if not rows:
+            return 0
+
+        table = pa.Table.from_pylist(rows, schema=REPORT_SCHEMA)
+        ds.write_dataset(
+            table,
+            self.root,
+            format='parquet',
+            partitioning=self.partitioning,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+        )
+        return len(rows)
+
+    def dataset(self) -> ds.Dataset:
+        return ds.dataset(self.root, schema=REPORT_SCHEMA, format='parquet', partitioning=self.partitioning)
+
+    def read(self, columns: Optional[List[str]] = None, filter: Optional[ds.Expression] = None,
+             chain: Optional[str] = None, start: Optional[datetime] = None,
+             end: Optional[datetime] = None) -> pa.Table:
+        """Read reports, pushing column selection and filters down to the scan.
+
+        `chain`, `start` and `end` are shortcuts that also prune partitions;
+        `filter` takes any pyarrow.dataset expression, e.g.
+        `ds.field('dex', 'liquidity_usd') > 100_000`.
+        """
+        expressions = [filter] if filter is not None else []
+        if chain:
+            expressions.append(ds.field('chain') == chain)
+        if start:
+            expressions.append(ds.field('date') >= start.date().isoformat())
+            expressions.append(ds.field('timestamp') >= pa.scalar(start, pa.timestamp('us')))
+        if end:
+            expressions.append(ds.field('date') <= end.date().isoformat())
+            expressions.append(ds.field('timestamp') <= pa.scalar(end, pa.timestamp('us')))
+
+        combined = None
+        for expression in expressions:
+            combined = expression if combined is None else combined & expression
+
+        if not self.root.exists():
+            return REPORT_SCHEMA.empty_table().select(columns) if columns else REPORT_SCHEMA.empty_table()
+        return self.dataset().to_table(columns=columns, filter=combined)
+
+
+@click.command()
+@click.argument('reports_dir', type=click.Path(exists=True, file_okay=False))
+@click.argument('store_dir', type=click.Path())
+@click.option('--batch-size', default=1000, help='Reports written per Parquet file')
+def main(reports_dir: str, store_dir: str, batch_size: int):
+    """Import every report JSON in REPORTS_DIR into the Parquet store at STORE_DIR."""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
+    store = ReportStore(store_dir)
+    reports = iter_reports(find_report_files(reports_dir))
+
+    total = 0
+    while True:
+        written = store.append(islice(reports, batch_size))
+        if not written:
+            break
+        total += written
+
+    logging.info(f"Imported {total} reports into {store_dir}")
+
+
+if __name__ == '__main__':
+    main()
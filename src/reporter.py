@@ -1,56 +1,217 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional
-from src.schema import Report
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Dict, List, Optional, Tuple
+from src.cache import ResponseCache
+from src.config import Config
+from src.instrumentation import metrics
+from src.schema import Report, DexScreenerInfo, SourceStatus
 from src.dexscreener import DexScreener
 from src.coingecko import CoinGecko
 from src.twitter import TwitterResearcher
 from src.telegram import TelegramResearcher
 from src.holder_researcher import HolderResearcher
+from src.sources import (
+    Source, SourceContext, DexSource, CoinGeckoSource, HoldersSource, TwitterSource, TelegramSource,
+    optional_client, OK, EMPTY, ERROR, TIMEOUT, SKIPPED, UNAVAILABLE,
+)
 
-class Reporter:
-    def __init__(self):
-        self.dex = DexScreener()
-        self.coingecko = CoinGecko()
-        self.twitter = TwitterResearcher()
-        self.telegram = TelegramResearcher()
-        self.holder_researcher = HolderResearcher()
+# Seconds between checks for queued sources that a worker has started
+QUEUE_POLL_INTERVAL = 0.05
+
+class BaseReporter:
+    """Dependency scheduling and report assembly shared by Reporter and AsyncReporter."""
+
+    def __init__(self, sources: List[Source], source_timeout: float = Config.SOURCE_TIMEOUT):
+        names = {source.name for source in sources}
+        for source in sources:
+            unknown = set(source.deps) - names
+            if unknown:
+                raise ValueError(f"Source {source.name} depends on unknown sources: {', '.join(sorted(unknown))}")
+        try:
+            TopologicalSorter({source.name: source.deps for source in sources}).prepare()
+        except CycleError as e:
+            raise ValueError(f"Sources depend on each other in a cycle: {' -> '.join(e.args[1])}") from None
+        self.sources = sources
+        self.source_timeout = source_timeout
         self.logger = logging.getLogger(__name__)
 
-    def generate_report(self, token_address: str, chain: str) -> Optional[Report]:
-        """Generate a complete report for a token."""
+    def default_sources(self) -> List[Source]:
+        return [
+            DexSource(self.dex),
+            CoinGeckoSource(self.coingecko),
+            HoldersSource(self.holder_researcher),
+            TwitterSource(self.twitter),
+            TelegramSource(self.telegram),
+        ]
+
+    def _prepare(self, context: SourceContext, statuses: Dict[str, SourceStatus]) -> List[Source]:
+        """Sources whose dependencies are settled and that should run now.
+
+        Sources depending on one without data are marked skipped instead.
+        """
+        ready = []
+        for source in self.sources:
+            if source.name in statuses or not all(dep in statuses for dep in source.deps):
+                continue
+
+            missing = [dep for dep in source.deps if context.results.get(dep) is None]
+            if missing:
+                statuses[source.name] = SourceStatus(status=SKIPPED, error=f"No data from {', '.join(missing)}")
+                context.results[source.name] = None
+            else:
+                ready.append(source)
+        return ready
+
+    def _unavailable(self, context: SourceContext) -> Dict[str, SourceStatus]:
+        statuses = {}
+        for source in self.sources:
+            if not source.available:
+                statuses[source.name] = SourceStatus(status=UNAVAILABLE)
+                context.results[source.name] = None
+        return statuses
+
+    def record_statuses(self, statuses: Dict[str, SourceStatus]) -> None:
+        """Add each source's outcome and time to the metrics registry."""
+        for name, status in statuses.items():
+            metrics.incr('source_status_total', source=name, status=status.status)
+            if status.elapsed is not None:
+                metrics.observe('source_seconds', status.elapsed, source=name)
+
+    def build_report(self, context: SourceContext, statuses: Dict[str, SourceStatus]) -> Optional[Report]:
+        """Assemble the report from the source results, or None without DexScreener data."""
+        if statuses.get('dex') and statuses['dex'].status == EMPTY:
+            self.logger.info(f"No DexScreener data for {context.token_address} on {context.chain}")
+            return None
+
+        fields = {}
+        for source in self.sources:
+            result = context.results.get(source.name)
+            if result is not None:
+                fields.update(source.report_fields(result))
+
+        return Report(
+            token_address=context.token_address,
+            chain=context.chain,
+            timestamp=datetime.now(),
+            sources={source.name: statuses[source.name] for source in self.sources},
+            **fields
+        )
+
+
+class Reporter(BaseReporter):
+    def __init__(self, concurrent: bool = Config.REPORTER_CONCURRENT,
+                 source_timeout: float = Config.SOURCE_TIMEOUT,
+                 max_workers: int = Config.REPORTER_MAX_WORKERS,
+                 cache: Optional[ResponseCache] = None,
+                 sources: Optional[List[Source]] = None):
+        self.dex = DexScreener(cache=cache)
+        self.coingecko = CoinGecko(cache=cache)
+        # Social sources need API tokens; without one they are reported as unavailable
+        self.twitter = optional_client(TwitterResearcher, cache=cache)
+        self.telegram = optional_client(TelegramResearcher, cache=cache)
+        self.holder_researcher = HolderResearcher(cache=cache)
+        super().__init__(sources if sources is not None else self.default_sources(), source_timeout)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers) if concurrent else None
+
+    def _run_source(self, source: Source, context: SourceContext) -> Tuple[Any, SourceStatus]:
+        """Fetch one source, turning exceptions into an error status."""
+        start = time.monotonic()
+        try:
+            result = source.fetch(context)
+        except Exception as e:
+            self.logger.warning(f"Source {source.name} failed for {context.token_address}: {e}")
+            return None, SourceStatus(status=ERROR, error=str(e), elapsed=time.monotonic() - start)
+
+        return result, SourceStatus(status=OK if result is not None else EMPTY, elapsed=time.monotonic() - start)
+
+    def _run_sequential(self, context: SourceContext) -> Dict[str, SourceStatus]:
+        """Run every source one after another in dependency order."""
+        statuses = self._unavailable(context)
+        while len(statuses) < len(self.sources):
+            for source in self._prepare(context, statuses):
+                context.results[source.name], statuses[source.name] = self._run_source(source, context)
+        return statuses
+
+    def _run_started(self, source: Source, context: SourceContext,
+                     started: Dict[str, float]) -> Tuple[Any, SourceStatus]:
+        started[source.name] = time.monotonic()
+        return self._run_source(source, context)
+
+    def _run_concurrent(self, context: SourceContext) -> Dict[str, SourceStatus]:
+        """Run sources on the thread pool as soon as their dependencies are done.
+
+        A source that runs longer than `source_timeout` is given a timeout
+        status and no result, so the sources depending on it are skipped. The
+        clock starts when a worker picks the source up, not while it waits in
+        the pool's queue. Threads cannot be interrupted, so a timed-out
+        source keeps its worker until its current call returns (every HTTP
+        request is bounded by the client's timeout); its result is discarded
+        and it is counted in `source_abandoned_total`.
+        """
+        statuses = self._unavailable(context)
+        pending = {}  # future -> source
+        started = {}  # source name -> when a worker started it
+
+        while len(statuses) < len(self.sources):
+            running = {source.name for source in pending.values()}
+            for source in self._prepare(context, statuses):
+                if source.name not in running:
+                    snapshot = replace(context, results=dict(context.results))
+                    pending[self.executor.submit(self._run_started, source, snapshot, started)] = source
+
+            if not pending:
+                continue
+
+            deadlines = [started[source.name] + self.source_timeout
+                         for source in pending.values() if source.name in started]
+            timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            if len(deadlines) < len(pending):
+                # Queued sources get a deadline once they start; check for that regularly
+                timeout = QUEUE_POLL_INTERVAL if timeout is None else min(timeout, QUEUE_POLL_INTERVAL)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                source = pending.pop(future)
+                context.results[source.name], statuses[source.name] = future.result()
+
+            now = time.monotonic()
+            for future, source in list(pending.items()):
+                start = started.get(source.name)
+                if start is not None and now - start >= self.source_timeout:
+                    self.logger.warning(f"Source {source.name} timed out after {self.source_timeout}s")
+                    metrics.incr('source_abandoned_total', source=source.name)
+                    del pending[future]
+                    context.results[source.name] = None
+                    statuses[source.name] = SourceStatus(status=TIMEOUT, elapsed=now - start)
+
+        return statuses
+
+    def generate_report(self, token_address: str, chain: str,
+                        token_info: Optional[DexScreenerInfo] = None) -> Optional[Report]:
+        """Generate a report for a token from whichever sources respond.
+
+        `token_info` may carry DexScreener data already fetched for the token
+        (e.g. by `DexScreener.research_tokens_batch`) to skip that lookup.
+        Sources that fail, time out or are not configured leave their fields
+        empty and are recorded in `Report.sources`. No report is produced
+        when DexScreener does not know the token.
+        """
+        context = SourceContext(token_address, chain, token_info)
         try:
-            token_info = self.dex.research_tokens(token_address)
-            if not token_info:
-                return None
-
-            assert token_info.chain == chain
-            coingecko_data = self.coingecko.get_coin_info(token_address, chain)
-
-            twitter_data = None
-            twitter_handle = coingecko_data.links.twitter_screen_name
-            if twitter_handle:
-                twitter_data = self.twitter.get_twitter_info(twitter_handle)
-
-            telegram_data = None
-            telegram_handle = coingecko_data.links.telegram_channel_identifier
-            if telegram_handle:
-                telegram_data = self.telegram.get_channel_info(telegram_handle)
-
-            num_holders = self.holder_researcher.get_holders(token_address, chain)
-            # Combine all data
-            report = Report(
-                token_address=token_address,
-                chain=chain,
-                timestamp=datetime.now(),
-                num_holders=num_holders,
-                dex=token_info,
-                coingecko=coingecko_data,
-                twitter=twitter_data,
-                telegram=telegram_data
-            )
-            return report
+            with metrics.timer('report_seconds'):
+                if self.executor:
+                    statuses = self._run_concurrent(context)
+                else:
+                    statuses = self._run_sequential(context)
+            self.record_statuses(statuses)
+            return self.build_report(context, statuses)
 
         except Exception as e:
+            metrics.incr('report_errors_total', error=type(e).__name__)
             self.logger.error(f"Error generating report: {str(e)}")
-            return None
\ No newline at end of file
+            return None
@@ -1,12 +1,22 @@
+import types
 from pydantic import BaseModel, Field, model_validator
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, get_args, get_origin
 from datetime import datetime
 from typing import Optional, Dict, List
 from typing import List, Optional, Dict, Union
-import json
 from pathlib import Path
 from dataclasses import dataclass, field
 from pydantic import validator
+from src.report_io import compress, read_report_bytes
+
+
+def unwrap_optional(annotation: Any) -> Any:
+    """Return X for an Optional[X] field annotation, otherwise the annotation unchanged."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
 
 
 # Twitter models
@@ -211,6 +221,9 @@ class CoingeckoReport(BaseModel):
     def validate_data(cls, values):
         if not isinstance(values, dict):
             return values
+        # Older reports kept CoinGecko's localized {'en': ...} description
+        if isinstance(values.get('description'), dict):
+            values = {**values, 'description': values['description'].get('en', '')}
         return values
 
 ###################### DexScreener models ######################
@@ -262,6 +275,17 @@ class DexScreenerInfo(BaseModel):
     total_txns_24h: int = 0
     volume_24h: float = 0.0
 
+    # Aggregates across all of the token's pools on the chain
+    pair_count: int = 0
+    total_liquidity_usd: float = 0.0
+    total_volume_24h: float = 0.0
+
+
+class SourceStatus(BaseModel):
+    # ok, empty (no data), error, timeout, skipped (a dependency had no data) or unavailable (not configured)
+    status: str
+    error: Optional[str] = None
+    elapsed: Optional[float] = None
 
 class Report(BaseModel):
     token_address: str
@@ -269,22 +293,34 @@ class Report(BaseModel):
     timestamp: datetime
     num_holders: int = 0
 
+    # Holder concentration (Solscan)
+    holders_analyzed: int = 0
+    gini_coefficient: Optional[float] = None
+    top10_holder_concentration: Optional[float] = None
+    top20_holder_concentration: Optional[float] = None
+
     # DexScreener data
-    dex: DexScreenerInfo
+    dex: Optional[DexScreenerInfo] = None
 
     # CoinGecko data
-    coingecko: CoingeckoReport
+    coingecko: Optional[CoingeckoReport] = None
 
     # Social data
     twitter: Optional[TwitterResponse] = None
     telegram: Optional[TelegramChannel] = None
 
+    # Outcome of each data source, keyed by source name
+    sources: Dict[str, SourceStatus] = Field(default_factory=dict)
+
     @classmethod
     def from_json(cls, json_path: Union[str, Path]) -> 'Report':
-        """Load a TokenReport from a JSON file"""
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-            # Convert string timestamp back to datetime if needed
-            if isinstance(data.get('timestamp'), str):
-                data['timestamp'] = datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
-            return cls(**data)
+        """Load a TokenReport from a JSON file (plain, gzip or zstd)
+
+        The raw bytes are validated directly by pydantic, which also parses
+        ISO timestamps with a 'Z' suffix.
+        """
+        return cls.model_validate_json(read_report_bytes(json_path))
+
+    def to_json_bytes(self, indent: Optional[int] = None, compression: Optional[str] = None) -> bytes:
+        """Serialize the report; no indent gives the compact format"""
+        return compress(self.model_dump_json(indent=indent or None).encode(), compression)
@@ -1,8 +1,10 @@
 import logging
 from pydantic import BaseModel
-from typing import Optional
-import requests
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from src.api import ApiClient, ApiRequest
 from src.config import Config
+from src.cache import ResponseCache
+from src.http_client import HttpClient, get_http_client
 
 
 class TokenMetadata(BaseModel):
@@ -27,29 +29,66 @@ class TokenMetadata(BaseModel):
     price_change_24h: float
 
 
-class Solscan:
-    def __init__(self):
+# Largest page size the token holders endpoint accepts
+HOLDERS_PAGE_SIZE = 40
+
+
+def solscan_data(response: Any) -> Any:
+    response.raise_for_status()
+    return response.json()['data']
+
+
+class Solscan(ApiClient):
+    def __init__(self, http: Optional[HttpClient] = None, cache: Optional[ResponseCache] = None):
+        self.http = http or get_http_client()
+        self.cache = cache
         self.api_key = Config.SOLSCAN_API_KEY
-        self.base_url = "https://pro-api.solscan.io/v2.0"
+        self.base_url = Config.SOLSCAN_BASE_URL
         self.headers = {"token": self.api_key}
 
+    def meta_request(self, token_address: str) -> ApiRequest:
+        params = {'address': token_address}
+        return ApiRequest('solscan', 'token/meta', params, args=(f"{self.base_url}/token/meta",),
+                          kwargs={'params': params, 'headers': self.headers}, payload=solscan_data)
 
-    def get_token_metadata(self, token_address: str) -> Optional[TokenMetadata]:
-        try:
-            url = f"{self.base_url}/token/meta?address={token_address}"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()  # Raises an HTTPError for bad responses
-            data = response.json()
-
-            token_metadata = TokenMetadata.model_validate(data['data'])
-            return token_metadata
+    def holders_request(self, token_address: str, page: int) -> ApiRequest:
+        params = {"address": token_address, "page": page, "page_size": HOLDERS_PAGE_SIZE}
+        return ApiRequest('solscan', 'token/holders', params, args=(f"{self.base_url}/token/holders",),
+                          kwargs={'params': params, 'headers': self.headers}, payload=solscan_data)
 
-        except requests.RequestException as e:
-            logging.info(f"API request failed: {e}")
-            return None
-        except KeyError as e:
-            logging.info(f"Invalid response format: {e}")
+    @staticmethod
+    def parse_metadata(data: Optional[Dict]) -> Optional[TokenMetadata]:
+        if not data:
             return None
+        try:
+            return TokenMetadata.model_validate(data)
         except Exception as e:
-            logging.info(f"Unexpected error: {e}")
-            return None
\ No newline at end of file
+            logging.info(f"Invalid token metadata: {e}")
+            return None
+
+    @staticmethod
+    def holders_page(data: Optional[Dict]) -> Tuple[int, List[Dict]]:
+        """(total holder count, holders) of a holders payload."""
+        data = data or {}
+        return data.get('total', 0), data.get('items') or []
+
+    def get_token_metadata(self, token_address: str) -> Optional[TokenMetadata]:
+        return self.parse_metadata(self.request(self.meta_request(token_address)))
+
+    def iter_token_holders(self, token_address: str) -> Iterator[Tuple[int, List[Dict]]]:
+        """Yield (total holder count, page of holders) for each page, largest holders first.
+
+        Only one page is held at a time, so callers can stream holders of
+        tokens with hundreds of thousands of accounts.
+        """
+        page = 1
+        while True:
+            total, items = self.holders_page(self.fetch(self.holders_request(token_address, page)))
+            if not items:
+                return
+
+            yield total, items
+
+            if len(items) < HOLDERS_PAGE_SIZE:
+                return
+            page += 1
@@ -0,0 +1,104 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.schema import DexScreenerInfo
+
+# Source statuses recorded in Report.sources
+OK = 'ok'
+EMPTY = 'empty'
+ERROR = 'error'
+TIMEOUT = 'timeout'
+SKIPPED = 'skipped'
+UNAVAILABLE = 'unavailable'
+
+
+@dataclass
+class SourceContext:
+    """What a source gets to work with: the token and the results of its dependencies."""
+    token_address: str
+    chain: str
+    token_info: Optional[DexScreenerInfo] = None  # DexScreener data prefetched by a batch lookup
+    results: Dict[str, Any] = field(default_factory=dict)
+
+
+class Source:
+    """A data source of a report.
+
+    Subclasses set `name`, the names of the sources they depend on (`deps`),
+    and implement `fetch`, returning None when there is no data.
+    `report_fields` maps a result onto Report fields. A source whose client
+    could not be built (e.g. a missing API token) is unavailable and not run.
+    """
+
+    name: str = ''
+    deps: Tuple[str, ...] = ()
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    @property
+    def available(self) -> bool:
+        return self.client is not None
+
+    def fetch(self, context: SourceContext) -> Any:
+        raise NotImplementedError
+
+    def report_fields(self, result: Any) -> Dict[str, Any]:
+        return {self.name: result}
+
+
+class DexSource(Source):
+    name = 'dex'
+
+    def fetch(self, context: SourceContext) -> Any:
+        token_info = context.token_info
+        if token_info is not None and token_info.chain == context.chain:
+            return token_info
+        return self.client.research_tokens(context.token_address, context.chain)
+
+
+class CoinGeckoSource(Source):
+    name = 'coingecko'
+
+    def fetch(self, context: SourceContext) -> Any:
+        return self.client.get_coin_info(context.token_address, context.chain)
+
+
+class HoldersSource(Source):
+    name = 'holders'
+
+    def fetch(self, context: SourceContext) -> Any:
+        return self.client.get_holder_distribution(context.token_address, context.chain)
+
+    def report_fields(self, result: Any) -> Dict[str, Any]:
+        return result.model_dump()
+
+
+class TwitterSource(Source):
+    name = 'twitter'
+    deps = ('coingecko',)
+
+    def fetch(self, context: SourceContext) -> Any:
+        links = context.results['coingecko'].links
+        handle = links.twitter_screen_name if links else None
+        return self.client.get_twitter_info(handle) if handle else None
+
+
+class TelegramSource(Source):
+    name = 'telegram'
+    deps = ('coingecko',)
+
+    def fetch(self, context: SourceContext) -> Any:
+        links = context.results['coingecko'].links
+        handle = links.telegram_channel_identifier if links else None
+        return self.client.get_channel_info(handle) if handle else None
+
+
+def optional_client(factory: Callable[..., Any], *args, **kwargs) -> Optional[Any]:
+    """Build a source client, or return None (source unavailable) if it cannot be configured."""
+    try:
+        return factory(*args, **kwargs)
+    except Exception as e:
+        name = getattr(factory, '__name__', repr(factory))
+        logging.getLogger(__name__).warning(f"{name} unavailable: {e}")
+        return None
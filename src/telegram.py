@@ -1,41 +1,48 @@
 import logging
-import requests
-from typing import Optional
+from typing import Any, Dict, Optional
+from src.api import ApiClient, ApiRequest
 from src.config import Config
+from src.cache import ResponseCache
+from src.coalesce import coalesced
+from src.http_client import HttpClient, get_http_client
 from src.schema import TelegramChannel
 
-class TelegramResearcher:
-    def __init__(self, bot_token: str = None):
+
+def ok_payload(response: Any) -> Optional[Dict]:
+    """The Bot API response, or None when it reports a failure (e.g. an unknown chat)."""
+    data = response.json()
+    return data if data.get('ok') else None
+
+
+class TelegramResearcher(ApiClient):
+    def __init__(self, bot_token: str = None, http: Optional[HttpClient] = None,
+                 cache: Optional[ResponseCache] = None):
         self.bot_token = bot_token or Config.TELEGRAM_BOT_TOKEN
         if not self.bot_token:
             raise ValueError("Telegram bot token is required")
 
+        self.http = http or get_http_client()
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
-        self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self.base_url = f"{Config.TELEGRAM_BASE_URL}/bot{self.bot_token}"
+
+    def member_count_request(self, telegram_handle: str) -> ApiRequest:
+        params = {"chat_id": f"@{telegram_handle}"}
+        return ApiRequest('telegram', 'getChatMemberCount', params,
+                          args=(f"{self.base_url}/getChatMemberCount",), kwargs={'params': params},
+                          payload=ok_payload)
+
+    @staticmethod
+    def parse_channel(telegram_handle: str, data: Optional[Dict]) -> Optional[TelegramChannel]:
+        if not data:
+            return None
+        return TelegramChannel(telegram_handle=telegram_handle, member_count=data['result'])
 
+    @coalesced
     def get_channel_info(self, telegram_handle: str) -> Optional[TelegramChannel]:
         """Get Telegram channel information."""
         if not telegram_handle:
             return None
 
-        try:
-            # Clean handle and prepare URL
-            telegram_handle = telegram_handle.replace('@', '')
-            url = f"{self.base_url}/getChatMemberCount"
-            params = {"chat_id": f"@{telegram_handle}"}
-
-            # Make API request
-            response = requests.get(url, params=params)
-            data = response.json()
-
-            if not data.get('ok'):
-                return None
-
-            return TelegramChannel(
-                telegram_handle=telegram_handle,
-                member_count=data['result']
-            )
-
-        except Exception as e:
-            self.logger.error(f"Error getting Telegram info: {str(e)}")
-            return None
\ No newline at end of file
+        telegram_handle = telegram_handle.replace('@', '')
+        return self.parse_channel(telegram_handle, self.request(self.member_count_request(telegram_handle)))
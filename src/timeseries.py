@@ -0,0 +1,403 @@
+import json
+import logging
+import math
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import click
+import numpy as np
+from pydantic import BaseModel
+
+from src.schema import DexScreenerInfo
+
+# One fixed-size record per token per poll, appended to snapshots.bin
+SNAPSHOT_DTYPE = np.dtype([
+    ('timestamp', '<f8'),  # epoch seconds
+    ('token', '<u4'),      # index into tokens.json
+    ('price_usd', '<f8'),
+    ('liquidity_usd', '<f8'),
+    ('market_cap', '<f8'),
+    ('volume_24h', '<f8'),
+    ('buys_24h', '<u4'),
+    ('sells_24h', '<u4'),
+    ('price_change_24h', '<f4'),
+])
+
+DAY = 86400
+
+# Rolling window name -> (span, bucket size) in seconds
+WINDOWS = {
+    '24h': (DAY, 300),
+    '7d': (7 * DAY, 3600),
+    '30d': (30 * DAY, 3 * 3600),
+}
+HISTORY = max(span for span, _ in WINDOWS.values())
+
+# Records appended between checkpoints of the tracker state; opening a store
+# replays at most this many records
+CHECKPOINT_EVERY = 100_000
+
+# TokenTracker and RollingWindow state saved in checkpoints (None is stored as NaN)
+TRACKER_FIELDS = ('last_timestamp', 'last_price', 'day', 'day_close', 'prev_close', 'up_days', 'streak_base')
+WINDOW_FIELDS = ('ids', 'open', 'high', 'low', 'count', 'ret_sum', 'ret_sq')
+
+
+class WindowMetrics(BaseModel):
+    price_change_pct: float
+    high: float
+    low: float
+    volatility: float  # standard deviation of log returns between snapshots
+    samples: int
+
+
+class TokenMetrics(BaseModel):
+    token_address: str
+    chain: str
+    timestamp: datetime
+    price_usd: float
+    # Continuous Price Increase: consecutive days closing above the previous day, and the product of their ratios
+    price_up_days: int = 0
+    cpi: float = 1.0
+    windows: Dict[str, WindowMetrics] = {}
+
+
+class RollingWindow:
+    """Price statistics over the last `span` seconds, kept in a ring of fixed-size buckets.
+
+    Each update touches one bucket, so the cost per snapshot does not depend on
+    how much history the window covers; a summary reads at most span / bucket
+    buckets.
+    """
+
+    def __init__(self, span: int, bucket: int):
+        self.bucket = bucket
+        self.size = span // bucket
+        self.ids = np.full(self.size, -1, dtype=np.int64)
+        self.open = np.zeros(self.size)
+        self.high = np.zeros(self.size)
+        self.low = np.zeros(self.size)
+        self.count = np.zeros(self.size, dtype=np.int64)
+        self.ret_sum = np.zeros(self.size)
+        self.ret_sq = np.zeros(self.size)
+
+    def update(self, timestamp: float, price: float, log_return: Optional[float]) -> None:
+        bucket_id = int(timestamp // self.bucket)
+        slot = bucket_id % self.size
+
+        if self.ids[slot] != bucket_id:
+            # The slot still holds a bucket that has left the window
+            self.ids[slot] = bucket_id
+            self.open[slot] = self.high[slot] = self.low[slot] = price
+            self.count[slot] = 0
+            self.ret_sum[slot] = self.ret_sq[slot] = 0.0
+        else:
+            self.high[slot] = max(self.high[slot], price)
+            self.low[slot] = min(self.low[slot], price)
+
+        self.count[slot] += 1
+        if log_return is not None:
+            self.ret_sum[slot] += log_return
+            self.ret_sq[slot] += log_return * log_return
+
+    def summary(self, timestamp: float, price: float) -> Optional[WindowMetrics]:
+        newest = int(timestamp // self.bucket)
+        valid = (self.ids > newest - self.size) & (self.ids <= newest)
+        if not valid.any():
+            return None
+
+        ids = np.where(valid, self.ids, np.iinfo(np.int64).max)
+        oldest = int(np.argmin(ids))
+
+        n = int(self.count[valid].sum())
+        mean = self.ret_sum[valid].sum() / n
+        variance = max(self.ret_sq[valid].sum() / n - mean * mean, 0.0)
+
+        return WindowMetrics(
+            price_change_pct=(price / self.open[oldest] - 1) * 100 if self.open[oldest] else 0.0,
+            high=float(self.high[valid].max()),
+            low=float(self.low[valid].min()),
+            volatility=math.sqrt(variance),
+            samples=n,
+        )
+
+
+class TokenTracker:
+    """Rolling metrics of one token, updated one snapshot at a time."""
+
+    def __init__(self):
+        self.windows = {name: RollingWindow(span, bucket) for name, (span, bucket) in WINDOWS.items()}
+        self.last_timestamp: Optional[float] = None
+        self.last_price = 0.0
+
+        # Daily closes for Continuous Price Increase
+        self.day: Optional[int] = None
+        self.day_close = 0.0
+        self.prev_close: Optional[float] = None
+        self.up_days = 0
+        self.streak_base: Optional[float] = None  # close of the day before the streak started
+
+    def _close_day(self) -> None:
+        if self.prev_close is not None and self.day_close > self.prev_close:
+            if not self.up_days:
+                self.streak_base = self.prev_close
+            self.up_days += 1
+        else:
+            self.up_days = 0
+            self.streak_base = None
+        self.prev_close = self.day_close
+
+    def update(self, timestamp: float, price: float) -> None:
+        if price <= 0 or (self.last_timestamp is not None and timestamp < self.last_timestamp):
+            return
+
+        log_return = math.log(price / self.last_price) if self.last_price > 0 else None
+        for window in self.windows.values():
+            window.update(timestamp, price, log_return)
+
+        day = int(timestamp // DAY)
+        if self.day is not None and day != self.day:
+            self._close_day()
+        self.day = day
+        self.day_close = price
+
+        self.last_timestamp = timestamp
+        self.last_price = price
+
+    def state(self) -> Dict[str, float]:
+        return {name: math.nan if getattr(self, name) is None else getattr(self, name) for name in TRACKER_FIELDS}
+
+    def load_state(self, state: Dict[str, float]) -> None:
+        for name, value in state.items():
+            if math.isnan(value):
+                value = None
+            elif name in ('day', 'up_days'):
+                value = int(value)
+            setattr(self, name, value)
+
+    def price_increase(self) -> Tuple[int, float]:
+        """Consecutive up days (counting today so far) and the CPI product over them."""
+        if self.prev_close is None or self.day_close <= self.prev_close:
+            return 0, 1.0
+        base = self.streak_base if self.up_days else self.prev_close
+        # The product of P_i / P_i-1 over the streak telescopes to close / base
+        return self.up_days + 1, self.day_close / base
+
+
+class SnapshotStore:
+    """Append-only store of DexScreener snapshots with incrementally updated metrics.
+
+    Snapshots are fixed-size SNAPSHOT_DTYPE records appended to
+    `snapshots.bin` and read back through a memory map, so millions of them
+    cost tens of bytes each on disk and nothing in memory until read. Rolling
+    24h/7d/30d metrics are updated as snapshots arrive. Their state is saved
+    to `checkpoint.npz` every `checkpoint_every` records and on `close()`, so
+    opening a store only replays the records written after the checkpoint.
+    """
+
+    def __init__(self, root: Union[str, Path], checkpoint_every: int = CHECKPOINT_EVERY):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.root / 'snapshots.bin'
+        self.tokens_path = self.root / 'tokens.json'
+        self.checkpoint_path = self.root / 'checkpoint.npz'
+        self.checkpoint_every = checkpoint_every
+        self.logger = logging.getLogger(__name__)
+
+        self.tokens: List[Tuple[str, str]] = []
+        if self.tokens_path.exists():
+            self.tokens = [tuple(token) for token in json.loads(self.tokens_path.read_text())]
+        self.token_ids = {token: i for i, token in enumerate(self.tokens)}
+        self.trackers: Dict[int, TokenTracker] = {}
+        self._truncate_torn_record()
+        self.offset = 0  # records reflected in the trackers
+        self.checkpoint_offset = 0
+        self._replay()
+
+    def __len__(self) -> int:
+        if not self.data_path.exists():
+            return 0
+        # A record cut short by a crash is ignored
+        return self.data_path.stat().st_size // SNAPSHOT_DTYPE.itemsize
+
+    def _token_id(self, token_address: str, chain: str) -> int:
+        token = (token_address, chain)
+        if token not in self.token_ids:
+            self.token_ids[token] = len(self.tokens)
+            self.tokens.append(token)
+        return self.token_ids[token]
+
+    def _track(self, records: np.ndarray) -> None:
+        for timestamp, token, price in zip(records['timestamp'].tolist(), records['token'].tolist(),
+                                           records['price_usd'].tolist()):
+            tracker = self.trackers.get(token)
+            if tracker is None:
+                tracker = self.trackers[token] = TokenTracker()
+            tracker.update(timestamp, price)
+
+    def _truncate_torn_record(self) -> None:
+        """Drop a record cut short by a crash, so later appends stay aligned."""
+        size = len(self) * SNAPSHOT_DTYPE.itemsize
+        if self.data_path.exists() and self.data_path.stat().st_size != size:
+            self.logger.warning(f"Truncating a partial record at the end of {self.data_path}")
+            with open(self.data_path, 'r+b') as f:
+                f.truncate(size)
+
+    def _replay(self) -> None:
+        """Restore the trackers from the checkpoint, then replay the records after it."""
+        count = len(self)
+        self._load_checkpoint(count)
+
+        start = datetime.fromtimestamp(time.time() - HISTORY)
+        records = self.read(start=start, offset=self.offset)
+        self._track(np.sort(records, order='timestamp', kind='stable'))
+        self.offset = count
+
+    def _load_checkpoint(self, count: int) -> None:
+        if not self.checkpoint_path.exists():
+            return
+
+        try:
+            with np.load(self.checkpoint_path) as npz:
+                checkpoint = dict(npz)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable {self.checkpoint_path}: {e}")
+            return
+
+        offset = int(checkpoint['offset'])
+        if offset > count:
+            self.logger.warning(f"Ignoring {self.checkpoint_path}: it is ahead of {self.data_path}")
+            return
+
+        cutoff = time.time() - HISTORY
+        for i, token in enumerate(checkpoint['token'].tolist()):
+            tracker = TokenTracker()
+            tracker.load_state({name: float(checkpoint[name][i]) for name in TRACKER_FIELDS})
+            # Tokens without snapshots in the last 30 days have no metrics
+            if tracker.last_timestamp is None or tracker.last_timestamp < cutoff:
+                continue
+            for window_name, window in tracker.windows.items():
+                for name in WINDOW_FIELDS:
+                    getattr(window, name)[:] = checkpoint[f'{window_name}_{name}'][i]
+            self.trackers[token] = tracker
+
+        self.offset = self.checkpoint_offset = offset
+
+    def checkpoint(self) -> None:
+        """Save the tracker state and the number of records it covers."""
+        tokens = sorted(self.trackers)
+        trackers = [self.trackers[token] for token in tokens]
+        states = [tracker.state() for tracker in trackers]
+        arrays = {'offset': np.int64(self.offset), 'token': np.array(tokens, dtype=np.int64)}
+        for name in TRACKER_FIELDS:
+            arrays[name] = np.array([state[name] for state in states], dtype=np.float64)
+        for window_name, (span, bucket) in WINDOWS.items():
+            for name in WINDOW_FIELDS:
+                rows = [getattr(tracker.windows[window_name], name) for tracker in trackers]
+                arrays[f'{window_name}_{name}'] = np.stack(rows) if rows else np.zeros((0, span // bucket))
+
+        # Written aside and renamed, so a crash leaves the previous checkpoint intact
+        tmp_path = self.checkpoint_path.with_name('checkpoint.tmp.npz')
+        np.savez(tmp_path, **arrays)
+        tmp_path.replace(self.checkpoint_path)
+        self.checkpoint_offset = self.offset
+
+    def close(self) -> None:
+        if self.offset != self.checkpoint_offset:
+            self.checkpoint()
+
+    def append(self, infos: Iterable[DexScreenerInfo]) -> int:
+        """Append one record per snapshot and update the token metrics; returns the number appended."""
+        infos = list(infos)
+        if not infos:
+            return 0
+
+        known = len(self.tokens)
+        records = np.zeros(len(infos), dtype=SNAPSHOT_DTYPE)
+        for i, info in enumerate(infos):
+            records[i] = (
+                info.timestamp.timestamp(), self._token_id(info.token_address, info.chain),
+                info.price_usd, info.liquidity_usd, info.market_cap, info.volume_24h,
+                info.buys_24h, info.sells_24h, info.price_change_24h,
+            )
+
+        # New token ids are written before the records that use them
+        if len(self.tokens) > known:
+            tmp_path = self.tokens_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(self.tokens))
+            tmp_path.replace(self.tokens_path)
+
+        with open(self.data_path, 'ab') as f:
+            records.tofile(f)
+
+        self._track(records)
+        self.offset += len(records)
+        if self.offset - self.checkpoint_offset >= self.checkpoint_every:
+            self.checkpoint()
+        return len(records)
+
+    def read(self, token_address: Optional[str] = None, chain: Optional[str] = None,
+             start: Optional[datetime] = None, end: Optional[datetime] = None, offset: int = 0) -> np.ndarray:
+        """Snapshot records, optionally for one token (and chain) and time range, from record `offset` on."""
+        count = len(self) - offset
+        if count <= 0:
+            return np.zeros(0, dtype=SNAPSHOT_DTYPE)
+
+        data = np.memmap(self.data_path, dtype=SNAPSHOT_DTYPE, mode='r', shape=(count,),
+                         offset=offset * SNAPSHOT_DTYPE.itemsize)
+        mask = np.ones(count, dtype=bool)
+        if token_address or chain:
+            ids = [i for i, (address, token_chain) in enumerate(self.tokens)
+                   if (not token_address or address == token_address) and (not chain or token_chain == chain)]
+            mask &= np.isin(data['token'], ids)
+        if start:
+            mask &= data['timestamp'] >= start.timestamp()
+        if end:
+            mask &= data['timestamp'] <= end.timestamp()
+
+        return np.array(data[mask])
+
+    def metrics(self, token_address: str, chain: str) -> Optional[TokenMetrics]:
+        """Current rolling metrics of a token, or None if it has no recent snapshots."""
+        token = self.token_ids.get((token_address, chain))
+        tracker = self.trackers.get(token)
+        if tracker is None or tracker.last_timestamp is None:
+            return None
+
+        up_days, cpi = tracker.price_increase()
+        windows = {}
+        for name, window in tracker.windows.items():
+            summary = window.summary(tracker.last_timestamp, tracker.last_price)
+            if summary:
+                windows[name] = summary
+
+        return TokenMetrics(
+            token_address=token_address,
+            chain=chain,
+            timestamp=datetime.fromtimestamp(tracker.last_timestamp),
+            price_usd=tracker.last_price,
+            price_up_days=up_days,
+            cpi=cpi,
+            windows=windows,
+        )
+
+    def all_metrics(self) -> List[TokenMetrics]:
+        metrics = (self.metrics(address, chain) for address, chain in self.tokens)
+        return [m for m in metrics if m is not None]
+
+
+@click.command()
+@click.argument('store_dir', type=click.Path(exists=True, file_okay=False))
+@click.option('--token-address', '-t', help='Token contract address')
+@click.option('--chain', '-c', help='Chain name')
+def main(store_dir: str, token_address: Optional[str], chain: Optional[str]):
+    """Print the rolling metrics of the tokens in STORE_DIR as JSON lines."""
+    store = SnapshotStore(store_dir)
+    for metrics in store.all_metrics():
+        if (not token_address or metrics.token_address == token_address) and (not chain or metrics.chain == chain):
+            click.echo(metrics.model_dump_json())
+
+
+if __name__ == '__main__':
+    main()
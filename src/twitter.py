@@ -1,19 +1,102 @@
 import logging
-import tweepy
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Any, Optional, Dict, List
+from src.api import ApiClient, ApiRequest
+from src.cache import ResponseCache
+from src.coalesce import coalesced
 from src.config import Config
 from src.schema import TwitterUser, Tweet, TwitterResponse
 
+if TYPE_CHECKING:
+    import tweepy
 
-class TwitterResearcher:
-    def __init__(self, bearer_token: str = None):
+
+USER_FIELDS = ['id', 'public_metrics', 'description', 'created_at']
+TIMELINE_TWEET_FIELDS = ['public_metrics', 'created_at', 'text', 'in_reply_to_user_id']
+# Top tweets reported, picked among recent tweets that are not replies
+RECENT_TWEETS = 5
+# Tweets read at most while paging past the window for RECENT_TWEETS non-replies
+MAX_TIMELINE_TWEETS = 50
+
+
+def user_payload(response) -> Optional[Dict]:
+    """Raw JSON of a users/by/username response; it is parsed after the cache, so archives can be re-parsed."""
+    if not response or not response.data:
+        return None
+    return response.data.data
+
+
+def timeline_page(response) -> Dict:
+    """Raw JSON of a users/tweets response, so it can be cached or archived."""
+    return {'data': [tweet.data for tweet in response.data or []], 'meta': response.meta or {}}
+
+
+def page_tweets(page: Dict) -> List['tweepy.Tweet']:
+    import tweepy
+    return [tweepy.Tweet(data) for data in page['data']]
+
+
+def originals(tweets: List['tweepy.Tweet']) -> List['tweepy.Tweet']:
+    """The tweets that are not replies."""
+    return [t for t in tweets if getattr(t, 'in_reply_to_user_id', None) is None]
+
+
+class TwitterResearcher(ApiClient):
+    def __init__(self, bearer_token: str = None, cache: Optional[ResponseCache] = None):
         self.bearer_token = bearer_token or Config.TWITTER_BEARER_TOKEN
         if not self.bearer_token:
             raise ValueError("Twitter bearer token is required")
 
-        self.client = tweepy.Client(bearer_token=self.bearer_token)
+        self._client = None
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
         self.max_results = Config.TWITTER_MAX_RESULTS
+        self.tweet_window = Config.TWITTER_TWEET_WINDOW
+
+    @property
+    def client(self) -> 'tweepy.Client':
+        """tweepy client, created (and tweepy imported) on first use."""
+        if self._client is None:
+            import tweepy
+            self._client = tweepy.Client(bearer_token=self.bearer_token)
+        return self._client
+
+    @property
+    def transport(self) -> Any:
+        return self.client
+
+    def user_request(self, twitter_handle: str) -> ApiRequest:
+        return ApiRequest(
+            'twitter', 'users/by/username', {'username': twitter_handle},
+            method='get_user', kwargs={'username': twitter_handle, 'user_fields': USER_FIELDS},
+            payload=user_payload,
+        )
+
+    def timeline_request(self, user_id: int, pagination_token: Optional[str] = None) -> ApiRequest:
+        return ApiRequest(
+            'twitter', 'users/tweets',
+            {'id': user_id, 'max_results': self.max_results, 'pagination_token': pagination_token},
+            method='get_users_tweets', args=(user_id,),
+            kwargs={'max_results': self.max_results, 'pagination_token': pagination_token,
+                    'tweet_fields': TIMELINE_TWEET_FIELDS, 'exclude': ['retweets']},
+            payload=timeline_page,
+        )
+
+    def parse_user(self, twitter_handle: str, data: Optional[Dict]) -> Optional[TwitterUser]:
+        if not data:
+            self.logger.error(f"No user data found for {twitter_handle}")
+            return None
+        return TwitterUser.from_api_response(twitter_handle, data)
+
+    def add_timeline_page(self, tweets: List['tweepy.Tweet'], page: Optional[Dict]) -> Optional[str]:
+        """Add a timeline page to `tweets`; returns the token of the next page, or None when done."""
+        if not page or not page['data']:
+            return None
+        tweets.extend(page_tweets(page))
+        if len(tweets) >= MAX_TIMELINE_TWEETS:
+            return None
+        if len(tweets) >= self.tweet_window and len(originals(tweets)) >= RECENT_TWEETS:
+            return None
+        return page['meta'].get('next_token')
 
     def get_user_info(self, twitter_handle: str) -> Optional[TwitterUser]:
         """Get basic Twitter user information."""
@@ -21,38 +104,45 @@ class TwitterResearcher:
             self.logger.error("Twitter handle is required")
             return None
 
+        return self.parse_user(twitter_handle, self.request(self.user_request(twitter_handle)))
+
+    def get_timeline(self, user_id: int) -> List['tweepy.Tweet']:
+        """Get the recent tweets of a user (retweets excluded), newest first.
+
+        Pages of {max_results} tweets are requested until the {tweet_window}
+        is full and holds RECENT_TWEETS tweets that are not replies, or the
+        timeline runs out. When replies crowd out the window, paging goes on
+        past it (up to MAX_TIMELINE_TWEETS) for those non-replies.
+        """
+        tweets = []
+        pagination_token = None
+        while True:
+            page = self.fetch(self.timeline_request(user_id, pagination_token))
+            pagination_token = self.add_timeline_page(tweets, page)
+            if not pagination_token:
+                return tweets
+
+    def get_recent_tweets(self, user_id: int, max_results: int = RECENT_TWEETS,
+                          tweets: Optional[List['tweepy.Tweet']] = None) -> List[Tweet]:
+        """Get the {max_results} most liked recent tweets of a user, replies excluded.
+
+        The tweets are picked among the non-replies of the {tweet_window},
+        or the first {max_results} non-replies when the window has fewer.
+        `tweets` may be a timeline already fetched with `get_timeline`.
+        """
         try:
-            user = self.client.get_user(
-                username=twitter_handle,
-                user_fields=['id', 'public_metrics', 'description', 'created_at']
-            )
+            if tweets is None:
+                tweets = self.get_timeline(user_id)
 
-            if not user or not user.data:
-                self.logger.error(f"No user data found for {twitter_handle}")
-                return None
-
-            return TwitterUser.from_api_response(twitter_handle, user.data)
-
-        except Exception as e:
-            self.logger.error(f"Error getting Twitter user info: {str(e)}")
-            return None
-
-    def get_recent_tweets(self, user_id: int, max_results: int = 5) -> List[Tweet]:
-        """Get the {max_results} most recent tweets of a user."""
-        try:
-            tweets = self.client.get_users_tweets(
-                user_id,
-                max_results=self.max_results,
-                tweet_fields=['public_metrics', 'created_at', 'text'],
-                exclude=['retweets', 'replies']
-            )
-
-            if not tweets.data:
+            recent = originals(tweets[:self.tweet_window])
+            if len(recent) < max_results:
+                recent = originals(tweets)[:max_results]
+            if not recent:
                 return []
 
             # Sort by likes and get top 5
             sorted_tweets = sorted(
-                tweets.data,
+                recent,
                 key=lambda x: x.public_metrics['like_count'],
                 reverse=True
             )[:max_results]
@@ -70,28 +160,27 @@ class TwitterResearcher:
             self.logger.error(f"Error getting popular tweets: {str(e)}")
             return []
 
-    def get_user_metrics(self, user_id: int) -> Dict[str, float]:
-        """Calculate comprehensive user metrics."""
+    def get_user_metrics(self, user_id: int, tweets: Optional[List['tweepy.Tweet']] = None) -> Dict[str, float]:
+        """Calculate comprehensive user metrics over the {tweet_window} most recent tweets.
+
+        `tweets` may be a timeline already fetched with `get_timeline`.
+        """
         try:
-            # Get user tweets with all necessary metrics
-            tweets = self.client.get_users_tweets(
-                user_id,
-                max_results=self.max_results,
-                tweet_fields=['public_metrics', 'created_at', 'text'],
-                exclude=['retweets']
-            )
-
-            if not tweets.data:
+            if tweets is None:
+                tweets = self.get_timeline(user_id)
+            tweets = tweets[:self.tweet_window]
+
+            if not tweets:
                 return {}
 
             # Extract metrics from tweets
-            likes = [t.public_metrics.get('like_count', 0) for t in tweets.data]
-            replies = [t.public_metrics.get('reply_count', 0) for t in tweets.data]
-            retweets = [t.public_metrics.get('retweet_count', 0) for t in tweets.data]
-            impressions = [t.public_metrics.get('impression_count', 0) for t in tweets.data]
+            likes = [t.public_metrics.get('like_count', 0) for t in tweets]
+            replies = [t.public_metrics.get('reply_count', 0) for t in tweets]
+            retweets = [t.public_metrics.get('retweet_count', 0) for t in tweets]
+            impressions = [t.public_metrics.get('impression_count', 0) for t in tweets]
 
             metrics = {
-                'num_recent_posts': len(tweets.data),
+                'num_recent_posts': len(tweets),
                 'avg_engagement': self._calculate_avg_engagement(likes, replies, retweets),
                 'avg_impressions': sum(impressions) / len(impressions) if impressions else 0,
                 'engagement_rate': self._calculate_impressions_per_metric(
@@ -115,17 +204,29 @@ class TwitterResearcher:
         """Calculate impressions per metric count."""
         return impressions / metric_counts if metric_counts > 0 else 0
 
+    def twitter_response(self, user_info: TwitterUser, tweets: List['tweepy.Tweet']) -> TwitterResponse:
+        """User info plus the top tweets and metrics of one timeline fetch."""
+        return TwitterResponse(
+            user=user_info,
+            recent_tweets=self.get_recent_tweets(user_info.twitter_id, tweets=tweets),
+            metrics=self.get_user_metrics(user_info.twitter_id, tweets=tweets)
+        )
+
+    def timeline_failed(self, error: Exception) -> List['tweepy.Tweet']:
+        self.logger.error(f"Error getting recent tweets: {str(error)}")
+        return []
+
+    @coalesced
     def get_twitter_info(self, twitter_handle: str) -> Optional[TwitterResponse]:
         """Get Twitter information including user info, popular tweets, and metrics."""
         user_info = self.get_user_info(twitter_handle)
         if not user_info:
             return None
 
-        recent_tweets = self.get_recent_tweets(user_info.twitter_id)
-        metrics = self.get_user_metrics(user_info.twitter_id)
+        # One timeline fetch feeds both the top tweets and the metrics
+        try:
+            tweets = self.get_timeline(user_info.twitter_id)
+        except Exception as e:
+            tweets = self.timeline_failed(e)
 
-        return TwitterResponse(
-            user=user_info,
-            recent_tweets=recent_tweets,
-            metrics=metrics
-        )
\ No newline at end of file
+        return self.twitter_response(user_info, tweets)
@@ -1,19 +1,51 @@
 import csv
+import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-import pandas as pd
-from typing import List, Union, Dict, Any
-from src.schema import Report
+from pydantic import BaseModel
+from typing import TYPE_CHECKING, List, Union, Dict, Any, Iterable, Iterator, Optional, Set, Tuple, Type
+from src.catalog import ReportCatalog
+from src.config import Config
+from src.schema import Report, unwrap_optional
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-FLATTENED_REPORT_COLUMNS = 123
 
+# pandas dtype for each scalar annotation; anything else is kept as an object column
+COLUMN_DTYPES = {
+    int: 'Int64',
+    float: 'float64',
+    bool: 'boolean',
+    str: 'string',
+    datetime: 'datetime64[ns]',
+}
 
-def save_report(report: Report, output_path: str) -> None:
-    """Save a report to a JSON file"""
-    with open(output_path, 'w') as f:
-        f.write(report.model_dump_json(indent=2))
+CSV_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def save_report(report: Report, output_path: str, index: bool = True,
+                indent: Optional[int] = Config.REPORT_INDENT,
+                compression: Optional[str] = Config.REPORT_COMPRESSION) -> None:
+    """Save a report to a JSON file and, with `index`, record it in the directory's catalog
+
+    `indent=0` writes compact JSON; `compression` may be 'gzip' or 'zstd'.
+    """
+    with open(output_path, 'wb') as f:
+        f.write(report.to_json_bytes(indent, compression))
+
+    if index:
+        catalog = ReportCatalog.for_directory(Path(output_path).parent)
+        try:
+            catalog.add(report, output_path)
+        finally:
+            catalog.close()
 
 
 def load_single_report(json_path: Union[str, Path]) -> Report:
@@ -21,19 +53,75 @@ def load_single_report(json_path: Union[str, Path]) -> Report:
     return Report.from_json(json_path)
 
 
-def load_multiple_reports(json_paths: List[str]) -> List[Report]:
-    """Load all report JSON files from a directory into Report objects"""
-    reports = []
-
+def iter_reports(json_paths: Iterable[Union[str, Path]]) -> Iterator[Report]:
+    """Lazily load report JSON files one at a time, skipping files that fail to load"""
     for json_file in json_paths:
         try:
-            report = Report.from_json(json_file)
-            reports.append(report)
+            yield Report.from_json(json_file)
         except Exception as e:
             logging.info(f"Error loading {json_file}: {e}")
             continue
 
-    return reports
+
+@dataclass
+class ReportLoadError:
+    path: str
+    error: str
+
+
+@dataclass
+class LoadResult:
+    reports: List[Report] = field(default_factory=list)
+    errors: List[ReportLoadError] = field(default_factory=list)
+
+
+def _load_report(json_path: Union[str, Path]) -> Tuple[Optional[Report], Optional[str]]:
+    """Load one report in a worker process, returning the error instead of raising"""
+    try:
+        return Report.from_json(json_path), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def load_reports(json_paths: Iterable[Union[str, Path]], workers: Optional[int] = None,
+                 chunksize: int = Config.REPORT_LOAD_CHUNKSIZE) -> LoadResult:
+    """Load report JSON files in a process pool, keeping input order.
+
+    Files are handed to workers `chunksize` at a time. With a single worker,
+    or no more files than one chunk, they are loaded in this process. Files
+    that fail to load are returned in `errors` rather than raised.
+    """
+    json_paths = list(json_paths)
+    workers = workers or Config.REPORT_LOAD_WORKERS or os.cpu_count() or 1
+    chunksize = max(chunksize, 1)
+
+    if workers == 1 or len(json_paths) <= chunksize:
+        loaded = map(_load_report, json_paths)
+        return _collect_loaded(json_paths, loaded)
+
+    workers = min(workers, -(-len(json_paths) // chunksize))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _collect_loaded(json_paths, executor.map(_load_report, json_paths, chunksize=chunksize))
+
+
+def _collect_loaded(json_paths: List[Union[str, Path]],
+                    loaded: Iterable[Tuple[Optional[Report], Optional[str]]]) -> LoadResult:
+    result = LoadResult()
+    for json_path, (report, error) in zip(json_paths, loaded):
+        if error is None:
+            result.reports.append(report)
+        else:
+            result.errors.append(ReportLoadError(str(json_path), error))
+    return result
+
+
+def load_multiple_reports(json_paths: List[str], workers: Optional[int] = None,
+                          chunksize: int = Config.REPORT_LOAD_CHUNKSIZE) -> List[Report]:
+    """Load all report JSON files from a directory into Report objects"""
+    result = load_reports(json_paths, workers, chunksize)
+    for error in result.errors:
+        logging.warning(f"Error loading {error.path}: {error.error}")
+    return result.reports
 
 
 def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
@@ -53,33 +141,253 @@ def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dic
     return dict(items)
 
 
+class _ColumnNode:
+    """Flattened column layout of a model.
+
+    `scalars` and `containers` map attribute names to column indexes; both
+    are read with a single attrgetter call per object. `children` are nested
+    models.
+    """
+
+    def __init__(self):
+        self.scalars: List[Tuple[str, int]] = []
+        self.containers: List[Tuple[str, int]] = []
+        self.children: List[Tuple[str, '_ColumnNode']] = []
+        self.nodes: List['_ColumnNode'] = []
+        self.get_values = None
+
+    def finalize(self) -> None:
+        fields = self.scalars + self.containers
+        self.own_columns = [index for _, index in fields]
+        self.n_scalars = len(self.scalars)
+        self.empty_row = (None,) * len(fields)
+
+        names = [name for name, _ in fields]
+        if len(names) == 1:
+            getter = attrgetter(names[0])
+            self.get_values = lambda obj: (getter(obj),)
+        elif names:
+            self.get_values = attrgetter(*names)
+        else:
+            self.get_values = None
+
+        # This node followed by every nested node, depth first
+        self.nodes = [self] + [node for _, child in self.children for node in child.nodes]
+
+
+def _build_layout(model: Type[BaseModel], prefix: str, names: List[str], dtypes: List[str],
+                  sep: str = '_') -> _ColumnNode:
+    """Walk a model's fields the way flatten_dict walks model_dump() output.
+
+    Nested models (optional or not) are expanded into prefixed columns; lists
+    and dicts stay single object columns.
+    """
+    node = _ColumnNode()
+    for name, model_field in model.model_fields.items():
+        key = f"{prefix}{sep}{name}" if prefix else name
+        annotation = unwrap_optional(model_field.annotation)
+
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            child = _build_layout(annotation, key, names, dtypes, sep)
+            node.children.append((name, child))
+            continue
+
+        index = len(names)
+        names.append(key)
+        dtype = COLUMN_DTYPES.get(annotation, 'object')
+        dtypes.append(dtype)
+        if dtype == 'object':
+            node.containers.append((name, index))
+        else:
+            node.scalars.append((name, index))
+
+    node.finalize()
+    return node
+
+
+@lru_cache(maxsize=None)
+def _report_layout() -> Tuple[_ColumnNode, Tuple[str, ...], Tuple[str, ...]]:
+    names: List[str] = []
+    dtypes: List[str] = []
+    root = _build_layout(Report, '', names, dtypes)
+    return root, tuple(names), tuple(dtypes)
+
+
+def report_columns() -> List[str]:
+    """Flattened CSV column names, derived from the Report schema."""
+    return list(_report_layout()[1])
+
+
+def _plain(value: Any) -> Any:
+    """Convert models inside list/dict columns to plain data, as model_dump() would."""
+    if isinstance(value, list):
+        if value and isinstance(value[0], BaseModel):
+            return [v.model_dump() for v in value]
+    elif isinstance(value, dict):
+        if value and isinstance(next(iter(value.values())), BaseModel):
+            return {k: v.model_dump() for k, v in value.items()}
+    elif isinstance(value, BaseModel):
+        return value.model_dump()
+    return value
+
+
+def _collect_rows(obj: Optional[BaseModel], node: _ColumnNode, rows: Dict[int, list]) -> None:
+    """Append one tuple of values per node (this one and nested ones) to `rows`."""
+    if obj is None:
+        for child in node.nodes:
+            rows[id(child)].append(child.empty_row)
+        return
+
+    if node.get_values:
+        values = node.get_values(obj)
+        if len(values) > node.n_scalars:
+            values = values[:node.n_scalars] + tuple(_plain(v) for v in values[node.n_scalars:])
+        rows[id(node)].append(values)
+    for name, child in node.children:
+        _collect_rows(getattr(obj, name), child, rows)
+
+
+def _rows_to_columns(root: _ColumnNode, rows: Dict[int, list], n_columns: int) -> List[tuple]:
+    """Transpose the per-node row tuples into one value tuple per column."""
+    columns: List[tuple] = [()] * n_columns
+    for node in root.nodes:
+        if not node.own_columns:
+            continue
+        node_rows = rows[id(node)]
+        if not node_rows:
+            continue
+        for index, values in zip(node.own_columns, zip(*node_rows)):
+            columns[index] = values
+    return columns
+
+
+def reports_to_frame(reports: List[Report]) -> 'pd.DataFrame':
+    """Build one typed DataFrame of flattened reports, one row per report.
+
+    The column layout comes from the Report schema, values are read straight
+    from the models into per-column buffers, and each column gets the dtype
+    of its field (nullable Int64/boolean, float64, string, datetime64).
+    """
+    import pandas as pd
+
+    root, names, dtypes = _report_layout()
+    rows: Dict[int, list] = {id(node): [] for node in root.nodes}
+
+    for report in reports:
+        _collect_rows(report, root, rows)
+
+    data = {}
+    for name, dtype, values in zip(names, dtypes, _rows_to_columns(root, rows, len(names))):
+        if dtype == 'object':
+            column = pd.Series(values, dtype=object)
+        elif dtype == 'datetime64[ns]':
+            try:
+                column = pd.Series(pd.to_datetime(values))
+            except (TypeError, ValueError):
+                # Naive and timezone-aware values mixed in one column
+                column = pd.Series(pd.to_datetime(values, utc=True))
+        else:
+            column = pd.Series(values, dtype=dtype)
+        data[name] = column
+
+    return pd.DataFrame(data, columns=list(names))
+
+
 def reports_to_csv(reports: List[Report], output_path: str) -> None:
-    """Convert a list of reports to a CSV file using Pydantic model_dump"""
+    """Convert a list of reports to a CSV file with the schema-derived column layout"""
     if not reports:
         raise ValueError("No reports provided")
 
-    # Get all fields from first report
-    first_report = reports[0].model_dump()
-    flattened = flatten_dict(first_report)
-    assert len(flattened.keys()) == FLATTENED_REPORT_COLUMNS, f"Flattened report columns {len(flattened.keys())} do not match expected number of columns: 123"
-    headers = list(flattened.keys())
+    df = reports_to_frame(reports)
+    df.to_csv(output_path, index=False, date_format=CSV_DATE_FORMAT)
 
-    rows = []
-    for report in reports:
-        # Convert report to dict and flatten
-        report_dict = report.model_dump()
-        flat_row = flatten_dict(report_dict)
-
-        row = {}
-        for k in headers:
-            if k in flat_row:
-                row[k] = flat_row[k]
-            else:
-                row[k] = None
 
-        row = pd.Series(row)
-        rows.append(row)
+def flatten_report(report: Report) -> List[Any]:
+    """Flatten one report into a row of values in report_columns() order"""
+    root, names, _ = _report_layout()
+    rows: Dict[int, list] = {id(node): [] for node in root.nodes}
+    _collect_rows(report, root, rows)
+
+    row: List[Any] = [None] * len(names)
+    for node in root.nodes:
+        if node.own_columns:
+            for index, value in zip(node.own_columns, rows[id(node)][0]):
+                row[index] = value
+    return row
+
+
+def _csv_value(value: Any) -> Any:
+    """Format a value the way reports_to_csv writes it"""
+    if isinstance(value, datetime):
+        return value.strftime(CSV_DATE_FORMAT)
+    return value
+
+
+def _export_key(token_address: str, chain: str, timestamp: Union[str, datetime]) -> Tuple[str, str, str]:
+    """Identity of an exported report: token, chain and timestamp to the second"""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    return token_address, chain, timestamp.strftime(CSV_DATE_FORMAT)
+
+
+def _exported_keys(output_path: Path, fmt: str) -> Set[Tuple[str, str, str]]:
+    """Read the keys of reports already in an export file, one line at a time"""
+    keys = set()
+    if not output_path.exists():
+        return keys
+
+    with open(output_path, newline='') as f:
+        if fmt == 'csv':
+            for row in csv.DictReader(f):
+                keys.add(_export_key(row['token_address'], row['chain'], row['timestamp']))
+        else:
+            for line in f:
+                if line.strip():
+                    data = json.loads(line)
+                    keys.add(_export_key(data['token_address'], data['chain'], data['timestamp']))
+    return keys
+
+
+def export_reports(reports: Iterable[Report], output_path: Union[str, Path], fmt: Optional[str] = None,
+                   append: bool = True, skip_existing: bool = True) -> int:
+    """Stream reports into a CSV or JSONL file, holding one report at a time.
+
+    The format is taken from the file suffix unless `fmt` is given. With
+    `append`, rows are added to an existing file (whose CSV header must match
+    report_columns()); with `skip_existing`, reports already in the file are
+    not written again. Returns the number of reports written.
+    """
+    output_path = Path(output_path)
+    fmt = fmt or output_path.suffix.lstrip('.').lower()
+    if fmt not in ('csv', 'jsonl'):
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    exists = append and output_path.exists() and output_path.stat().st_size > 0
+    columns = report_columns()
+    if exists and fmt == 'csv':
+        with open(output_path, newline='') as f:
+            header = next(csv.reader(f), [])
+        if header != columns:
+            raise ValueError(f"{output_path} has a different column layout than the Report schema")
+
+    seen = _exported_keys(output_path, fmt) if exists and skip_existing else set()
+
+    written = 0
+    with open(output_path, 'a' if exists else 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n') if fmt == 'csv' else None
+        if writer and not exists:
+            writer.writerow(columns)
+
+        for report in reports:
+            key = _export_key(report.token_address, report.chain, report.timestamp)
+            if skip_existing and key in seen:
+                continue
+            seen.add(key)
+
+            if writer:
+                writer.writerow([_csv_value(value) for value in flatten_report(report)])
+            else:
+                f.write(report.model_dump_json() + '\n')
+            written += 1
 
-    df = pd.concat(rows, axis=1).T
-    df.columns = headers
-    df.to_csv(output_path, index=False)
+    return written
@@ -0,0 +1,171 @@
+import logging
+import math
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import click
+
+from src.cache import ResponseCache
+from src.coalesce import reset_coalesced
+from src.config import Config
+from src.dexscreener import DexScreener, MAX_ADDRESSES_PER_REQUEST
+from src.instrumentation import metrics
+from src.main import parse_tokens, save_report_file, setup_logger
+from src.reporter import Reporter
+from src.schema import DexScreenerInfo
+from src.timeseries import SnapshotStore
+
+
+class Watcher:
+    """Poll a set of tokens, refreshing DexScreener data every `interval` seconds.
+
+    Each cycle fetches DexScreener data for every token (30 addresses per
+    request) with the requests spread evenly over the interval, and appends
+    one snapshot per token to the SnapshotStore, which updates its rolling
+    metrics as they arrive. Full reports (CoinGecko, Twitter, Telegram,
+    holders) are refreshed round-robin so that every token gets one per
+    `slow_interval`, a fixed share of the tokens per cycle.
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]], store: SnapshotStore,
+                 interval: float = Config.WATCH_INTERVAL,
+                 slow_interval: float = Config.WATCH_SLOW_INTERVAL,
+                 reporter: Optional[Reporter] = None,
+                 output_path: Optional[Path] = None,
+                 dex: Optional[DexScreener] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 metrics_out: Optional[str] = None):
+        self.tokens = list(dict.fromkeys(tokens))
+        self.store = store
+        self.interval = interval
+        self.slow_interval = slow_interval
+        self.reporter = reporter
+        self.output_path = output_path
+        # Prices change by the second, so the fast path skips the response cache
+        self.dex = dex or DexScreener()
+        self.clock = clock
+        self.sleep = sleep
+        # Rewritten after every cycle, e.g. for a Prometheus textfile collector
+        self.metrics_out = metrics_out
+        self.logger = logging.getLogger(__name__)
+
+        # Tokens whose full report is refreshed each cycle
+        cycles_per_slow_refresh = max(1, int(slow_interval // interval)) if interval > 0 else 1
+        self.slow_batch = math.ceil(len(self.tokens) / cycles_per_slow_refresh)
+        self.slow_cursor = 0
+        self.cycle = 0
+
+    def _batches(self) -> List[List[Tuple[str, str]]]:
+        return [self.tokens[i:i + MAX_ADDRESSES_PER_REQUEST]
+                for i in range(0, len(self.tokens), MAX_ADDRESSES_PER_REQUEST)]
+
+    def _sleep_until(self, deadline: float) -> None:
+        delay = deadline - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+
+    def poll_prices(self, cycle_start: float) -> Dict[Tuple[str, str], DexScreenerInfo]:
+        """Fetch DexScreener data for every token, one batch request per time slot."""
+        batches = self._batches()
+        slot = self.interval / len(batches) if batches else 0
+        infos = {}
+
+        for i, batch in enumerate(batches):
+            self._sleep_until(cycle_start + i * slot)
+            try:
+                results = self.dex.research_tokens_batch(batch)
+            except Exception as e:
+                self.logger.warning(f"DexScreener batch {i + 1}/{len(batches)} failed: {e}")
+                continue
+
+            infos.update((token, info) for token, info in results.items() if info is not None)
+
+        return infos
+
+    def refresh_reports(self, infos: Dict[Tuple[str, str], DexScreenerInfo]) -> int:
+        """Generate full reports for the next share of tokens, reusing this cycle's DexScreener data."""
+        if not self.reporter or not self.tokens:
+            return 0
+
+        if self.slow_cursor == 0:
+            # A new round: let CoinGecko, Twitter and Telegram lookups fetch again
+            clients = (self.reporter.coingecko, self.reporter.twitter, self.reporter.telegram)
+            reset_coalesced(*(client for client in clients if client is not None))
+
+        due = self.tokens[self.slow_cursor:self.slow_cursor + self.slow_batch]
+        self.slow_cursor = (self.slow_cursor + self.slow_batch) % len(self.tokens)
+
+        refreshed = 0
+        for address, chain in due:
+            report = self.reporter.generate_report(address, chain, infos.get((address, chain)))
+            if report:
+                if self.output_path:
+                    save_report_file(report, self.output_path)
+                refreshed += 1
+        return refreshed
+
+    def run_cycle(self) -> Dict[Tuple[str, str], DexScreenerInfo]:
+        """Poll every token once, write the snapshots and refresh this cycle's full reports."""
+        cycle_start = self.clock()
+        infos = self.poll_prices(cycle_start)
+        self.store.append(infos.values())
+        refreshed = self.refresh_reports(infos)
+
+        self.cycle += 1
+        elapsed = self.clock() - cycle_start
+        metrics.observe('watch_cycle_seconds', elapsed)
+        if self.metrics_out:
+            metrics.write(self.metrics_out)
+        self.logger.info(f"Cycle {self.cycle}: {len(infos)}/{len(self.tokens)} snapshots, "
+                         f"{refreshed} full reports in {elapsed:.1f}s")
+        if elapsed > self.interval:
+            self.logger.warning(f"Cycle {self.cycle} took {elapsed:.1f}s, longer than the {self.interval}s interval")
+        return infos
+
+    def run(self, cycles: Optional[int] = None) -> None:
+        """Run cycles every `interval` seconds, forever unless `cycles` is given."""
+        next_start = self.clock()
+        while cycles is None or self.cycle < cycles:
+            self._sleep_until(next_start)
+            next_start = max(next_start + self.interval, self.clock())
+            self.run_cycle()
+
+
+@click.command()
+@click.option('--tokens-file', '-f', type=click.File('r'), required=True,
+              help='File with one "address,chain" per line ("-" for stdin)')
+@click.option('--chain', '-c', default='ethereum', help='Default chain (default: ethereum)')
+@click.option('--store-dir', '-s', default='output/snapshots', type=click.Path(file_okay=False),
+              help='Snapshot store the DexScreener snapshots are appended to')
+@click.option('--interval', default=Config.WATCH_INTERVAL, type=float, show_default=True,
+              help='Seconds between DexScreener polls')
+@click.option('--slow-interval', default=Config.WATCH_SLOW_INTERVAL, type=float, show_default=True,
+              help='Seconds between full reports of each token (0 to disable)')
+@click.option('--output-dir', '-o', default='output', type=click.Path(), help='Directory for full reports')
+@click.option('--cycles', type=int, help='Stop after this many cycles')
+@click.option('--metrics-out', type=click.Path(dir_okay=False),
+              help='Rewrite the metrics to this file after every cycle (.prom for Prometheus text, else JSON)')
+@click.option('--debug/--no-debug', default=False, help='Enable debug logging')
+def main(tokens_file, chain: str, store_dir: str, interval: float, slow_interval: float, output_dir: str,
+         cycles: Optional[int], metrics_out: Optional[str], debug: bool):
+    """Poll a set of tokens and append price/volume snapshots."""
+    setup_logger(debug)
+
+    tokens = parse_tokens(tokens_file, chain)
+    reporter = Reporter(cache=ResponseCache()) if slow_interval > 0 else None
+    store = SnapshotStore(store_dir)
+    watcher = Watcher(tokens, store, interval, slow_interval or interval, reporter, Path(output_dir),
+                      metrics_out=metrics_out)
+
+    try:
+        watcher.run(cycles)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,12 @@
 import pytest
 import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Type, Union
+from unittest.mock import Mock, patch
 from click.testing import CliRunner
+from src.holder_researcher import HolderDistribution
+from src.schema import CoingeckoReport, DexScreenerInfo, Links, Report, TelegramChannel
 
 
 TEST_TOKEN_ADDRESS = "8cNmp9T2CMQRNZhNRoeSvr57LDf1kbZ42SvgsSWfpump"
@@ -9,6 +15,40 @@ TEST_TOKEN_SYMBOL = "JAIL"
 TEST_TOKEN_COINGECKO_ID = "jailbreakme"
 
 
+def make_info(address: str = "a", chain: str = "solana", symbol: str = None,
+              timestamp: Union[datetime, float] = datetime(2024, 12, 29), **fields) -> DexScreenerInfo:
+    """Build DexScreener data for a token; `timestamp` may also be a UNIX time."""
+    if not isinstance(timestamp, datetime):
+        timestamp = datetime.fromtimestamp(timestamp)
+    symbol = symbol or address.upper()
+    fields.setdefault('price_usd', 1.0)
+    return DexScreenerInfo(
+        token_address=address,
+        token_name=symbol,
+        token_symbol=symbol,
+        chain=chain,
+        dex_id="raydium",
+        pair_address="pair",
+        timestamp=timestamp,
+        **fields
+    )
+
+
+def make_report(address: str = "a", chain: str = "solana", symbol: str = None,
+                timestamp: datetime = datetime(2024, 12, 29), num_holders: int = 0,
+                coingecko: CoingeckoReport = None, twitter=None, **dex_fields) -> Report:
+    """Build a report for a token; `dex_fields` go to its DexScreener data."""
+    return Report(
+        token_address=address,
+        chain=chain,
+        timestamp=timestamp,
+        num_holders=num_holders,
+        dex=make_info(address, chain, symbol, timestamp, **dex_fields),
+        coingecko=coingecko or CoingeckoReport(),
+        twitter=twitter
+    )
+
+
 @pytest.fixture(autouse=True)
 def setup_logging():
     """Setup basic logging for tests."""
@@ -24,4 +64,54 @@ def temp_output_dir(tmp_path):
 
 @pytest.fixture
 def runner():
-    return CliRunner()
\ No newline at end of file
+    return CliRunner()
+
+
+@pytest.fixture
+def token_info():
+    return make_info("abc", symbol="TEST")
+
+
+@pytest.fixture
+def coingecko_data():
+    return CoingeckoReport(
+        id="test",
+        links=Links(twitter_screen_name="test_x", telegram_channel_identifier="test_tg")
+    )
+
+
+@contextmanager
+def mocked_reporter(reporter_cls: Type, clients: List[str], token_info: DexScreenerInfo,
+                    coingecko_data: CoingeckoReport, mock_cls: Type = Mock):
+    """Patch a reporter's API client classes and yield a factory of reporters with canned source results.
+
+    `clients` are the class names in the reporter's module; `mock_cls`
+    (Mock or AsyncMock) wraps the client methods the sources call.
+    """
+    patches = [patch(f'{reporter_cls.__module__}.{name}') for name in clients]
+    for p in patches:
+        p.start()
+
+    results = {
+        ('dex', 'research_tokens'): token_info,
+        ('dex', 'research_tokens_batch'): {},
+        ('coingecko', 'get_coin_info'): coingecko_data,
+        ('twitter', 'get_twitter_info'): None,
+        ('telegram', 'get_channel_info'): TelegramChannel(telegram_handle="test_tg", member_count=10),
+        ('holder_researcher', 'get_holder_distribution'): HolderDistribution(
+            num_holders=42, holders_analyzed=42, gini_coefficient=0.5
+        ),
+    }
+
+    def factory(**kwargs):
+        reporter = reporter_cls(**kwargs)
+        for (client, method), result in results.items():
+            if getattr(reporter, client) is not None:
+                setattr(getattr(reporter, client), method, mock_cls(return_value=result))
+        return reporter
+
+    try:
+        yield factory
+    finally:
+        for p in patches:
+            p.stop()
@@ -0,0 +1,78 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.async_clients import AsyncDexScreener
+from src.async_http import AsyncHttpClient
+
+
+async def start_server(handler) -> TestServer:
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def close_all(*closeables):
+    for closeable in closeables:
+        await closeable.close()
+
+
+@pytest.mark.asyncio
+async def test_get_json():
+    """Test a GET request returns a fully read response."""
+    async def handler(request):
+        return web.json_response({'path': request.path, 'q': request.query.get('q')})
+
+    server = await start_server(handler)
+    client = AsyncHttpClient(rate_limits={})
+    try:
+        response = await client.get(str(server.make_url('/tokens')), params={'q': 'x'})
+        assert response.status_code == 200
+        assert response.json() == {'path': '/tokens', 'q': 'x'}
+    finally:
+        await close_all(client, server)
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors():
+    """Test retryable statuses are retried and the last response is returned."""
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        return web.json_response({}, status=503 if len(calls) < 3 else 200)
+
+    server = await start_server(handler)
+    client = AsyncHttpClient(rate_limits={}, max_retries=3, backoff_base=0)
+    try:
+        response = await client.get(str(server.make_url('/')))
+        assert response.status_code == 200
+        assert len(calls) == 3
+    finally:
+        await close_all(client, server)
+
+
+@pytest.mark.asyncio
+async def test_dexscreener_batch_requests_run_concurrently():
+    """Test a batch of 60 addresses sends its two requests over the shared pool."""
+    paths = []
+
+    async def handler(request):
+        addresses = request.match_info['tail'].split('/')[-1].split(',')
+        paths.append(addresses)
+        pairs = [{'chainId': 'solana', 'dexId': 'raydium', 'pairAddress': f'p{a}',
+                  'baseToken': {'address': a, 'name': a, 'symbol': a.upper()}, 'priceUsd': '1'}
+                 for a in addresses]
+        return web.json_response({'pairs': pairs})
+
+    server = await start_server(handler)
+    client = AsyncHttpClient(rate_limits={})
+    dex = AsyncDexScreener(client)
+    dex.base_url = str(server.make_url('')).rstrip('/')
+    try:
+        results = await dex.research_tokens_batch([(f'a{i}', 'solana') for i in range(60)])
+        assert len(paths) == 2
+        assert results[('a59', 'solana')].token_symbol == 'A59'
+    finally:
+        await close_all(client, server)
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.async_reporter import AsyncReporter
+from src.coalesce import async_coalesced
+from src.holder_researcher import HolderDistribution
+from src.sources import HoldersSource
+from tests.conftest import mocked_reporter
+
+
+@pytest.fixture
+def make_reporter(token_info, coingecko_data):
+    """Build an AsyncReporter whose clients are all mocked."""
+    clients = ['AsyncDexScreener', 'AsyncCoinGecko', 'AsyncTwitterResearcher', 'AsyncTelegramResearcher',
+               'AsyncHolderResearcher']
+    with mocked_reporter(AsyncReporter, clients, token_info, coingecko_data, AsyncMock) as factory:
+        yield factory
+
+
+@pytest.mark.asyncio
+async def test_generate_report(make_reporter):
+    """Test the async reporter assembles the same report as the sync one."""
+    reporter = make_reporter()
+    report = await reporter.generate_report("abc", "solana")
+
+    assert report.dex.token_symbol == "TEST"
+    assert report.num_holders == 42
+    assert report.telegram.member_count == 10
+    assert report.sources['twitter'].status == 'empty'
+    reporter.twitter.get_twitter_info.assert_awaited_once_with("test_x")
+
+
+@pytest.mark.asyncio
+async def test_source_timeout(make_reporter):
+    """Test a slow source gets a timeout status and its dependents are skipped."""
+    reporter = make_reporter(source_timeout=0.05)
+
+    async def slow(*args):
+        await asyncio.sleep(1)
+
+    reporter.coingecko.get_coin_info = slow
+    report = await reporter.generate_report("abc", "solana")
+
+    assert report.sources['coingecko'].status == 'timeout'
+    assert report.sources['twitter'].status == 'skipped'
+    assert report.num_holders == 42
+
+
+@pytest.mark.asyncio
+async def test_coalesced_source_timeout(make_reporter):
+    """Test a timed-out shared call gives every token a timeout status instead of cancelling the batch."""
+    reporter = make_reporter(source_timeout=0.05)
+
+    class SlowCoinGecko:
+        @async_coalesced
+        async def get_coin_info(self, *args):
+            await asyncio.sleep(1)
+
+    async def later():
+        await asyncio.sleep(0.02)
+        return await reporter.generate_report("abc", "solana")
+
+    reporter.coingecko.get_coin_info = SlowCoinGecko().get_coin_info
+    reports = await asyncio.gather(reporter.generate_report("abc", "solana"), later())
+
+    assert len(reports) == 2 and all(reports)
+    assert [r.sources['coingecko'].status for r in reports] == ['timeout', 'timeout']
+
+
+@pytest.mark.asyncio
+async def test_source_concurrency_limit(make_reporter):
+    """Test no more calls than a source's limit are in flight across tokens."""
+    reporter = make_reporter(concurrency={'holders': 2})
+    active = []
+    peak = []
+
+    async def holders(*args):
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        return HolderDistribution(num_holders=1)
+
+    reporter.holder_researcher.get_holder_distribution = holders
+    reports = await reporter.generate_reports([(f"t{i}", "solana") for i in range(10)])
+
+    assert len(reports) == 10 and all(reports)
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_reports_prefetches_dex(make_reporter, token_info):
+    """Test batch DexScreener data is used instead of per-token lookups."""
+    reporter = make_reporter()
+    reporter.dex.research_tokens_batch.return_value = {("abc", "solana"): token_info}
+
+    reports = await reporter.generate_reports([("abc", "solana")])
+
+    assert reports[0].dex == token_info
+    reporter.dex.research_tokens.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_custom_sync_source(make_reporter):
+    """Test sources with a synchronous fetch still run."""
+    reporter = make_reporter()
+
+    class FixedHolders(HoldersSource):
+        def fetch(self, context):
+            return HolderDistribution(num_holders=7)
+
+    reporter.sources[2] = FixedHolders(reporter.holder_researcher)
+    report = await reporter.generate_report("abc", "solana")
+    assert report.num_holders == 7
@@ -0,0 +1,146 @@
+import itertools
+import pytest
+from unittest.mock import patch, Mock
+from src.cache import ResponseArchive, ResponseCache, cached_fetch, cached_fetch_async
+from src.dexscreener import DexScreener
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "cache.sqlite", ttls={"dexscreener": 30, "coingecko": 3600})
+
+
+def test_get_set(cache):
+    """Test payloads round-trip and are keyed by source, endpoint and params."""
+    cache.set("coingecko", "coins/contract", {"chain": "solana", "address": "abc"}, {"id": "test"})
+
+    assert cache.get("coingecko", "coins/contract", {"address": "abc", "chain": "solana"}) == {"id": "test"}
+    assert cache.get("coingecko", "coins/contract", {"chain": "base", "address": "abc"}) is None
+    assert cache.get("dexscreener", "coins/contract", {"chain": "solana", "address": "abc"}) is None
+
+
+def test_ttl_per_source(cache):
+    """Test entries expire after their source's TTL."""
+    with patch('src.cache.time.time', return_value=1000.0):
+        cache.set("dexscreener", "tokens", {"address": "abc"}, {"pairs": []})
+        cache.set("coingecko", "coins/contract", {"address": "abc"}, {"id": "test"})
+        cache.set("twitter", "users/by/username", {"username": "abc"}, {"id": 1})
+
+    with patch('src.cache.time.time', return_value=1100.0):
+        assert cache.get("dexscreener", "tokens", {"address": "abc"}) is None
+        assert cache.get("coingecko", "coins/contract", {"address": "abc"}) == {"id": "test"}
+        # Sources without a TTL are never cached
+        assert cache.get("twitter", "users/by/username", {"username": "abc"}) is None
+
+
+def test_size_eviction(tmp_path):
+    """Test least recently used entries are evicted past max_bytes."""
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_bytes=250, ttls={"coingecko": 3600})
+    payload = {"description": "x" * 90}
+
+    with patch('src.cache.time.time', side_effect=itertools.count(1.0)):
+        cache.set("coingecko", "coins", {"id": 1}, payload)
+        cache.set("coingecko", "coins", {"id": 2}, payload)
+        cache.get("coingecko", "coins", {"id": 1})
+        cache.set("coingecko", "coins", {"id": 3}, payload)
+
+        assert cache.get("coingecko", "coins", {"id": 1}) == payload
+        assert cache.get("coingecko", "coins", {"id": 2}) is None
+        assert cache.get("coingecko", "coins", {"id": 3}) == payload
+
+
+def test_size_is_a_running_total(tmp_path):
+    """Test writes under max_bytes keep the total without summing the table."""
+    path = tmp_path / "cache.sqlite"
+    cache = ResponseCache(path, ttls={"coingecko": 3600})
+    statements = []
+    cache.conn.set_trace_callback(statements.append)
+
+    cache.set("coingecko", "coins", {"id": 1}, {"description": "x" * 90})
+    cache.set("coingecko", "coins", {"id": 2}, {"description": "x" * 90})
+    cache.set("coingecko", "coins", {"id": 1}, {"description": "x"})
+
+    assert not any("SUM" in statement for statement in statements)
+    assert cache.size == cache._total_size() == ResponseCache(path).size
+
+
+def test_refresh_skips_reads(tmp_path):
+    """Test refresh mode ignores cached entries but still stores new ones."""
+    path = tmp_path / "cache.sqlite"
+    ResponseCache(path, ttls={"coingecko": 3600}).set("coingecko", "coins", None, {"id": "old"})
+
+    cache = ResponseCache(path, ttls={"coingecko": 3600}, refresh=True)
+    assert cache.fetch("coingecko", "coins", None, lambda: {"id": "new"}) == {"id": "new"}
+    assert ResponseCache(path, ttls={"coingecko": 3600}).get("coingecko", "coins", None) == {"id": "new"}
+
+
+def test_client_uses_cache(cache):
+    """Test a cached API client only hits the network once."""
+    dex = DexScreener(cache=cache)
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value = Mock(status_code=200)
+        mock_get.return_value.json.return_value = {"pairs": []}
+
+        assert dex.get_token_info("abc") == {"pairs": []}
+        assert dex.get_token_info("abc") == {"pairs": []}
+
+    assert mock_get.call_count == 1
+
+
+def test_batch_cached_per_address(cache):
+    """Test batch responses are cached per address, for later single or batched lookups."""
+    dex = DexScreener(cache=cache)
+
+    def fake_get(url, **kwargs):
+        response = Mock(status_code=200)
+        response.json.return_value = {"pairs": [
+            {"baseToken": {"address": a, "name": a, "symbol": a}, "chainId": "solana", "dexId": "raydium",
+             "pairAddress": f"pair_{a}", "priceUsd": "1.0"}
+            for a in url.rsplit('/', 1)[-1].split(',')
+        ]}
+        return response
+
+    with patch('requests.Session.get', side_effect=fake_get) as mock_get:
+        dex.research_tokens_batch([("a", "solana"), ("b", "solana")])
+        results = dex.research_tokens_batch([("b", "solana"), ("c", "solana")])
+        single = dex.research_tokens("a", "solana")
+
+    assert [call.args[0].rsplit('/', 1)[-1] for call in mock_get.call_args_list] == ["a,b", "c"]
+    assert results[("b", "solana")].pair_address == "pair_b"
+    assert single.pair_address == "pair_a"
+
+
+def test_archive_record_and_replay(tmp_path):
+    """Test recorded payloads are replayed without calling the API, across runs."""
+    path = tmp_path / "archive.jsonl.gz"
+    for run in range(2):
+        archive = ResponseArchive(path)
+        cached_fetch(archive, "dexscreener", "tokens", {"address": f"a{run}"}, lambda: {"pairs": [run]})
+        cached_fetch(archive, "dexscreener", "tokens", {"address": "none"}, lambda: None)
+        archive.close()
+
+    replay = ResponseArchive(path, replay=True)
+    fetch = Mock()
+    assert cached_fetch(replay, "dexscreener", "tokens", {"address": "a0"}, fetch) == {"pairs": [0]}
+    assert cached_fetch(replay, "dexscreener", "tokens", {"address": "a1"}, fetch) == {"pairs": [1]}
+    assert cached_fetch(replay, "dexscreener", "tokens", {"address": "none"}, fetch) is None
+    fetch.assert_not_called()
+    assert replay.sources == {"dexscreener"}
+    assert replay.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_archive_replay_async(tmp_path):
+    path = tmp_path / "archive.jsonl.gz"
+    archive = ResponseArchive(path)
+    archive.set("coingecko", "coins/contract", {"address": "abc"}, {"id": "test"})
+    archive.close()
+
+    replay = ResponseArchive(path, replay=True)
+
+    async def fetch():
+        raise AssertionError("replay must not fetch")
+
+    assert await cached_fetch_async(replay, "coingecko", "coins/contract", {"address": "abc"}, fetch) == {"id": "test"}
+    assert await cached_fetch_async(replay, "coingecko", "coins/contract", {"address": "x"}, fetch) is None
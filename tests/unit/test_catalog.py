@@ -0,0 +1,76 @@
+from datetime import datetime
+from click.testing import CliRunner
+from src.catalog import ReportCatalog, CATALOG_FILENAME, cli
+from src.utils import save_report
+from tests.conftest import make_report
+
+
+# DexScreener and holder data every saved report shares
+SNAPSHOT = dict(num_holders=7, liquidity_usd=1000.0, market_cap=5000.0)
+
+
+def save_reports(directory):
+    """Save three snapshots of AAA and one of BBB."""
+    for hour, price in ((1, 1.0), (2, 2.0), (3, 3.0)):
+        report = make_report("aaa", symbol="AAA", timestamp=datetime(2024, 12, 29, hour), price_usd=price, **SNAPSHOT)
+        save_report(report, str(directory / f"report_solana_AAA_2024122{hour}.json"))
+    save_report(make_report("bbb", symbol="BBB", timestamp=datetime(2024, 12, 30), price_usd=9.0, **SNAPSHOT),
+                str(directory / "report_solana_BBB.json"))
+
+
+def test_save_report_indexes(tmp_path):
+    """Test save_report records the report in the directory catalog."""
+    save_reports(tmp_path)
+    catalog = ReportCatalog.for_directory(tmp_path)
+
+    entries = catalog.latest(token_address="aaa")
+    assert len(entries) == 1
+    assert entries[0].price_usd == 3.0
+    assert entries[0].symbol == "AAA"
+    assert entries[0].market_cap == 5000.0
+    assert entries[0].num_holders == 7
+    assert entries[0].path.endswith("report_solana_AAA_20241223.json")
+
+
+def test_latest_per_token(tmp_path):
+    """Test latest N is applied per token, newest first."""
+    save_reports(tmp_path)
+    catalog = ReportCatalog.for_directory(tmp_path)
+
+    entries = catalog.latest(n=2)
+    assert [(e.token_address, e.price_usd) for e in entries] == [("aaa", 3.0), ("aaa", 2.0), ("bbb", 9.0)]
+    assert [e.price_usd for e in catalog.latest(symbol="AAA", n=5)] == [3.0, 2.0, 1.0]
+
+
+def test_between(tmp_path):
+    """Test snapshots between two timestamps, oldest first."""
+    save_reports(tmp_path)
+    catalog = ReportCatalog.for_directory(tmp_path)
+
+    entries = catalog.between(datetime(2024, 12, 29, 2), datetime(2024, 12, 30))
+    assert [e.price_usd for e in entries] == [2.0, 3.0, 9.0]
+    assert len(catalog.between(datetime(2024, 12, 29, 2), datetime(2024, 12, 30), token_address="aaa")) == 2
+
+
+def test_rebuild(tmp_path):
+    """Test rebuilding from report files written without indexing."""
+    save_report(make_report("aaa", symbol="AAA", timestamp=datetime(2024, 12, 29), price_usd=1.0, **SNAPSHOT),
+                str(tmp_path / "report_solana_AAA.json"), index=False)
+    assert not (tmp_path / CATALOG_FILENAME).exists()
+
+    catalog = ReportCatalog.for_directory(tmp_path)
+    assert catalog.latest() == []
+    assert catalog.rebuild(tmp_path) == 1
+    assert catalog.latest()[0].token_address == "aaa"
+
+
+def test_cli_latest(tmp_path):
+    """Test the query CLI prints one line per report."""
+    save_reports(tmp_path)
+
+    result = CliRunner().invoke(cli, ['--reports-dir', str(tmp_path), 'latest', '-n', '2'])
+
+    assert result.exit_code == 0
+    lines = result.output.strip().splitlines()
+    assert len(lines) == 3
+    assert lines[0].split('\t')[:4] == ['2024-12-29 03:00:00', 'solana', 'AAA', 'aaa']
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, Mock
+from src.coalesce import AsyncCoalescer, Coalescer, async_coalesced, coalesced, reset_coalesced
+from src.telegram import TelegramResearcher
+
+
+def test_concurrent_calls_share_result():
+    """Test concurrent calls for one key run the function once."""
+    coalescer = Coalescer()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(coalescer.run, "key", fetch)
+        started.wait(5)
+        others = [executor.submit(coalescer.run, "key", fetch) for _ in range(3)]
+        release.set()
+        results = [first.result()] + [f.result() for f in others]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+
+
+def test_exceptions_are_not_remembered():
+    """Test a failed call is retried on the next call."""
+    coalescer = Coalescer()
+
+    with pytest.raises(RuntimeError):
+        coalescer.run("key", Mock(side_effect=RuntimeError("down")))
+
+    assert coalescer.run("key", lambda: "ok") == "ok"
+
+
+def test_none_is_not_remembered():
+    """Test a failed lookup (None) is retried on the next call."""
+    coalescer = Coalescer()
+    fetch = Mock(side_effect=[None, "ok"])
+
+    assert coalescer.run("key", fetch) is None
+    assert coalescer.run("key", fetch) == "ok"
+    assert coalescer.run("key", fetch) == "ok"
+    assert fetch.call_count == 2
+
+
+def test_results_are_bounded():
+    """Test only the most recently used results are remembered."""
+    coalescer = Coalescer(max_results=2)
+    coalescer.run("a", lambda: 1)
+    coalescer.run("b", lambda: 2)
+    coalescer.run("a", lambda: 0)
+    coalescer.run("c", lambda: 3)
+
+    assert list(coalescer.results) == ["a", "c"]
+    assert coalescer.run("b", lambda: 4) == 4
+
+
+def test_coalesced_method():
+    """Test repeated handles within a run reuse the first result until reset."""
+    telegram = TelegramResearcher("test_token")
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = {'ok': True, 'result': 1000}
+
+        assert telegram.get_channel_info("test_channel").member_count == 1000
+        assert telegram.get_channel_info("test_channel").member_count == 1000
+        assert mock_get.call_count == 1
+
+        telegram.get_channel_info("other_channel")
+        assert mock_get.call_count == 2
+
+        reset_coalesced(telegram)
+        telegram.get_channel_info("test_channel")
+        assert mock_get.call_count == 3
+
+
+def test_coalesced_per_instance():
+    """Test results are not shared between instances."""
+    class Source:
+        def __init__(self):
+            self.calls = 0
+
+        @coalesced
+        def fetch(self, key):
+            self.calls += 1
+            return key
+
+    a, b = Source(), Source()
+    a.fetch("x")
+    a.fetch("x")
+    b.fetch("x")
+
+    assert a.calls == 1
+    assert b.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_calls_share_result():
+    """Test concurrent coroutines for one key await a single call."""
+    calls = []
+
+    class Client:
+        @async_coalesced
+        async def fetch(self, key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key.upper()
+
+    client = Client()
+    results = await asyncio.gather(*(client.fetch("a") for _ in range(5)), client.fetch("b"))
+
+    assert results == ["A"] * 5 + ["B"]
+    assert calls == ["a", "b"]
+
+    reset_coalesced(client)
+    await client.fetch("a")
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_owner():
+    """Test waiters run the call themselves when the first caller is cancelled."""
+    coalescer = AsyncCoalescer()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+        return "result"
+
+    owner = asyncio.ensure_future(coalescer.run("key", fetch))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(coalescer.run("key", fetch))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await waiter == "result"
+    assert owner.cancelled()
+    assert len(calls) == 2
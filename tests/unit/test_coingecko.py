@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, Mock
+from src.cache import ResponseCache
 from src.coingecko import CoinGecko
 from src.schema import CoingeckoReport
 
@@ -23,7 +24,7 @@ def test_parse_coin_data(coingecko, mock_coin_data):
 
 def test_get_coin_info(coingecko, mock_coin_data):
     """Test API call and parsing"""
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.json.return_value = mock_coin_data
         mock_get.return_value.status_code = 200
 
@@ -35,7 +36,18 @@ def test_get_coin_info(coingecko, mock_coin_data):
 
 def test_get_coin_info_error(coingecko):
     """Test error handling"""
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.side_effect = Exception("API Error")
         result = coingecko.get_coin_info("test_contract")
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+def test_unlisted_coin_is_cached(tmp_path):
+    """Test a 404 is cached, so an unlisted token is not looked up again"""
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttls={"coingecko": 3600})
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.status_code = 404
+
+        assert CoinGecko(cache=cache).get_coin_info("unlisted") is None
+        assert CoinGecko(cache=cache).get_coin_info("unlisted") is None
+
+    assert mock_get.call_count == 1
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 from datetime import datetime
 from src.dexscreener import DexScreener
 
@@ -46,7 +46,7 @@ def test_get_token_info():
     """Test getting token info from API."""
     dex = DexScreener()
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"pairs": []}
 
@@ -71,7 +71,7 @@ def test_research_tokens():
     """Test researching a token."""
     dex = DexScreener()
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
             "pairs": [{
@@ -89,4 +89,77 @@ def test_research_tokens():
 
         token = dex.research_tokens("0x123")
         assert token is not None
-        assert token.token_symbol == "TEST"
\ No newline at end of file
+        assert token.token_symbol == "TEST"
+def make_pair(address, symbol, chain="solana"):
+    return {
+        "baseToken": {"address": address, "name": symbol, "symbol": symbol},
+        "chainId": chain,
+        "dexId": "raydium",
+        "pairAddress": f"pair_{symbol}",
+        "priceUsd": "1.0"
+    }
+
+def test_research_tokens_batch():
+    """Test batched lookups are chunked and mapped back to each address."""
+    dex = DexScreener()
+    addresses = [f"addr{i}" for i in range(35)]
+
+    def fake_get(url, **kwargs):
+        requested = url.rsplit('/', 1)[-1].split(',')
+        response = Mock()
+        response.status_code = 200
+        # Addresses come back in a different case and one token has no pairs
+        response.json.return_value = {
+            "pairs": [make_pair(a.upper(), a) for a in requested if a != "addr3"]
+        }
+        return response
+
+    tokens = [(address, "solana") for address in addresses]
+
+    with patch('requests.Session.get', side_effect=fake_get) as mock_get:
+        results = dex.research_tokens_batch(tokens + [("addr0", "solana")])
+
+    assert mock_get.call_count == 2
+    assert len(mock_get.call_args_list[0].args[0].rsplit('/', 1)[-1].split(',')) == 30
+    assert set(results) == set(tokens)
+    assert results[("addr3", "solana")] is None
+    assert results[("addr34", "solana")].token_symbol == "addr34"
+
+
+def test_research_tokens_batch_matches_chain():
+    """Test batch lookups keep to the requested chain, like single lookups."""
+    dex = DexScreener()
+    base = dict(make_pair("abc", "TEST", chain="base"), pairAddress="base", liquidity={"usd": 1000})
+    ethereum = dict(make_pair("abc", "TEST", chain="ethereum"), pairAddress="eth", liquidity={"usd": 50000})
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"pairs": [base, ethereum]}
+
+        single = dex.research_tokens("abc", "base")
+        results = dex.research_tokens_batch([("abc", "base"), ("abc", "ethereum"), ("abc", "solana")])
+
+    assert mock_get.call_count == 2
+    assert results[("abc", "base")].chain == "base"
+    assert results[("abc", "base")].total_liquidity_usd == single.total_liquidity_usd == 1000
+    assert results[("abc", "ethereum")].total_liquidity_usd == 50000
+    assert results[("abc", "solana")] is None
+
+def test_process_token_data_picks_deepest_pair():
+    """Test the deepest pair on the requested chain is used and pools are aggregated."""
+    dex = DexScreener()
+    thin = dict(make_pair("abc", "TEST"), pairAddress="thin", liquidity={"usd": 100}, volume={"h24": 10})
+    deep = dict(make_pair("abc", "TEST"), pairAddress="deep", liquidity={"usd": 5000}, volume={"h24": 200})
+    other_chain = dict(make_pair("abc", "TEST", chain="base"), pairAddress="base", liquidity={"usd": 90000})
+    quote_side = dict(make_pair("xyz", "OTHER"), pairAddress="quote", liquidity={"usd": 70000})
+
+    token = dex.process_token_data(
+        {"pairs": [thin, other_chain, deep, quote_side]}, chain="solana", address="abc"
+    )
+
+    assert token.pair_address == "deep"
+    assert token.pair_count == 2
+    assert token.total_liquidity_usd == 5100
+    assert token.total_volume_24h == 210
+
+    assert dex.process_token_data({"pairs": [thin]}, chain="ethereum") is None
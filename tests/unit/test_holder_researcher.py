@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from unittest.mock import patch, Mock
+from src.holder_researcher import HolderResearcher, gini_coefficient, top_holder_concentration
+from src.solscan import TokenMetadata
+
+
+def naive_gini(x):
+    """Pairwise definition from token_metrics.md."""
+    n = len(x)
+    return np.abs(x[:, None] - x[None, :]).sum() / (2 * n * n * x.mean())
+
+
+def test_gini_matches_pairwise_definition():
+    balances = np.random.default_rng(0).pareto(1.5, 500)
+    assert gini_coefficient(balances) == pytest.approx(naive_gini(balances))
+
+
+def test_gini_edge_cases():
+    assert gini_coefficient(np.array([5.0, 5.0, 5.0])) == pytest.approx(0.0)
+    assert gini_coefficient(np.array([0.0, 0.0, 10.0])) == pytest.approx(2 / 3)
+    assert gini_coefficient(np.array([])) is None
+
+
+def test_top_holder_concentration():
+    balances = np.arange(1, 31, dtype=np.float64)
+    assert top_holder_concentration(balances, 10, 1000) == pytest.approx(sum(range(21, 31)) / 10)
+    assert top_holder_concentration(balances[:5], 10, 1000) == pytest.approx(1.5)
+    assert top_holder_concentration(balances, 10, 0) is None
+
+
+def make_metadata(holders, supply):
+    return TokenMetadata(
+        address="abc", name="Test", symbol="TEST", icon="", decimals=6, holder=holders,
+        creator="", create_tx="", created_time=0, first_mint_tx="", first_mint_time=0,
+        mint_authority=None, freeze_authority=None, supply=str(supply), price=1.0,
+        volume_24h=0.0, market_cap=0.0, market_cap_rank=0, price_change_24h=0.0
+    )
+
+
+def holder_pages(amounts, page_size=40):
+    """Fake Solscan holder pages, largest balances first."""
+    amounts = sorted(amounts, reverse=True)
+    for i in range(0, len(amounts), page_size):
+        yield len(amounts), [{"amount": a} for a in amounts[i:i + page_size]]
+
+
+def test_get_holder_distribution():
+    """Test holders are streamed across pages into concentration metrics."""
+    researcher = HolderResearcher()
+    amounts = list(range(1, 101))
+
+    with patch.object(researcher.solscan, 'get_token_metadata', return_value=make_metadata(100, 5050)), \
+            patch.object(researcher.solscan, 'iter_token_holders', return_value=holder_pages(amounts)):
+        distribution = researcher.get_holder_distribution("abc", "solana")
+
+    assert distribution.num_holders == 100
+    assert distribution.holders_analyzed == 100
+    assert distribution.top10_holder_concentration == pytest.approx(sum(range(91, 101)) / 5050 * 100)
+    assert distribution.gini_coefficient == pytest.approx(naive_gini(np.array(amounts, dtype=float)))
+
+
+def test_get_holder_distribution_capped():
+    """Test only the first page is used, without Gini, past max_holders."""
+    researcher = HolderResearcher(max_holders=50)
+    amounts = list(range(1, 101))
+    pages = holder_pages(amounts)
+
+    with patch.object(researcher.solscan, 'get_token_metadata', return_value=make_metadata(100, 5050)), \
+            patch.object(researcher.solscan, 'iter_token_holders', return_value=pages):
+        distribution = researcher.get_holder_distribution("abc", "solana")
+
+    assert distribution.holders_analyzed == 40
+    assert len(list(pages)) == 2  # later pages were never requested
+    assert distribution.gini_coefficient is None
+    assert distribution.top20_holder_concentration == pytest.approx(sum(range(81, 101)) / 5050 * 100)
+
+
+def test_get_holder_distribution_time_budget():
+    """Test paging stops once the time budget is spent, keeping the holder count."""
+    researcher = HolderResearcher(time_budget=0)
+    amounts = list(range(1, 101))
+    pages = holder_pages(amounts)
+
+    with patch.object(researcher.solscan, 'get_token_metadata', return_value=make_metadata(100, 5050)), \
+            patch.object(researcher.solscan, 'iter_token_holders', return_value=pages):
+        distribution = researcher.get_holder_distribution("abc", "solana")
+
+    assert distribution.num_holders == 100
+    assert distribution.holders_analyzed == 40
+    assert len(list(pages)) == 2
+    assert distribution.gini_coefficient is None
+    assert distribution.top10_holder_concentration == pytest.approx(sum(range(91, 101)) / 5050 * 100)
+
+
+def test_iter_token_holders_pages():
+    """Test the holders endpoint is paged until a short page."""
+    researcher = HolderResearcher()
+    pages = [
+        {"data": {"total": 45, "items": [{"amount": 1}] * 40}},
+        {"data": {"total": 45, "items": [{"amount": 1}] * 5}},
+    ]
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value = Mock(status_code=200)
+        mock_get.return_value.json.side_effect = pages
+
+        balances, total = researcher.get_holder_balances("abc")
+
+    assert total == 45
+    assert len(balances) == 45
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs['params']['page'] == 2
+
+
+def test_other_chains():
+    assert HolderResearcher().get_holder_distribution("0xabc", "base").num_holders == 0
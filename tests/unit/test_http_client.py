@@ -0,0 +1,94 @@
+import pytest
+import requests
+from unittest.mock import patch, Mock
+from src.http_client import HttpClient, get_http_client
+from src.dexscreener import DexScreener
+from src.coingecko import CoinGecko
+
+
+def test_shared_client():
+    """Test API clients share one pooled session by default."""
+    assert get_http_client() is get_http_client()
+    assert DexScreener().http is CoinGecko().http
+
+
+def test_pool_size():
+    """Test the adapter is configured with the requested pool size."""
+    client = HttpClient(pool_connections=4, pool_maxsize=8)
+    adapter = client.session.get_adapter("https://api.dexscreener.com")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 8
+
+
+def test_default_timeout():
+    """Test requests get the default timeout unless one is given."""
+    client = HttpClient(timeout=(1, 2))
+
+    with patch('requests.Session.get') as mock_get:
+        client.get("https://example.com")
+        assert mock_get.call_args.kwargs['timeout'] == (1, 2)
+
+        client.get("https://example.com", timeout=5)
+        assert mock_get.call_args.kwargs['timeout'] == 5
+
+
+def make_response(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_retry_after_429():
+    """Test a 429 is retried after pausing the host for Retry-After seconds."""
+    client = HttpClient(rate_limits={"api.coingecko.com": 100}, max_retries=2)
+    bucket = client.buckets["api.coingecko.com"]
+
+    with patch('requests.Session.get') as mock_get, patch.object(bucket, 'pause') as mock_pause:
+        mock_get.side_effect = [make_response(429, {"Retry-After": "7"}), make_response(200)]
+
+        response = client.get("https://api.coingecko.com/api/v3/ping")
+
+    assert response.status_code == 200
+    assert mock_get.call_count == 2
+    mock_pause.assert_called_once_with(7.0)
+
+
+def test_retry_server_error_with_backoff():
+    """Test 5xx responses are retried with backoff until retries run out."""
+    client = HttpClient(rate_limits={}, max_retries=2, backoff_base=1, backoff_max=10)
+
+    with patch('requests.Session.get') as mock_get, patch('src.http_client.time.sleep') as mock_sleep:
+        mock_get.return_value = make_response(503)
+
+        response = client.get("https://api.dexscreener.com/latest/dex/tokens/abc")
+
+    assert response.status_code == 503
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert all(0 <= call.args[0] <= 2 for call in mock_sleep.call_args_list)
+
+
+def test_retry_connection_error():
+    """Test connection errors are retried and re-raised once retries run out."""
+    client = HttpClient(rate_limits={}, max_retries=1)
+
+    with patch('requests.Session.get') as mock_get, patch('src.http_client.time.sleep'):
+        mock_get.side_effect = requests.ConnectionError("reset")
+
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://api.dexscreener.com/latest/dex/tokens/abc")
+
+    assert mock_get.call_count == 2
+
+
+def test_no_retry_on_client_error():
+    """Test 4xx responses other than 429 are returned immediately."""
+    client = HttpClient(rate_limits={})
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value = make_response(404)
+        assert client.get("https://api.coingecko.com/api/v3/coins/x").status_code == 404
+
+    assert mock_get.call_count == 1
@@ -0,0 +1,93 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+from src.cache import ResponseCache, cached_fetch
+from src.http_client import HttpClient
+from src.instrumentation import Metrics, metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def series(name, kind='counters'):
+    return {tuple(sorted(s['labels'].items())): s for s in metrics.snapshot()[kind] if s['name'] == name}
+
+
+def test_counters_and_timers():
+    """Test counters add up per label set and timers keep count, total and max."""
+    registry = Metrics()
+    registry.incr('requests_total', host='a')
+    registry.incr('requests_total', 2, host='a')
+    registry.incr('requests_total', host='b')
+    registry.observe('seconds', 0.5, source='dex')
+    registry.observe('seconds', 1.5, source='dex')
+
+    snapshot = registry.snapshot()
+    assert [c['value'] for c in snapshot['counters']] == [3, 1]
+    timer = snapshot['timers'][0]
+    assert (timer['count'], timer['total'], timer['max'], timer['mean']) == (2, 2.0, 1.5, 1.0)
+
+
+def test_timer_records_on_error():
+    registry = Metrics()
+    with pytest.raises(ValueError):
+        with registry.timer('seconds', source='x'):
+            raise ValueError()
+    assert registry.snapshot()['timers'][0]['count'] == 1
+
+
+def test_prometheus_format():
+    """Test counters and timers are exported in the Prometheus text format."""
+    registry = Metrics()
+    registry.incr('http_requests_total', host='api.x', status=200)
+    registry.observe('source_seconds', 0.25, source='dex')
+
+    text = registry.to_prometheus()
+    assert '# TYPE token_research_http_requests_total counter' in text
+    assert 'token_research_http_requests_total{host="api.x",status="200"} 1' in text
+    assert 'token_research_source_seconds_count{source="dex"} 1' in text
+    assert 'token_research_source_seconds_sum{source="dex"} 0.250000' in text
+    assert 'token_research_source_seconds_max{source="dex"} 0.250000' in text
+
+
+def test_write_by_suffix(tmp_path):
+    registry = Metrics()
+    registry.incr('x_total')
+
+    registry.write(str(tmp_path / 'metrics.json'))
+    registry.write(str(tmp_path / 'metrics.prom'))
+
+    assert json.loads((tmp_path / 'metrics.json').read_text())['counters'][0]['name'] == 'x_total'
+    assert (tmp_path / 'metrics.prom').read_text().startswith('# TYPE token_research_x_total counter')
+
+
+def test_http_client_records_retries_and_bytes():
+    """Test requests, 429s, retries and downloaded bytes are counted per host."""
+    throttled = Mock(status_code=429, headers={'Retry-After': '0'}, content=b'')
+    ok = Mock(status_code=200, headers={}, content=b'{"ok": true}')
+    client = HttpClient(rate_limits={}, backoff_base=0)
+
+    with patch('requests.Session.get', side_effect=[throttled, ok]), patch('time.sleep'):
+        client.get("https://api.example.com/x")
+
+    requests = series('http_requests_total')
+    assert requests[(('host', 'api.example.com'), ('status', '429'))]['value'] == 1
+    assert requests[(('host', 'api.example.com'), ('status', '200'))]['value'] == 1
+    assert series('http_retries_total')[(('host', 'api.example.com'), ('reason', '429'))]['value'] == 1
+    assert series('http_response_bytes_total')[(('host', 'api.example.com'),)]['value'] == len(ok.content)
+
+
+def test_cache_hits_and_endpoint_timers(tmp_path):
+    """Test cache misses time the endpoint call and hits skip it."""
+    cache = ResponseCache(tmp_path / 'cache.sqlite', ttls={'dexscreener': 60})
+    for _ in range(3):
+        cached_fetch(cache, 'dexscreener', 'tokens', {'address': 'a'}, lambda: {'pairs': []})
+
+    labels = (('endpoint', 'tokens'), ('source', 'dexscreener'))
+    assert series('cache_misses_total')[labels]['value'] == 1
+    assert series('cache_hits_total')[labels]['value'] == 2
+    assert series('endpoint_seconds', 'timers')[labels]['count'] == 1
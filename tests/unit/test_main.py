@@ -0,0 +1,73 @@
+from datetime import datetime
+from unittest.mock import patch
+from src.main import main, parse_tokens
+from tests.conftest import make_report
+
+
+REPORT_TIME = datetime(2024, 12, 29, 0, 47, 44)
+
+
+def test_parse_tokens():
+    """Test parsing address,chain lines."""
+    lines = ["# comment", "", "abc,solana", "0x123", " def , base "]
+    tokens = parse_tokens(lines, "ethereum")
+
+    assert tokens == [("abc", "solana"), ("0x123", "ethereum"), ("def", "base")]
+
+
+def test_main_requires_token(runner):
+    """Test that a token address or tokens file is required."""
+    result = runner.invoke(main, [])
+    assert result.exit_code != 0
+
+
+def test_main_batch_reuses_reporter(runner, temp_output_dir):
+    """Test batch mode shares one reporter and writes one file per token."""
+    tokens = "aaa,solana\nbbb,base\nccc,solana\n"
+
+    with patch('src.main.Reporter') as mock_reporter_cls:
+        reporter = mock_reporter_cls.return_value
+        reporter.generate_report.side_effect = [
+            make_report("aaa", "solana", "AAA", REPORT_TIME),
+            make_report("bbb", "base", "BBB", REPORT_TIME),
+            None,
+        ]
+        reporter.dex.research_tokens_batch.return_value = {}
+
+        result = runner.invoke(main, [
+            '--tokens-file', '-',
+            '--output-dir', str(temp_output_dir),
+            '--no-cache'
+        ], input=tokens)
+
+    assert result.exit_code == 0
+    assert mock_reporter_cls.call_count == 1
+    assert mock_reporter_cls.call_args.kwargs['cache'] is None
+    assert reporter.generate_report.call_count == 3
+    reporter.dex.research_tokens_batch.assert_called_once_with([("aaa", "solana"), ("bbb", "base"), ("ccc", "solana")])
+
+    report_files = sorted(p.name for p in temp_output_dir.glob("report_*.json"))
+    assert report_files == [
+        "report_base_BBB_bbb_20241229_004744.json",
+        "report_solana_AAA_aaa_20241229_004744.json",
+    ]
+
+
+def test_main_batch_same_symbol(runner, temp_output_dir):
+    """Test tokens sharing a ticker and timestamp get separate report files."""
+    with patch('src.main.Reporter') as mock_reporter_cls:
+        reporter = mock_reporter_cls.return_value
+        reporter.generate_report.side_effect = [
+            make_report("aaa", "solana", "JAIL", REPORT_TIME),
+            make_report("bbb", "solana", "JAIL", REPORT_TIME),
+        ]
+        reporter.dex.research_tokens_batch.return_value = {}
+
+        result = runner.invoke(main, [
+            '--tokens-file', '-',
+            '--output-dir', str(temp_output_dir),
+            '--no-cache'
+        ], input="aaa,solana\nbbb,solana\n")
+
+    assert result.exit_code == 0
+    assert len(list(temp_output_dir.glob("report_*.json"))) == 2
@@ -0,0 +1,58 @@
+import math
+import numpy as np
+import pytest
+from datetime import datetime
+from src.metrics import compute_metrics
+from src.schema import (
+    Report, CoingeckoReport, MarketData, TwitterResponse, TwitterUser, RecentTwitterMetrics
+)
+from src.utils import reports_to_frame
+from tests.conftest import make_report
+
+
+COINGECKO = CoingeckoReport(market_data=MarketData(circulating_supply=1_000_000))
+TWITTER = TwitterResponse(
+    user=TwitterUser(twitter_handle="x", twitter_id=1, twitter_created_at=datetime(2020, 1, 1)),
+    metrics=RecentTwitterMetrics(num_recent_posts=5, avg_engagement=30.0, avg_impressions=1000.0)
+)
+
+
+def test_compute_metrics():
+    """Test each metric against its token_metrics.md formula."""
+    report = make_report(coingecko=COINGECKO, twitter=TWITTER, price_usd=2.0, liquidity_usd=300_000,
+                         market_cap=1_000_000, volume_24h=500_000, buys_24h=75, sells_24h=25, buys_5m=0, sells_5m=0)
+
+    row = compute_metrics([report]).iloc[0]
+
+    assert row['turnover_rate'] == pytest.approx(25.0)
+    assert row['liquidity_depth'] == pytest.approx(30.0)
+    assert row['liquidity_alpha']
+    assert row['net_flow_ratio_24h'] == pytest.approx(0.5)
+    assert math.isnan(row['net_flow_ratio_5m'])
+    assert row['engagement_rate'] == pytest.approx(3.0)
+
+
+def test_compute_metrics_fallbacks_and_missing_sources():
+    """Test FDV stands in for market cap and missing sources give NaN instead of errors."""
+    report = make_report(coingecko=COINGECKO, twitter=TWITTER, liquidity_usd=50_000, fdv=1_000_000,
+                         total_liquidity_usd=80_000)
+    partial = Report(token_address="b", chain="solana", timestamp=datetime(2024, 12, 29))
+
+    frame = compute_metrics([report, partial])
+
+    assert frame['liquidity_depth'].iloc[0] == pytest.approx(8.0)
+    assert not frame['liquidity_alpha'].iloc[0]
+    assert frame[['turnover_rate', 'liquidity_depth', 'engagement_rate']].iloc[1].isna().all()
+
+
+def test_compute_metrics_from_frame_matches_reports():
+    """Test a reports_to_frame frame gives the same metrics as the reports."""
+    reports = [make_report(str(i), coingecko=COINGECKO, twitter=TWITTER, price_usd=1.0 + i, liquidity_usd=1000.0 * i,
+                           market_cap=10_000.0, buys_1h=i, sells_1h=3) for i in range(5)]
+
+    from_reports = compute_metrics(reports)
+    from_frame = compute_metrics(reports_to_frame(reports))
+
+    for column in ('turnover_rate', 'liquidity_depth', 'net_flow_ratio_1h', 'engagement_rate'):
+        np.testing.assert_allclose(from_frame[column], from_reports[column])
+    assert list(from_frame['token_address']) == [str(i) for i in range(5)]
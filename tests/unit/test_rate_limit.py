@@ -0,0 +1,41 @@
+import pytest
+from unittest.mock import patch
+from src.rate_limit import TokenBucket
+
+
+def test_burst_then_rate():
+    """Test idle capacity is spent first, then requests are spaced by the rate."""
+    with patch('src.rate_limit.time.monotonic', return_value=100.0):
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_refill():
+    """Test tokens accumulate over time up to the capacity."""
+    with patch('src.rate_limit.time.monotonic') as mock_time:
+        mock_time.return_value = 100.0
+        bucket = TokenBucket(rate=1, capacity=1)
+        assert bucket.reserve() == 0
+
+        mock_time.return_value = 110.0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_pause():
+    """Test a pause delays every following request."""
+    with patch('src.rate_limit.time.monotonic', return_value=100.0):
+        bucket = TokenBucket(rate=10, capacity=10)
+        bucket.pause(5)
+
+        assert bucket.reserve() == pytest.approx(5.1)
+        assert bucket.reserve() == pytest.approx(5.2)
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
@@ -0,0 +1,68 @@
+import pyarrow.dataset as ds
+from datetime import datetime
+from src.report_store import ReportStore, REPORT_SCHEMA
+from src.schema import TwitterResponse, TwitterUser, Tweet
+from tests.conftest import make_report
+
+
+TWITTER = TwitterResponse(
+    user=TwitterUser(twitter_handle="test_x", twitter_id=1, twitter_followers=10,
+                     twitter_created_at=datetime(2024, 12, 29)),
+    recent_tweets=[Tweet(tweet_text="gm", tweet_likes=5, tweet_created_at=datetime(2024, 12, 29))],
+    metrics={'num_recent_posts': 1}
+)
+
+
+def test_append_partitions_by_chain_and_date(tmp_path):
+    """Test reports land in chain=/date= directories."""
+    store = ReportStore(tmp_path)
+    written = store.append([
+        make_report("a", "solana", timestamp=datetime(2024, 12, 29, 10), liquidity_usd=100.0, twitter=TWITTER),
+        make_report("b", "base", timestamp=datetime(2024, 12, 30, 10), liquidity_usd=200.0, twitter=TWITTER),
+    ])
+
+    assert written == 2
+    assert list((tmp_path / "chain=solana" / "date=2024-12-29").glob("*.parquet"))
+    assert list((tmp_path / "chain=base" / "date=2024-12-30").glob("*.parquet"))
+
+
+def test_read_keeps_nested_columns(tmp_path):
+    """Test recent_tweets round-trips as a nested list column."""
+    store = ReportStore(tmp_path)
+    store.append([
+        make_report("a", "solana", timestamp=datetime(2024, 12, 29, 10), liquidity_usd=100.0, twitter=TWITTER),
+    ])
+
+    table = store.read(columns=['token_address', 'twitter'])
+
+    assert table.column_names == ['token_address', 'twitter']
+    twitter = table.column('twitter')[0].as_py()
+    assert twitter['recent_tweets'][0]['tweet_text'] == "gm"
+    assert twitter['user']['twitter_followers'] == 10
+
+
+def test_read_filters(tmp_path):
+    """Test chain, date range and predicate filters across appends."""
+    store = ReportStore(tmp_path)
+    store.append([
+        make_report("a", "solana", timestamp=datetime(2024, 12, 29, 10), liquidity_usd=100.0, twitter=TWITTER),
+    ])
+    store.append([
+        make_report("b", "solana", timestamp=datetime(2024, 12, 30, 10), liquidity_usd=200.0, twitter=TWITTER),
+        make_report("c", "base", timestamp=datetime(2024, 12, 30, 10), liquidity_usd=300.0, twitter=TWITTER),
+    ])
+
+    assert store.read().num_rows == 3
+    assert sorted(store.read(chain='solana').column('token_address').to_pylist()) == ['a', 'b']
+    assert store.read(start=datetime(2024, 12, 30)).num_rows == 2
+
+    table = store.read(columns=['token_address'], filter=ds.field('dex', 'liquidity_usd') > 150)
+    assert sorted(table.column('token_address').to_pylist()) == ['b', 'c']
+
+
+def test_read_missing_store(tmp_path):
+    """Test reading a store that was never written returns an empty table."""
+    table = ReportStore(tmp_path / "missing").read()
+
+    assert table.num_rows == 0
+    assert table.schema == REPORT_SCHEMA
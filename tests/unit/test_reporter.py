@@ -0,0 +1,182 @@
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from src.instrumentation import metrics
+from src.reporter import Reporter
+from src.holder_researcher import HolderDistribution
+from src.sources import DexSource, HoldersSource
+from src.schema import TelegramChannel
+from tests.conftest import mocked_reporter
+
+
+@pytest.fixture
+def make_reporter(token_info, coingecko_data):
+    """Build a Reporter whose sources are all mocked."""
+    clients = ['DexScreener', 'CoinGecko', 'TwitterResearcher', 'TelegramResearcher', 'HolderResearcher']
+    with mocked_reporter(Reporter, clients, token_info, coingecko_data) as factory:
+        yield factory
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_generate_report(make_reporter, concurrent):
+    """Test both execution modes produce the same report."""
+    reporter = make_reporter(concurrent=concurrent)
+    report = reporter.generate_report("abc", "solana")
+
+    assert report is not None
+    assert report.num_holders == 42
+    assert report.gini_coefficient == 0.5
+    assert report.dex.token_symbol == "TEST"
+    assert report.telegram.member_count == 10
+    reporter.twitter.get_twitter_info.assert_called_once_with("test_x")
+
+
+def test_generate_report_runs_sources_in_parallel(make_reporter):
+    """Test Twitter and Telegram lookups overlap once CoinGecko is done."""
+    reporter = make_reporter(concurrent=True)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def twitter(handle):
+        barrier.wait()
+        return None
+
+    def telegram(handle):
+        barrier.wait()
+        return TelegramChannel(telegram_handle=handle, member_count=10)
+
+    reporter.twitter.get_twitter_info.side_effect = twitter
+    reporter.telegram.get_channel_info.side_effect = telegram
+
+    report = reporter.generate_report("abc", "solana")
+    assert report is not None
+    assert report.telegram.member_count == 10
+
+
+def test_generate_report_source_timeout(make_reporter):
+    """Test a slow optional source is dropped after its timeout."""
+    reporter = make_reporter(concurrent=True, source_timeout=0.1)
+
+    def telegram(handle):
+        time.sleep(1)
+        return TelegramChannel(telegram_handle=handle, member_count=10)
+
+    reporter.telegram.get_channel_info.side_effect = telegram
+
+    start = time.monotonic()
+    report = reporter.generate_report("abc", "solana")
+
+    assert time.monotonic() - start < 1
+    assert report is not None
+    assert report.telegram is None
+    assert report.sources['telegram'].status == "timeout"
+
+
+def test_source_timeout_starts_when_source_runs(make_reporter, coingecko_data):
+    """Test time spent queued for a worker does not count against a source."""
+    reporter = make_reporter(concurrent=True, source_timeout=0.2, max_workers=1)
+
+    def slow(value):
+        def fetch(*args):
+            time.sleep(0.15)
+            return value
+        return fetch
+
+    reporter.coingecko.get_coin_info.side_effect = slow(coingecko_data)
+    reporter.holder_researcher.get_holder_distribution.side_effect = slow(HolderDistribution(num_holders=42))
+
+    report = reporter.generate_report("abc", "solana")
+
+    assert {name: status.status for name, status in report.sources.items()} == {
+        'dex': 'ok', 'coingecko': 'ok', 'holders': 'ok', 'twitter': 'empty', 'telegram': 'ok'
+    }
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_generate_report_partial_on_source_error(make_reporter, concurrent):
+    """Test a failing source leaves a partial report and skips its dependents."""
+    reporter = make_reporter(concurrent=concurrent)
+    reporter.coingecko.get_coin_info.side_effect = RuntimeError("CoinGecko down")
+    reporter.holder_researcher.get_holder_distribution.side_effect = AttributeError("no metadata")
+
+    report = reporter.generate_report("abc", "solana")
+
+    assert report is not None
+    assert report.dex.token_symbol == "TEST"
+    assert report.coingecko is None
+    assert report.num_holders == 0
+    statuses = {name: status.status for name, status in report.sources.items()}
+    assert statuses == {
+        'dex': 'ok', 'coingecko': 'error', 'holders': 'error', 'twitter': 'skipped', 'telegram': 'skipped'
+    }
+    assert report.sources['coingecko'].error == "CoinGecko down"
+    reporter.twitter.get_twitter_info.assert_not_called()
+
+
+def test_generate_report_unconfigured_sources(make_reporter):
+    """Test missing API tokens make the social sources unavailable instead of failing."""
+    with patch('src.reporter.TwitterResearcher', side_effect=ValueError("Twitter bearer token is required")), \
+            patch('src.reporter.TelegramResearcher', side_effect=ValueError("Telegram bot token is required")):
+        reporter = make_reporter(concurrent=True)
+
+    report = reporter.generate_report("abc", "solana")
+
+    assert report is not None
+    assert reporter.twitter is None
+    assert report.sources['twitter'].status == "unavailable"
+    assert report.sources['telegram'].status == "unavailable"
+    assert report.sources['coingecko'].status == "ok"
+
+
+def test_generate_report_custom_sources(make_reporter, token_info):
+    """Test a Reporter runs the source plugins it is given."""
+    class TokenSource(DexSource):
+        def fetch(self, context):
+            return token_info
+
+    class SymbolLengthSource(HoldersSource):
+        deps = ('dex',)
+
+        def fetch(self, context):
+            return HolderDistribution(num_holders=len(context.results['dex'].token_symbol))
+
+    reporter = make_reporter(concurrent=False, sources=[TokenSource(object()), SymbolLengthSource(object())])
+    report = reporter.generate_report("abc", "solana")
+
+    assert report.num_holders == 4
+    assert list(report.sources) == ['dex', 'holders']
+
+
+@pytest.mark.parametrize("sources, message", [
+    ([("a", ("b",)), ("b", ("a",))], "cycle"),
+    ([("a", ("a",))], "cycle"),
+    ([("a", ("c",))], "unknown"),
+])
+def test_reporter_rejects_bad_dependencies(sources, message):
+    """Test sources with unknown or cyclic dependencies are rejected up front."""
+    plugins = [type(name, (DexSource,), {'name': name, 'deps': deps})(object()) for name, deps in sources]
+
+    with pytest.raises(ValueError, match=message):
+        Reporter(sources=plugins)
+
+
+def test_generate_report_token_not_found(make_reporter):
+    """Test no report is produced when DexScreener has no data."""
+    reporter = make_reporter(concurrent=True)
+    reporter.dex.research_tokens.return_value = None
+
+    assert reporter.generate_report("abc", "solana") is None
+
+
+def test_generate_report_records_source_metrics(make_reporter):
+    """Test each source's status and time are added to the metrics registry."""
+    metrics.reset()
+
+    make_reporter(concurrent=False).generate_report("abc", "solana")
+
+    statuses = {(c['labels']['source'], c['labels']['status']) for c in metrics.snapshot()['counters']
+                if c['name'] == 'source_status_total'}
+    assert ('dex', 'ok') in statuses
+    assert ('twitter', 'empty') in statuses
+    assert {t['labels'].get('source') for t in metrics.snapshot()['timers'] if t['name'] == 'source_seconds'} >= {'dex'}
+    metrics.reset()
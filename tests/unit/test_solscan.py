@@ -7,7 +7,7 @@ def solscan():
     return Solscan()
 
 def test_get_token_metadata_success(solscan):
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_response = Mock()
         mock_response.json.return_value = {
             "success": True,
@@ -41,7 +41,7 @@ def test_get_token_metadata_success(solscan):
         assert result.name == "Test Token"
 
 def test_get_token_metadata_error(solscan):
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.side_effect = Exception("API Error")
 
         result = solscan.get_token_metadata("test123")
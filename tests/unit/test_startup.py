@@ -0,0 +1,34 @@
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ('pandas', 'numpy', 'tweepy', 'pyarrow', 'zstandard')
+
+
+def imported_heavy_modules(code: str) -> list:
+    """Run `code` in a fresh interpreter and return the heavy modules it imported."""
+    script = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_main_import_is_light():
+    """Test the CLI entry point does not import pandas, numpy, tweepy or pyarrow."""
+    assert imported_heavy_modules("import src.main") == []
+
+
+def test_reporter_defers_heavy_imports():
+    """Test building a Reporter leaves tweepy and numpy until they are used."""
+    code = (
+        "import os\n"
+        "os.environ.setdefault('TWITTER_BEARER_TOKEN', 'token')\n"
+        "os.environ.setdefault('TELEGRAM_BOT_TOKEN', 'token')\n"
+        "from src.reporter import Reporter\n"
+        "Reporter(cache=None)"
+    )
+    assert imported_heavy_modules(code) == []
+
+
+def test_csv_export_imports_pandas():
+    """Test pandas is still loaded when a frame is built."""
+    assert 'pandas' in imported_heavy_modules("from src.utils import reports_to_frame\nreports_to_frame([])")
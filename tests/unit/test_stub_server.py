@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import patch
+from benchmarks.stub_server import Faults, StubServer
+from src.async_clients import AsyncDexScreener
+from src.async_http import AsyncHttpClient
+from src.cache import ResponseArchive
+from src.config import Config
+from src.dexscreener import DexScreener
+from src.http_client import HttpClient
+from src.reporter import Reporter
+
+
+@pytest.fixture
+def stub_config():
+    """Start a stub server and point Config's base URLs at it."""
+    with StubServer() as server:
+        with patch.multiple(Config, **server.env()), patch.object(Config, 'TELEGRAM_BOT_TOKEN', 'stub'), \
+                patch.object(Config, 'TWITTER_BEARER_TOKEN', None):
+            yield server
+
+
+def test_full_report_from_stub(stub_config):
+    """Test every stubbed source yields data for an arbitrary address."""
+    reporter = Reporter(concurrent=False)
+    reporter.holder_researcher.max_holders = 100
+
+    report = reporter.generate_report("StubAddress", "solana")
+
+    assert report.dex.token_address == "StubAddress"
+    assert report.coingecko.contract_address == "StubAddress"
+    assert report.holders_analyzed == 40  # more holders than max_holders: first page only
+    assert report.telegram.member_count > 0
+    assert {name: s.status for name, s in report.sources.items() if name != 'twitter'} == {
+        'dex': 'ok', 'coingecko': 'ok', 'holders': 'ok', 'telegram': 'ok'
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_report_matches_sync(stub_config):
+    """Test the async clients build the same report as the sync ones."""
+    from src.async_reporter import AsyncReporter
+
+    reporter = Reporter(concurrent=False)
+    reporter.holder_researcher.max_holders = 100
+    expected = reporter.generate_report("StubAddress", "solana")
+
+    async with AsyncReporter() as async_reporter:
+        async_reporter.holder_researcher.max_holders = 100
+        report = await async_reporter.generate_report("StubAddress", "solana")
+
+    exclude = {'timestamp': True, 'dex': {'timestamp'}, 'sources': {'__all__': {'elapsed'}}}
+    assert report.model_dump(exclude=exclude) == expected.model_dump(exclude=exclude)
+
+
+def test_batch_request(stub_config):
+    dex = DexScreener()
+    results = dex.research_tokens_batch([(f"addr{i}", "solana") for i in range(35)])
+
+    assert all(info is not None for info in results.values())
+    assert stub_config.requests[('dex', 200)] == 2
+
+
+def test_injected_errors():
+    """Test injected 500s and 429s are returned to the client."""
+    with StubServer(faults=Faults(error_rate=0.5, throttle_rate=0.5)) as server:
+        http = HttpClient(rate_limits={}, max_retries=0)
+        statuses = {http.get(f"{server.url}/dex/tokens/abc").status_code for _ in range(20)}
+
+    assert statuses == {429, 500}
+
+
+def test_record_then_replay_offline(tmp_path):
+    """Test a recorded run rebuilds the same report once the APIs are gone."""
+    path = tmp_path / "archive.jsonl.gz"
+    archive = ResponseArchive(path)
+    with StubServer() as server:
+        with patch.multiple(Config, **server.env()), patch.object(Config, 'TELEGRAM_BOT_TOKEN', 'stub'), \
+                patch.object(Config, 'TWITTER_BEARER_TOKEN', None):
+            reporter = Reporter(concurrent=False, cache=archive)
+            reporter.holder_researcher.max_holders = 100
+            recorded = reporter.generate_report("StubAddress", "solana")
+            archive.close()
+
+            # The server is stopped, so any request would fail
+            server.stop()
+            replay = ResponseArchive(path, replay=True)
+            reporter = Reporter(concurrent=False, cache=replay)
+            reporter.holder_researcher.max_holders = 100
+            replayed = reporter.generate_report("StubAddress", "solana")
+
+    assert replay.misses == 0
+    exclude = {'timestamp', 'sources'}
+    assert replayed.model_dump(exclude=exclude | {'dex'}) == recorded.model_dump(exclude=exclude | {'dex'})
+    assert replayed.dex.model_dump(exclude={'timestamp'}) == recorded.dex.model_dump(exclude={'timestamp'})
+
+
+@pytest.mark.asyncio
+async def test_replay_batches_chunked_differently(stub_config, tmp_path):
+    """Test recorded batch lookups replay under any chunking, and for single lookups."""
+    tokens = [(f"addr{i}", "solana") for i in range(30)]
+    path = tmp_path / "archive.jsonl.gz"
+    archive = ResponseArchive(path)
+    dex = DexScreener(cache=archive)
+    recorded = {**dex.research_tokens_batch(tokens[:20] + tokens[:1]), **dex.research_tokens_batch(tokens[20:])}
+    archive.close()
+
+    replay = ResponseArchive(path, replay=True)
+    http = AsyncHttpClient(rate_limits={})
+    try:
+        replayed = await AsyncDexScreener(http, cache=replay).research_tokens_batch(tokens[::-1])
+    finally:
+        await http.close()
+    single = DexScreener(cache=replay).research_tokens("addr25", "solana")
+
+    assert replay.misses == 0
+    assert stub_config.requests[('dex', 200)] == 2
+    for token in tokens:
+        assert replayed[token].model_dump(exclude={'timestamp'}) == recorded[token].model_dump(exclude={'timestamp'})
+    assert single.pair_address == recorded[("addr25", "solana")].pair_address
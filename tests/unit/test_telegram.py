@@ -11,7 +11,7 @@ def test_get_channel_info():
         'result': 1000
     }
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = mock_response
 
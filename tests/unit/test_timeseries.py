@@ -0,0 +1,123 @@
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from src.timeseries import SnapshotStore, TokenTracker, SNAPSHOT_DTYPE, DAY
+from tests.conftest import make_info
+
+
+@pytest.fixture
+def now():
+    # Start of a UTC day, a few days ago, so every snapshot is inside the replay window
+    return (time.time() // DAY - 5) * DAY
+
+
+def test_append_and_read(tmp_path, now):
+    """Test records round-trip and filter by token and time."""
+    store = SnapshotStore(tmp_path)
+    store.append([
+        make_info("a", timestamp=now, price_usd=1.0, volume_24h=1000.0),
+        make_info("b", timestamp=now, price_usd=2.0),
+    ])
+    store.append([make_info("a", timestamp=now + 60, price_usd=1.5, volume_24h=1000.0)])
+
+    assert len(store) == 3
+    assert (tmp_path / "snapshots.bin").stat().st_size == 3 * SNAPSHOT_DTYPE.itemsize
+
+    records = store.read(token_address="a")
+    assert records['price_usd'].tolist() == [1.0, 1.5]
+    assert records['volume_24h'].tolist() == [1000.0, 1000.0]
+    assert len(store.read(start=datetime.fromtimestamp(now + 30))) == 1
+
+
+def test_rolling_metrics(tmp_path, now):
+    """Test 24h change, high/low and sample count from incremental updates."""
+    store = SnapshotStore(tmp_path)
+    for i, price in enumerate([1.0, 2.0, 0.5, 1.5]):
+        store.append([make_info("a", timestamp=now + i * 600, price_usd=price)])
+
+    metrics = store.metrics("a", "solana")
+    window = metrics.windows['24h']
+    assert metrics.price_usd == 1.5
+    assert window.price_change_pct == pytest.approx(50.0)
+    assert window.high == 2.0
+    assert window.low == 0.5
+    assert window.samples == 4
+    assert window.volatility > 0
+    assert store.metrics("missing", "solana") is None
+
+
+def test_metrics_survive_reopen(tmp_path, now):
+    """Test reopening the store rebuilds the same metrics from disk."""
+    store = SnapshotStore(tmp_path)
+    for i in range(10):
+        store.append([make_info("a", timestamp=now + i * 3600, price_usd=1.0 + i)])
+    before = store.metrics("a", "solana")
+
+    after = SnapshotStore(tmp_path).metrics("a", "solana")
+
+    assert after == before
+
+
+def test_reopen_from_checkpoint(tmp_path, now):
+    """Test a reopened store restores the checkpoint and replays only later records."""
+    store = SnapshotStore(tmp_path, checkpoint_every=4)
+    for i in range(10):
+        store.append([
+            make_info("a", timestamp=now + i * 3600, price_usd=1.0 + i),
+            make_info("b", timestamp=now + i * 3600, price_usd=2.0),
+        ])
+    assert store.checkpoint_offset == 20
+    store.append([make_info("a", timestamp=now + 10 * 3600, price_usd=0.5)])
+    before = store.all_metrics()
+
+    with patch.object(SnapshotStore, '_track', autospec=True, side_effect=SnapshotStore._track) as track:
+        reopened = SnapshotStore(tmp_path)
+
+    assert len(track.call_args.args[1]) == 1
+    assert reopened.all_metrics() == before
+
+    reopened.close()
+    assert SnapshotStore(tmp_path).checkpoint_offset == 21
+
+
+def test_torn_record_is_truncated(tmp_path, now):
+    """Test a partial record left by a crash does not misalign later appends."""
+    store = SnapshotStore(tmp_path)
+    store.append([make_info("a", timestamp=now, price_usd=1.0)])
+    with open(tmp_path / "snapshots.bin", 'ab') as f:
+        f.write(b'\x01' * 10)
+
+    store = SnapshotStore(tmp_path)
+    store.append([make_info("b", timestamp=now + 60, price_usd=3.0)])
+
+    records = store.read()
+    assert records['price_usd'].tolist() == [1.0, 3.0]
+    assert store.tokens[records['token'][1]] == ("b", "solana")
+
+
+def test_continuous_price_increase(now):
+    """Test up-day streaks and the CPI product of daily close ratios."""
+    tracker = TokenTracker()
+    for day, close in enumerate([2.0, 1.0, 1.5, 3.0, 6.0]):
+        tracker.update(now + day * DAY + 100, close * 0.9)
+        tracker.update(now + day * DAY + 200, close)
+
+    up_days, cpi = tracker.price_increase()
+    assert up_days == 3
+    assert cpi == pytest.approx(6.0)
+
+    tracker.update(now + 5 * DAY, 5.0)
+    assert tracker.price_increase() == (0, 1.0)
+
+
+def test_window_expires_old_buckets(now):
+    """Test snapshots older than the window drop out of it."""
+    tracker = TokenTracker()
+    tracker.update(now, 10.0)
+    tracker.update(now + 2 * DAY, 1.0)
+
+    summary = tracker.windows['24h'].summary(tracker.last_timestamp, tracker.last_price)
+    assert summary.samples == 1
+    assert summary.high == 1.0
+    assert tracker.windows['7d'].summary(tracker.last_timestamp, tracker.last_price).high == 10.0
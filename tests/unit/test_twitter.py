@@ -1,5 +1,8 @@
+import itertools
 import pytest
+import tweepy
 from datetime import datetime
+from unittest.mock import patch, Mock
 from src.twitter import TwitterResearcher
 from src.schema import TwitterUser, TwitterResponse, RecentTwitterMetrics
 
@@ -77,4 +80,105 @@ def test_twitter_response_with_metrics(user_data, tweet_data, metrics_data):
     assert response.metrics.num_recent_posts == 100
     assert response.metrics.avg_engagement == 150.5
     assert response.metrics.avg_impressions == 1000.0
-    assert response.metrics.engagement_rate == 0.15
\ No newline at end of file
+    assert response.metrics.engagement_rate == 0.15
+
+tweet_ids = itertools.count(1)
+
+
+def make_tweet(text, likes, reply_to=None):
+    tweet_id = str(next(tweet_ids))
+    data = {
+        "id": tweet_id,
+        "edit_history_tweet_ids": [tweet_id],
+        "text": text,
+        "public_metrics": {"like_count": likes, "reply_count": 1, "retweet_count": 1, "impression_count": 100},
+        "created_at": "2024-01-01T00:00:00.000Z",
+    }
+    if reply_to:
+        data["in_reply_to_user_id"] = str(reply_to)
+    return tweepy.Tweet(data)
+
+
+def make_user() -> tweepy.User:
+    return tweepy.User({
+        "id": "12345",
+        "name": "Example",
+        "username": "example",
+        "public_metrics": {"followers_count": 1000},
+        "description": "Test account",
+        "created_at": "2020-01-01T00:00:00.000Z",
+    })
+
+
+def test_get_user_info_caches_raw_response(twitter):
+    """Test the raw user JSON is cached and parsed afterwards."""
+    cached = {}
+
+    def fetch(source, endpoint, params, fetch):
+        cached[(source, endpoint)] = fetch()
+        return cached[(source, endpoint)]
+
+    twitter.cache = Mock(fetch=fetch)
+    with patch.object(twitter.client, 'get_user', return_value=Mock(data=make_user())):
+        user = twitter.get_user_info("example")
+
+    assert cached[('twitter', 'users/by/username')] == make_user().data
+    assert user.twitter_id == 12345
+    assert user.twitter_followers == 1000
+    assert user.twitter_created_at == datetime(2020, 1, 1)
+
+
+def test_get_twitter_info_fetches_timeline_once(twitter, user_data):
+    """Test top tweets and metrics are both computed from a single timeline fetch."""
+    tweets = [make_tweet("a", 5), make_tweet("b", 50), make_tweet("reply", 500, reply_to=1)]
+
+    with patch.object(twitter.client, 'get_user') as mock_user, \
+            patch.object(twitter.client, 'get_users_tweets') as mock_tweets:
+        mock_user.return_value = Mock(data=make_user())
+        mock_tweets.return_value = Mock(data=tweets, meta={})
+
+        info = twitter.get_twitter_info("example")
+
+    assert mock_tweets.call_count == 1
+    assert [t.tweet_text for t in info.recent_tweets] == ["b", "a"]
+    assert info.metrics.num_recent_posts == 3
+
+
+def test_get_timeline_pages_through_window(twitter):
+    """Test the timeline pages past max_results until the window is full."""
+    twitter.max_results = 5
+    twitter.tweet_window = 12
+    pages = [
+        Mock(data=[make_tweet(str(i), i) for i in range(5)], meta={"next_token": "p2"}),
+        Mock(data=[make_tweet(str(i), i) for i in range(5)], meta={"next_token": "p3"}),
+        Mock(data=[make_tweet(str(i), i) for i in range(5)], meta={"next_token": "p4"}),
+    ]
+
+    with patch.object(twitter.client, 'get_users_tweets', side_effect=pages) as mock_tweets:
+        tweets = twitter.get_timeline(12345)
+
+    assert len(tweets) == 15
+    assert mock_tweets.call_count == 3
+    assert mock_tweets.call_args.kwargs['pagination_token'] == "p3"
+
+
+def test_replies_do_not_shrink_recent_tweets(twitter, user_data):
+    """Test the timeline pages past the window until 5 non-replies are found."""
+    twitter.max_results = 5
+    twitter.tweet_window = 5
+    pages = [
+        Mock(data=[make_tweet(f"reply{i}", 100, reply_to=1) for i in range(3)] + [make_tweet("a", 1),
+                                                                                   make_tweet("b", 2)],
+             meta={"next_token": "p2"}),
+        Mock(data=[make_tweet("c", 3), make_tweet("reply", 100, reply_to=1), make_tweet("d", 4), make_tweet("e", 5)],
+             meta={"next_token": "p3"}),
+    ]
+
+    with patch.object(twitter.client, 'get_user', return_value=Mock(data=make_user())), \
+            patch.object(twitter.client, 'get_users_tweets', side_effect=pages) as mock_tweets:
+        info = twitter.get_twitter_info("example")
+
+    assert mock_tweets.call_count == 2
+    assert [t.tweet_text for t in info.recent_tweets] == ["e", "d", "c", "b", "a"]
+    # Metrics still cover the window only
+    assert info.metrics.num_recent_posts == 5
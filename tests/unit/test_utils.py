@@ -1,6 +1,12 @@
 from pathlib import Path
 import pytest
-from src.utils import save_report, load_multiple_reports, load_single_report, reports_to_csv
+import pandas as pd
+from datetime import datetime
+from src.utils import (
+    save_report, load_multiple_reports, load_single_report, reports_to_csv,
+    reports_to_frame, report_columns, flatten_dict, iter_reports, export_reports, load_reports
+)
+from src.report_io import find_report_files
 from src.schema import Report
 
 
@@ -30,9 +36,112 @@ def test_reports_to_csv(get_multiple_reports, tmpdir):
     reports = get_multiple_reports
     reports_to_csv(reports, str(tmpdir.join("test_reports.csv")))
 
+    df = pd.read_csv(str(tmpdir.join("test_reports.csv")))
+    assert list(df.columns) == report_columns()
+    assert df.loc[0, 'timestamp'] == '2024-12-29 00:47:44'
+
+
+def test_report_columns_match_flatten_dict(get_multiple_reports):
+    """Test the schema-derived layout covers every column flatten_dict produces."""
+    flattened = flatten_dict(get_multiple_reports[0].model_dump())
+    columns = report_columns()
+
+    assert set(flattened) <= set(columns)
+    assert [c for c in columns if c in flattened] == list(flattened)
+
+
+def test_reports_to_frame_dtypes(get_multiple_reports):
+    """Test columns keep numeric dtypes and values match model_dump()."""
+    report = get_multiple_reports[0]
+    df = reports_to_frame([report, report.model_copy(update={'twitter': None})])
+    flattened = flatten_dict(report.model_dump())
+
+    assert len(df) == 2
+    assert df['dex_price_usd'].dtype == 'float64'
+    assert df['num_holders'].dtype == 'Int64'
+    assert df['coingecko_preview_listing'].dtype == 'boolean'
+    assert pd.api.types.is_datetime64_any_dtype(df['timestamp'])
+    assert df.loc[0, 'twitter_recent_tweets'] == flattened['twitter_recent_tweets']
+    assert df.loc[0, 'dex_volume_24h'] == flattened['dex_volume_24h']
+    assert pd.isna(df.loc[1, 'twitter_user_twitter_followers'])
+
 
 def test_get_csv():
     json_paths = Path("output").glob("*.json")
     reports = load_multiple_reports(json_paths)
 
-    reports_to_csv(reports, "test_reports.csv")
\ No newline at end of file
+    reports_to_csv(reports, "test_reports.csv")
+
+
+def test_iter_reports_is_lazy(tmpdir):
+    """Test reports are loaded one at a time and bad files are skipped."""
+    bad_file = tmpdir.join("bad.json")
+    bad_file.write("{}")
+
+    reports = iter_reports([str(bad_file), TEST_FILE_PATH])
+    assert not isinstance(reports, list)
+    assert [r.dex.token_symbol for r in reports] == ["JAIL"]
+
+
+def test_export_reports_csv_matches_reports_to_csv(get_multiple_reports, tmpdir):
+    """Test streaming export writes the same CSV as reports_to_csv."""
+    reports = get_multiple_reports
+    reports_to_csv(reports, str(tmpdir.join("batch.csv")))
+    written = export_reports(iter(reports), str(tmpdir.join("stream.csv")))
+
+    assert written == len(reports)
+    assert tmpdir.join("stream.csv").read() == tmpdir.join("batch.csv").read()
+
+
+@pytest.mark.parametrize("suffix", ["csv", "jsonl"])
+def test_export_reports_append_skips_existing(get_multiple_reports, tmpdir, suffix):
+    """Test appending only adds reports not already exported."""
+    report = get_multiple_reports[0]
+    newer = report.model_copy(update={'timestamp': datetime(2025, 1, 1)})
+    output = str(tmpdir.join(f"reports.{suffix}"))
+
+    assert export_reports(iter([report]), output) == 1
+    assert export_reports(iter([report, newer]), output) == 1
+    assert export_reports(iter([report, newer]), output) == 0
+
+    if suffix == "csv":
+        assert len(pd.read_csv(output)) == 2
+    else:
+        assert len(tmpdir.join(f"reports.{suffix}").readlines()) == 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_reports(tmp_path, workers):
+    """Test reports come back in input order with per-file errors collected."""
+    source = Path(TEST_FILE_PATH).read_text()
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"report_{i}.json"
+        path.write_text(source.replace('"chain": "solana"', f'"chain": "chain{i}"', 1))
+        paths.append(path)
+    bad = tmp_path / "report_bad.json"
+    bad.write_text("{")
+    paths.insert(2, bad)
+
+    result = load_reports(paths, workers=workers, chunksize=2)
+
+    assert [r.chain for r in result.reports] == [f"chain{i}" for i in range(5)]
+    assert len(result.errors) == 1
+    assert result.errors[0].path == str(bad)
+    assert "ValidationError" in result.errors[0].error
+
+
+@pytest.mark.parametrize("indent,compression,suffix", [
+    (2, None, ".json"), (0, None, ".json"), (0, "gzip", ".json.gz"), (0, "zstd", ".json.zst"),
+])
+def test_save_report_formats(tmp_path, indent, compression, suffix):
+    """Test compact and compressed reports load back transparently."""
+    report = load_single_report(TEST_FILE_PATH)
+    path = tmp_path / f"report_solana_JAIL{suffix}"
+
+    save_report(report, str(path), index=False, indent=indent, compression=compression)
+
+    assert load_single_report(path) == report
+    assert find_report_files(tmp_path) == [path]
+    if compression or not indent:
+        assert path.stat().st_size < Path(TEST_FILE_PATH).stat().st_size
@@ -0,0 +1,66 @@
+from unittest.mock import Mock
+from src.timeseries import SnapshotStore
+from src.watch import Watcher
+from tests.conftest import make_info
+
+
+class FakeClock:
+    """Clock that only moves when sleep is called."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_watcher(tmp_path, tokens, **kwargs):
+    dex = Mock()
+    dex.research_tokens_batch.side_effect = lambda tokens: {token: make_info(*token) for token in tokens}
+    clock = FakeClock()
+    watcher = Watcher(tokens, SnapshotStore(tmp_path / "snapshots"), dex=dex, clock=clock, sleep=clock.sleep, **kwargs)
+    return watcher, dex, clock
+
+
+def test_poll_spreads_batches_over_interval(tmp_path):
+    """Test 70 tokens take 3 batch requests, started 20s apart in a 60s cycle."""
+    tokens = [(f"t{i}", "solana") for i in range(70)]
+    watcher, dex, clock = make_watcher(tmp_path, tokens, interval=60, slow_interval=3600)
+
+    infos = watcher.run_cycle()
+
+    assert len(infos) == 70
+    assert [len(call.args[0]) for call in dex.research_tokens_batch.call_args_list] == [30, 30, 10]
+    assert clock.sleeps == [20.0, 20.0]
+
+    assert len(watcher.store) == 70
+    assert watcher.store.metrics("t0", "solana").price_usd == 1.0
+
+
+def test_poll_skips_unlisted_tokens(tmp_path):
+    """Test a token DexScreener has no pair for (on its chain) gets no snapshot."""
+    watcher, dex, _ = make_watcher(tmp_path, [("a", "solana"), ("b", "base")], interval=0)
+    dex.research_tokens_batch.side_effect = lambda tokens: {("a", "solana"): make_info("a"), ("b", "base"): None}
+
+    assert list(watcher.run_cycle()) == [("a", "solana")]
+
+
+def test_slow_refresh_round_robin(tmp_path):
+    """Test full reports cover every token once per slow interval."""
+    tokens = [(f"t{i}", "solana") for i in range(5)]
+    reporter = Mock()
+    watcher, _, clock = make_watcher(tmp_path, tokens, interval=60, slow_interval=180, reporter=reporter)
+
+    watcher.run(cycles=3)
+
+    refreshed = [call.args[0] for call in reporter.generate_report.call_args_list]
+    assert refreshed == ["t0", "t1", "t2", "t3", "t4"]
+    # Full reports reuse the DexScreener data of the cycle
+    assert reporter.generate_report.call_args_list[0].args[2].token_address == "t0"
+    # Cycles start one interval apart
+    assert clock.now == 120